@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Build Cache
+Content-hashed on-disk cache for the generator outputs assembled by build_tracker.py
+"""
+
+import hashlib
+import inspect
+import json
+from pathlib import Path
+
+CACHE_DIR_NAME = ".build_cache"
+MANIFEST_NAME = "manifest.json"
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_digest(path: Path) -> str | None:
+    """Return the SHA-256 of a file's bytes, or None if it cannot be read."""
+    try:
+        return _sha256(Path(path).read_bytes())
+    except OSError:
+        return None
+
+
+def source_digest(func) -> str | None:
+    """Return the SHA-256 of the module source that defines func.
+
+    Returns None for callables without a readable source file (builtins,
+    mocks, lambdas defined in a REPL), which makes them uncacheable.
+    """
+    if not inspect.isfunction(func):
+        return None
+    try:
+        source_file = inspect.getsourcefile(func)
+    except TypeError:
+        return None
+    if not source_file:
+        return None
+    return file_digest(Path(source_file))
+
+
+class BuildCache:
+    """On-disk cache of generator outputs keyed by source and argument hashes.
+
+    The cache is an optimization only: every read or write failure degrades
+    to a cache miss (with a printed warning for writes) instead of failing
+    the build.
+    """
+
+    def __init__(self, cache_dir: Path, enabled: bool = True) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+
+    def component_key(self, name: str, func, *key_args) -> str | None:
+        """Compute the cache key for a generator call.
+
+        Args:
+            name: Component name (part of the key so generators never collide)
+            func: Generator function whose module source is hashed
+            *key_args: JSON-serializable values that determine the output
+
+        Returns:
+            Hex digest key, or None if the component cannot be cached
+        """
+        if not self.enabled:
+            return None
+        digest = source_digest(func)
+        if digest is None:
+            return None
+        try:
+            payload = json.dumps([name, digest, list(key_args)], sort_keys=True)
+        except (TypeError, ValueError):
+            return None
+        return _sha256(payload.encode("utf-8"))
+
+    def get(self, key: str | None) -> str | None:
+        """Return cached content for key, or None on a miss."""
+        if key is None:
+            return None
+        try:
+            content = (self.cache_dir / f"{key}.txt").read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return content
+
+    def put(self, key: str | None, content: str) -> None:
+        """Store content under key (no-op for uncacheable components)."""
+        if key is None:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            (self.cache_dir / f"{key}.txt").write_text(content, encoding="utf-8")
+        except OSError as e:
+            print(f"  Warning: could not write build cache entry: {e}")
+
+    def load_manifest(self) -> dict:
+        """Return the manifest of the last successful build ({} if none)."""
+        if not self.enabled:
+            return {}
+        try:
+            manifest = json.loads((self.cache_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return manifest if isinstance(manifest, dict) else {}
+
+    def save_manifest(self, manifest: dict) -> None:
+        """Persist the manifest of the build that just finished."""
+        if not self.enabled:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            (self.cache_dir / MANIFEST_NAME).write_text(
+                json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8"
+            )
+        except OSError as e:
+            print(f"  Warning: could not write build cache manifest: {e}")
+
+    def prune(self, keep: set[str]) -> None:
+        """Delete cached components that are not referenced by keep."""
+        if not self.enabled or not self.cache_dir.is_dir():
+            return
+        for entry in self.cache_dir.glob("*.txt"):
+            if entry.stem not in keep:
+                try:
+                    entry.unlink()
+                except OSError:
+                    pass
@@ -4,10 +4,14 @@ Final Integration Script
 Assembles all components into tracker.html
 """
 
+import argparse
+import hashlib
 import json
 import sys
 from pathlib import Path
 
+from build_cache import CACHE_DIR_NAME, BuildCache, file_digest, source_digest
+from data_payload import encode_problem_data
 from exceptions import (
     DataFileNotFoundError,
     FileIOError,
@@ -24,11 +28,21 @@ from js_awareness_generator import generate_js_awareness
 from js_config_sync_generator import generate_js_config_sync
 from js_conflict_dialog_generator import generate_js_conflict_dialog
 from js_core_generator import generate_js_core
+from js_data_generator import generate_js_data
+from js_filter_generator import generate_js_filter
 from js_firebase_generator import generate_js_firebase
 from js_import_export_generator import generate_js_import_export
+from js_progress_generator import generate_js_progress
+from js_render_generator import generate_js_render
+from js_review_generator import generate_js_review
+from js_scoring_generator import generate_js_scoring
+from js_search_generator import generate_js_search
 from js_settings_generator import generate_js_settings
 from js_shared_generator import generate_js_shared
+from js_storage_generator import generate_js_storage
 from js_sync_generator import generate_js_sync
+from js_timers_generator import generate_js_timers
+from js_virtual_table_generator import generate_js_virtual_table
 
 
 def load_parsed_data() -> dict:
@@ -203,17 +217,35 @@ def write_output(content: str, output_path: Path) -> None:
         ) from e
 
 
-def build_tracker() -> str:
+def build_tracker(
+    use_cache: bool = True,
+    parsed_data: dict | None = None,
+    data_digest: str | None = None,
+) -> str:
     """Build the complete tracker.html file.
 
+    Each component is keyed on the hash of its generator module source and
+    its arguments. Unchanged components are read from the on-disk build cache,
+    and when nothing changed at all tracker.html is left untouched.
+
+    Args:
+        use_cache: If False, regenerate every component and always write output
+        parsed_data: Already-parsed data to build from instead of loading
+            parsed_data.json (used by watch mode)
+        data_digest: Content hash identifying parsed_data, used as its cache key
+
     Returns:
         Path to the generated tracker.html file
 
     Raises:
         GrindPulseError: If any step of the build process fails
     """
+    base_dir = Path(__file__).parent
+
     # Load parsed data with error handling
-    parsed_data = load_parsed_data()
+    if parsed_data is None:
+        parsed_data = load_parsed_data()
+        data_digest = file_digest(base_dir / "parsed_data.json")
 
     # Load Firebase config (optional)
     firebase_config = load_firebase_config()
@@ -223,79 +255,152 @@ def build_tracker() -> str:
     print(f"  Total problems: {sum(len(parsed_data['data'][f]) for f in parsed_data['file_list'])}")
     print(f"  Duplicates: {len(parsed_data['duplicate_map'])}")
 
-    # Generate components with error handling
-    print("\nGenerating components...")
     firebase_enabled = firebase_config is not None
+    cache = BuildCache(base_dir / CACHE_DIR_NAME, enabled=use_cache)
+    output_path = base_dir / "tracker.html"
+
+    # Key on the data file hash instead of re-serializing the parsed dictionary,
+    # plus the payload encoder, which lives outside the generator module
+    data_key_args = (data_digest or parsed_data, source_digest(encode_problem_data))
+
+    # (name, generator, call args, key args) - order matches assembly below
+    components = [
+        (
+            "html_generator",
+            generate_html_structure,
+            (parsed_data["file_list"], firebase_enabled),
+            None,
+        ),
+        ("css_generator", generate_css, (), None),
+        ("js_data_generator", generate_js_data, (parsed_data,), data_key_args),
+        ("js_shared_generator", generate_js_shared, (), None),
+        ("js_timers_generator", generate_js_timers, (), None),
+        ("js_storage_generator", generate_js_storage, (), None),
+        ("js_progress_generator", generate_js_progress, (), None),
+        ("js_awareness_generator", generate_js_awareness, (), None),
+        ("js_scoring_generator", generate_js_scoring, (), None),
+        ("js_virtual_table_generator", generate_js_virtual_table, (), None),
+        ("js_render_generator", generate_js_render, (), None),
+        ("js_search_generator", generate_js_search, (), None),
+        ("js_review_generator", generate_js_review, (), None),
+        ("js_filter_generator", generate_js_filter, (), None),
+        ("js_settings_generator", generate_js_settings, (), None),
+        ("js_config_sync_generator", generate_js_config_sync, (), None),
+        ("js_import_export_generator", generate_js_import_export, (), None),
+        ("js_conflict_dialog_generator", generate_js_conflict_dialog, (), None),
+        ("js_firebase_generator", generate_js_firebase, (firebase_config,), None),
+        ("js_core_generator", generate_js_core, (), None),
+        ("js_sync_generator", generate_js_sync, (), None),
+    ]
+    keys = [
+        cache.component_key(name, func, *(args if key_args is None else key_args))
+        for name, func, args, key_args in components
+    ]
+
+    # Skip the whole build when every component and the previous output are unchanged
+    # The assembly below (placeholder replacement, join) lives in this module,
+    # so its source is part of the key as well
+    build_key = None
+    assembly_digest = source_digest(build_tracker)
+    if all(keys) and assembly_digest:
+        build_key = hashlib.sha256("".join([assembly_digest, *keys]).encode("utf-8")).hexdigest()
+        manifest = cache.load_manifest()
+        if (
+            manifest.get("build_key") == build_key
+            and manifest.get("output_digest") is not None
+            and manifest.get("output_digest") == file_digest(output_path)
+        ):
+            print(f"\ntracker.html is up to date (no changes): {output_path}")
+            return str(output_path)
 
-    html_structure = run_generator(
-        "html_generator", generate_html_structure, parsed_data["file_list"], firebase_enabled
-    )
-    css = run_generator("css_generator", generate_css)
-    js_awareness = run_generator("js_awareness_generator", generate_js_awareness)
-    js_settings = run_generator("js_settings_generator", generate_js_settings)
-    js_config_sync = run_generator("js_config_sync_generator", generate_js_config_sync)
-    js_import_export = run_generator("js_import_export_generator", generate_js_import_export)
-    js_conflict_dialog = run_generator("js_conflict_dialog_generator", generate_js_conflict_dialog)
-    js_shared = run_generator("js_shared_generator", generate_js_shared)
-    js_firebase = run_generator("js_firebase_generator", generate_js_firebase, firebase_config)
-    js_core = run_generator("js_core_generator", generate_js_core)
-    js_sync = run_generator("js_sync_generator", generate_js_sync)
-
-    # Embed data as JavaScript
-    data_js = f"""
-const PROBLEM_DATA = {json.dumps(parsed_data, indent=2)};
-const DUPLICATE_MAP = PROBLEM_DATA.duplicate_map;
-    """
-
-    # Combine all JavaScript (order matters: data -> shared -> awareness -> settings -> config_sync -> import_export -> conflict_dialog -> firebase -> core -> sync)
-    full_js = (
-        data_js
-        + "\n"
-        + js_shared
-        + "\n"
-        + js_awareness
-        + "\n"
-        + js_settings
-        + "\n"
-        + js_config_sync
-        + "\n"
-        + js_import_export
-        + "\n"
-        + js_conflict_dialog
-        + "\n"
-        + js_firebase
-        + "\n"
-        + js_core
-        + "\n"
-        + js_sync
-    )
+    # Generate components with error handling
+    print("\nGenerating components...")
+    outputs = {}
+    for (name, func, args, _), key in zip(components, keys, strict=True):
+        content = cache.get(key)
+        if content is None:
+            content = run_generator(name, func, *args)
+            cache.put(key, content)
+        outputs[name] = content
+    if cache.enabled:
+        print(f"  Build cache: {cache.hits} reused, {len(components) - cache.hits} regenerated")
+
+    # Combine all JavaScript (order matters: data -> shared -> timers -> storage -> progress -> awareness -> scoring -> virtual_table -> render -> search -> review -> filter -> settings -> config_sync -> import_export -> conflict_dialog -> firebase -> core -> sync)
+    full_js = "\n".join(outputs[name] for name, _, _, _ in components[2:])
 
     # Replace placeholders
     # NOTE: DATA_PLACEHOLDER is replaced with empty string because data is now
-    # embedded directly in full_js as the data_js component. The placeholder
+    # embedded directly in full_js by js_data_generator. The placeholder
     # remains in html_generator.py for backward compatibility and clarity.
-    final_html = html_structure.replace("{CSS_PLACEHOLDER}", css)
+    final_html = outputs["html_generator"].replace("{CSS_PLACEHOLDER}", outputs["css_generator"])
     final_html = final_html.replace("{DATA_PLACEHOLDER}", "")
     final_html = final_html.replace("{JS_PLACEHOLDER}", full_js)
 
-    # Write final file
-    output_path = Path(__file__).parent / "tracker.html"
-    write_output(final_html, output_path)
+    # Write final file (skipped when the assembled output is byte-identical)
+    output_digest = hashlib.sha256(final_html.encode("utf-8")).hexdigest()
+    if cache.enabled and output_digest == file_digest(output_path):
+        print(f"\ntracker.html is up to date (no changes): {output_path}")
+    else:
+        write_output(final_html, output_path)
+        print(f"\nSuccessfully created: {output_path}")
+        print(f"  File size: {output_path.stat().st_size / 1024:.2f} KB")
 
-    print(f"\nSuccessfully created: {output_path}")
-    print(f"  File size: {output_path.stat().st_size / 1024:.2f} KB")
+    if build_key is not None:
+        cache.save_manifest({"build_key": build_key, "output_digest": output_digest})
+        cache.prune(set(keys))
 
     return str(output_path)
 
 
-def main() -> int:
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command-line arguments.
+
+    Args:
+        argv: Argument list (defaults to no arguments)
+
+    Returns:
+        Parsed arguments namespace
+    """
+    parser = argparse.ArgumentParser(description="Assemble tracker.html from parsed_data.json")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Regenerate every component and rewrite tracker.html",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Re-parse raw/*.tsv and rebuild whenever a TSV file or generator changes",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=0.25,
+        help="Seconds between polls in --watch mode (default: 0.25)",
+    )
+    args = parser.parse_args(argv if argv is not None else [])
+    if args.interval <= 0:
+        parser.error("--interval must be > 0")
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
     """Main entry point with exit code handling.
 
+    Args:
+        argv: Command-line arguments (without the program name)
+
     Returns:
         Exit code: 0 for success, 1 for error, 130 for interrupt
     """
     try:
-        build_tracker()
+        args = parse_args(argv)
+        if args.watch:
+            from watcher import watch
+
+            watch(Path(__file__).parent, interval=args.interval, use_cache=not args.no_cache)
+            return 0
+        build_tracker(use_cache=not args.no_cache)
         return 0
     except GrindPulseError as e:
         print(f"\nError: {e}", file=sys.stderr)
@@ -309,4 +414,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(main(sys.argv[1:]))
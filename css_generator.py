@@ -293,6 +293,140 @@ def generate_css():
       box-shadow: 0 4px 12px rgba(16, 185, 129, 0.3);
     }
 
+    /* Global Search */
+    .global-search-section {
+      padding: 15px 20px 0 20px;
+      background: #f5f5f5;
+    }
+
+    .global-search-box {
+      width: 100%;
+    }
+
+    .global-search-results {
+      margin-top: 10px;
+      max-height: 360px;
+      overflow-y: auto;
+      background: white;
+      border: 2px solid #e0e0e0;
+      border-radius: 6px;
+    }
+
+    .global-search-summary {
+      padding: 8px 16px;
+      font-size: 0.85rem;
+      color: #666;
+      border-bottom: 1px solid #e0e0e0;
+    }
+
+    .global-search-list {
+      list-style: none;
+      margin: 0;
+      padding: 0;
+    }
+
+    .global-search-item {
+      display: flex;
+      align-items: center;
+      gap: 12px;
+      flex-wrap: wrap;
+      padding: 8px 16px;
+      border-bottom: 1px solid #f0f0f0;
+    }
+
+    .global-search-item:last-child {
+      border-bottom: none;
+    }
+
+    .global-search-name {
+      flex: 1;
+      min-width: 200px;
+      font-weight: 600;
+      color: #333;
+    }
+
+    .global-search-item.solved .global-search-name::after {
+      content: " \\2713";
+      color: #10b981;
+    }
+
+    .global-search-tags {
+      display: flex;
+      gap: 6px;
+      flex-wrap: wrap;
+    }
+
+    .global-search-tag {
+      padding: 4px 10px;
+      border: none;
+      border-radius: 12px;
+      background: #eef0fd;
+      color: #4c5fd5;
+      font-size: 0.8rem;
+      font-weight: 600;
+      cursor: pointer;
+    }
+
+    .global-search-tag:hover,
+    .global-search-tag:focus-visible {
+      background: #667eea;
+      color: white;
+    }
+
+    /* Review Queue */
+    .review-due {
+      font-size: 0.85rem;
+      color: #666;
+      white-space: nowrap;
+    }
+
+    .review-due-now {
+      color: #dc2626;
+      font-weight: 600;
+    }
+
+    .review-forecast {
+      display: flex;
+      align-items: flex-end;
+      gap: 4px;
+      list-style: none;
+      margin: 0;
+      padding: 10px 16px;
+      border-bottom: 1px solid #e0e0e0;
+    }
+
+    .review-forecast-day {
+      flex: 1;
+      display: flex;
+      flex-direction: column;
+      align-items: center;
+      justify-content: flex-end;
+      height: 90px;
+      font-size: 0.75rem;
+      color: #666;
+    }
+
+    .review-forecast-bar {
+      width: 100%;
+      max-width: 24px;
+      min-height: 2px;
+      background: #667eea;
+      border-radius: 3px 3px 0 0;
+    }
+
+    .review-forecast-now .review-forecast-bar {
+      background: #dc2626;
+    }
+
+    .review-forecast-count {
+      font-weight: 600;
+      color: #333;
+    }
+
+    .review-forecast-label {
+      margin-top: 2px;
+    }
+
     /* Global Import/Export Section */
     .import-export-section {
       padding: 15px 20px;
@@ -804,6 +938,16 @@ def generate_css():
       background: #f9f9f9;
     }
 
+    /* Stand-ins for rows outside the virtualized window */
+    .virtual-spacer td {
+      padding: 0;
+      border: 0;
+    }
+
+    tbody tr.virtual-spacer:hover {
+      background: transparent;
+    }
+
     .difficulty-badge {
       display: inline-block;
       padding: 6px 12px;
@@ -1049,6 +1193,15 @@ def generate_css():
       transform: rotate(180deg);
     }
 
+    .review-queue-btn:active {
+      transform: none;
+    }
+
+    .review-queue-btn[aria-pressed="true"] {
+      background: rgba(255, 255, 255, 0.4);
+      border-color: white;
+    }
+
     /* Settings overlay */
     .settings-overlay {
       position: fixed;
@@ -4,12 +4,17 @@ Data Parser Sub-Agent
 Reads and parses all TSV files dynamically from GrindPulse/raw/
 """
 
+import argparse
 import csv
 import json
+import os
+import re
 import sys
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+from build_cache import file_digest, source_digest
 from exceptions import (
     DataFileEmptyError,
     DataFileNotFoundError,
@@ -19,23 +24,253 @@ from exceptions import (
     ValidationError,
 )
 
+MANIFEST_SUFFIX = ".manifest.json"
+MANIFEST_VERSION = 1
 
-def parse_tsv_files(raw_folder):
-    """Parse all TSV files in the raw folder.
+
+def iter_tsv_problems(tsv_file):
+    """Stream validated problems from a TSV file, one row at a time.
+
+    Rows are read straight from the file handle, so memory use does not grow
+    with file size. Line numbers in errors are the physical line on which the
+    offending record starts (quoted fields may span several lines).
 
     Args:
-        raw_folder: Path to the folder containing TSV files
+        tsv_file: Path to the TSV file
+
+    Yields:
+        Problem dicts in file order
+
+    Raises:
+        DataFileEmptyError: If the file is empty
+        FileIOError: If file cannot be read (permissions, etc.)
+        TSVParseError: If TSV content is malformed
+    """
+    tsv_file = Path(tsv_file)
+
+    # File read with error handling
+    try:
+        with open(tsv_file, encoding="utf-8", newline="") as f:
+            yield from _iter_rows(csv.reader(f, delimiter="\t"), tsv_file)
+    except PermissionError as err:
+        raise FileIOError(
+            "Permission denied reading TSV file",
+            file_path=str(tsv_file),
+            suggestion="Check file permissions and ensure file is not locked",
+        ) from err
+    except UnicodeDecodeError as e:
+        raise TSVParseError(
+            f"File encoding error: {e}",
+            file_path=str(tsv_file),
+            suggestion="Ensure file is saved with UTF-8 encoding",
+        ) from e
+    except csv.Error as e:
+        raise TSVParseError(
+            f"CSV parsing error: {e}",
+            file_path=str(tsv_file),
+            suggestion="Check for malformed tab-separated values",
+        ) from e
+
+
+def _iter_rows(reader, tsv_file):
+    """Validate rows from a csv reader and yield problem dicts."""
+    row_count = 0
+    has_content = False
+    last_line = 0
+
+    for row in reader:
+        line_number = last_line + 1  # 1-indexed first line of this record
+        last_line = reader.line_num
+        row_count += 1
+
+        # Skip completely empty rows silently
+        if not row or all(cell.strip() == "" for cell in row):
+            continue
+        has_content = True
+
+        if row_count == 1:  # Skip header
+            continue
+
+        # Validate minimum columns
+        if len(row) < 6:
+            raise TSVParseError(
+                f"Row has {len(row)} columns, expected at least 6",
+                file_path=str(tsv_file),
+                line_number=line_number,
+                suggestion="Ensure row has: Name, Difficulty, IntermediateTime, AdvancedTime, TopTime, Pattern",
+            )
+
+        # Validate required fields are not empty
+        if not row[0].strip():
+            raise TSVParseError(
+                "Problem name is empty",
+                file_path=str(tsv_file),
+                line_number=line_number,
+                suggestion="Add a problem name in the first column",
+            )
+
+        yield {
+            "name": row[0].strip(),
+            "difficulty": row[1].strip() or "Unknown",
+            "intermediate_time": row[2].strip() or "0",
+            "advanced_time": row[3].strip() or "0",
+            "top_time": row[4].strip() or "0",
+            "pattern": row[5].strip() or "Unknown",
+            "link": row[6].strip() if len(row) > 6 else "",
+            # These columns will be added by the tracker
+            "solved": False,
+            "time_to_solve": "",
+            "comments": "",
+            "solved_date": "",
+        }
+
+    # Validate file is not empty
+    if not has_content:
+        raise DataFileEmptyError(
+            "TSV file is empty",
+            file_path=str(tsv_file),
+            suggestion="Add header row and problem data to the file",
+        )
+
+    # Validate header row exists and at least one data row
+    if row_count < 2:
+        raise TSVParseError(
+            "TSV file must have header row and at least one data row",
+            file_path=str(tsv_file),
+            suggestion="Add header: Problem Name, Difficulty, Intermediate Max time, ...",
+        )
+
+
+def parse_tsv_file(tsv_file):
+    """Parse and validate a single TSV file.
+
+    Module-level (and free of shared state) so it can run in a worker process.
+
+    Args:
+        tsv_file: Path to the TSV file
 
     Returns:
-        dict with keys: data, duplicate_map, file_list
+        List of problem dicts in file order
 
     Raises:
-        DataFileNotFoundError: If raw folder doesn't exist
-        DataFileEmptyError: If no TSV files found or file is empty
+        DataFileEmptyError: If the file is empty
         FileIOError: If file cannot be read (permissions, etc.)
         TSVParseError: If TSV content is malformed
+    """
+    return list(iter_tsv_problems(tsv_file))
+
+
+def problem_slug(name):
+    """Return the URL-style slug of a problem name ("Two Sum" -> "two-sum")."""
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-") or "problem"
+
+
+def assign_problem_ids(file_results):
+    """Give every problem the canonical ID shared by all lists that contain it.
+
+    IDs are slugs of the problem name. Distinct names whose slugs collide are
+    ordered by name: the first keeps the slug and the rest get a numeric
+    suffix. IDs key the saved progress, so they depend only on the set of
+    names, never on the order the lists were read in.
+
+    Args:
+        file_results: List of (file_key, problems) tuples, updated in place
+    """
+    names = sorted({problem["name"] for _, problems in file_results for problem in problems})
+    first_by_slug = {}
+    for name in names:
+        first_by_slug.setdefault(problem_slug(name), name)
+    ids_by_name = {name: slug for slug, name in first_by_slug.items()}
+    used_ids = set(ids_by_name.values())
+    for name in names:
+        if name in ids_by_name:
+            continue
+        base = problem_slug(name)
+        suffix = 2
+        while f"{base}-{suffix}" in used_ids:
+            suffix += 1
+        ids_by_name[name] = f"{base}-{suffix}"
+        used_ids.add(ids_by_name[name])
+    for _, problems in file_results:
+        for problem in problems:
+            problem["id"] = ids_by_name[problem["name"]]
+
+
+def merge_parsed_files(file_results):
+    """Merge per-file parse results into the parsed data structure.
+
+    Every problem is given its canonical ID (see assign_problem_ids).
+
+    Args:
+        file_results: Ordered list of (file_key, problems) tuples
+
+    Returns:
+        dict with keys: data, duplicate_map, file_list
+
+    Raises:
         ValidationError: If no problems parsed from any file
     """
+    assign_problem_ids(file_results)
+
+    all_data = {}
+    all_problems = defaultdict(list)  # For duplicate detection
+
+    for file_key, problems in file_results:
+        all_data[file_key] = problems
+        for problem in problems:
+            all_problems[problem["name"]].append(file_key)
+
+    # Final validation
+    total_problems = sum(len(probs) for probs in all_data.values())
+    if total_problems == 0:
+        raise ValidationError(
+            "No problems parsed from any TSV file",
+            suggestion="Check that TSV files contain data rows after the header",
+        )
+
+    # Build duplicate mapping (only include problems that appear in multiple files)
+    duplicate_map = {name: files for name, files in all_problems.items() if len(files) > 1}
+
+    return {
+        "data": all_data,
+        "duplicate_map": duplicate_map,
+        "file_list": [file_key for file_key, _ in file_results],
+    }
+
+
+def resolve_worker_count(workers):
+    """Resolve the requested worker count.
+
+    Args:
+        workers: 1 for serial parsing, N > 1 for N worker processes,
+            0 to use one worker per CPU
+
+    Returns:
+        Positive worker count
+
+    Raises:
+        ValueError: If workers is negative
+    """
+    if workers < 0:
+        raise ValueError(f"workers must be >= 0, got {workers}")
+    if workers == 0:
+        return os.cpu_count() or 1
+    return workers
+
+
+def find_tsv_files(raw_folder):
+    """List the TSV files in the raw folder.
+
+    Args:
+        raw_folder: Path to the folder containing TSV files
+
+    Returns:
+        List of TSV file paths, sorted by name
+
+    Raises:
+        DataFileNotFoundError: If raw folder doesn't exist
+        DataFileEmptyError: If no TSV files found
+    """
     raw_path = Path(raw_folder)
 
     # Validate raw folder exists
@@ -47,7 +282,7 @@ def parse_tsv_files(raw_folder):
         )
 
     # Find all TSV files
-    tsv_files = list(raw_path.glob("*.tsv"))
+    tsv_files = sorted(raw_path.glob("*.tsv"))
 
     # Validate at least one TSV file exists
     if not tsv_files:
@@ -57,136 +292,266 @@ def parse_tsv_files(raw_folder):
             suggestion="Add at least one .tsv file (e.g., blind75.tsv) to the raw/ directory",
         )
 
-    all_data = {}
-    all_problems = defaultdict(list)  # For duplicate detection
+    return tsv_files
 
-    for tsv_file in tsv_files:
-        file_key = tsv_file.stem  # e.g., "blind75"
-        problems = []
-
-        # File read with error handling
-        try:
-            with open(tsv_file, encoding="utf-8") as f:
-                content = f.read()
-        except PermissionError as err:
-            raise FileIOError(
-                "Permission denied reading TSV file",
-                file_path=str(tsv_file),
-                suggestion="Check file permissions and ensure file is not locked",
-            ) from err
-        except UnicodeDecodeError as e:
-            raise TSVParseError(
-                f"File encoding error: {e}",
-                file_path=str(tsv_file),
-                suggestion="Ensure file is saved with UTF-8 encoding",
-            ) from e
 
-        # Validate file is not empty
-        if not content.strip():
-            raise DataFileEmptyError(
-                "TSV file is empty",
-                file_path=str(tsv_file),
-                suggestion="Add header row and problem data to the file",
-            )
+def parse_files(tsv_files, workers=1):
+    """Parse TSV files serially or on a process pool.
 
-        # Parse TSV content
-        try:
-            reader = csv.reader(content.splitlines(), delimiter="\t")
-            rows = list(reader)
-        except csv.Error as e:
-            raise TSVParseError(
-                f"CSV parsing error: {e}",
-                file_path=str(tsv_file),
-                suggestion="Check for malformed tab-separated values",
-            ) from e
+    Args:
+        tsv_files: List of TSV file paths
+        workers: Number of worker processes (1 = serial, 0 = one per CPU)
 
-        # Validate header row exists and at least one data row
-        if len(rows) < 2:
-            raise TSVParseError(
-                "TSV file must have header row and at least one data row",
-                file_path=str(tsv_file),
-                suggestion="Add header: Problem Name, Difficulty, Intermediate Max time, ...",
-            )
+    Returns:
+        List of problem lists, in the same order as tsv_files
+    """
+    workers = min(resolve_worker_count(workers), len(tsv_files))
+    if workers > 1:
+        # executor.map yields in submission order, so merging stays deterministic
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(parse_tsv_file, tsv_files))
+    return [parse_tsv_file(tsv_file) for tsv_file in tsv_files]
 
-        # Parse data rows with validation
-        for idx, row in enumerate(rows):
-            if idx == 0:  # Skip header
-                continue
 
-            line_number = idx + 1  # 1-indexed for user display
+def parse_tsv_files(raw_folder, workers=1):
+    """Parse all TSV files in the raw folder.
 
-            # Skip completely empty rows silently
-            if not row or all(cell.strip() == "" for cell in row):
-                continue
+    With more than one worker, files are parsed on a process pool and the
+    results are merged in file order, so the output is identical to the
+    serial path (including which error is raised first).
 
-            # Validate minimum columns
-            if len(row) < 6:
-                raise TSVParseError(
-                    f"Row has {len(row)} columns, expected at least 6",
-                    file_path=str(tsv_file),
-                    line_number=line_number,
-                    suggestion="Ensure row has: Name, Difficulty, IntermediateTime, AdvancedTime, TopTime, Pattern",
-                )
-
-            # Validate required fields are not empty
-            if not row[0].strip():
-                raise TSVParseError(
-                    "Problem name is empty",
-                    file_path=str(tsv_file),
-                    line_number=line_number,
-                    suggestion="Add a problem name in the first column",
-                )
-
-            problem = {
-                "name": row[0].strip(),
-                "difficulty": row[1].strip() or "Unknown",
-                "intermediate_time": row[2].strip() or "0",
-                "advanced_time": row[3].strip() or "0",
-                "top_time": row[4].strip() or "0",
-                "pattern": row[5].strip() or "Unknown",
-                "link": row[6].strip() if len(row) > 6 else "",
-                # These columns will be added by the tracker
-                "solved": False,
-                "time_to_solve": "",
-                "comments": "",
-                "solved_date": "",
-            }
-
-            problems.append(problem)
-
-            # Track for duplicate detection
-            all_problems[problem["name"]].append(file_key)
+    Args:
+        raw_folder: Path to the folder containing TSV files
+        workers: Number of worker processes (1 = serial, 0 = one per CPU)
 
-        all_data[file_key] = problems
+    Returns:
+        dict with keys: data, duplicate_map, file_list
 
-    # Final validation
-    total_problems = sum(len(probs) for probs in all_data.values())
-    if total_problems == 0:
-        raise ValidationError(
-            "No problems parsed from any TSV file",
-            suggestion="Check that TSV files contain data rows after the header",
-        )
+    Raises:
+        DataFileNotFoundError: If raw folder doesn't exist
+        DataFileEmptyError: If no TSV files found or file is empty
+        FileIOError: If file cannot be read (permissions, etc.)
+        TSVParseError: If TSV content is malformed
+        ValidationError: If no problems parsed from any file
+    """
+    tsv_files = find_tsv_files(raw_folder)
+    file_problems = parse_files(tsv_files, workers)
+
+    return merge_parsed_files(
+        [
+            (tsv_file.stem, problems)
+            for tsv_file, problems in zip(tsv_files, file_problems, strict=True)
+        ]
+    )
 
-    # Build duplicate mapping (only include problems that appear in multiple files)
-    duplicate_map = {name: files for name, files in all_problems.items() if len(files) > 1}
 
+def manifest_path_for(output_path):
+    """Return the manifest path stored next to a parsed data file."""
+    output_path = Path(output_path)
+    return output_path.with_name(f"{output_path.stem}{MANIFEST_SUFFIX}")
+
+
+def _fingerprint(tsv_file, stat_result, digest=None):
     return {
-        "data": all_data,
-        "duplicate_map": duplicate_map,
-        "file_list": [f.stem for f in tsv_files],
+        "size": stat_result.st_size,
+        "mtime_ns": stat_result.st_mtime_ns,
+        "sha256": digest or file_digest(tsv_file),
     }
 
 
-def main() -> int:
+def parse_tsv_files_incremental(raw_folder, previous=None, manifest=None, workers=1):
+    """Re-parse only the TSV files that changed since the previous run.
+
+    A file is reused without being read when its size and mtime match the
+    manifest, and reused after hashing when only its mtime changed. Changed
+    and added files are parsed (on a pool if workers > 1), removed files are
+    dropped, and duplicate_map is re-derived from the in-memory lists. The
+    result is identical to a full parse_tsv_files() run.
+
+    Args:
+        raw_folder: Path to the folder containing TSV files
+        previous: Parsed data from the previous run, or None
+        manifest: Manifest from the previous run, or None
+        workers: Number of worker processes for changed files
+
+    Returns:
+        Tuple of (parsed data, new manifest, changes) where changes maps
+        "parsed", "reused" and "removed" to lists of file keys
+
+    Raises:
+        Same errors as parse_tsv_files()
+    """
+    tsv_files = find_tsv_files(raw_folder)
+
+    # Any change to this module's parsing rules invalidates every cached file
+    parser_digest = source_digest(_iter_rows)
+    usable = (
+        isinstance(previous, dict)
+        and isinstance(previous.get("data"), dict)
+        and isinstance(manifest, dict)
+        and manifest.get("version") == MANIFEST_VERSION
+        and manifest.get("parser_sha256") == parser_digest
+    )
+    old_files = manifest.get("files", {}) if usable else {}
+    old_data = previous["data"] if usable else {}
+
+    fingerprints = {}
+    to_parse = []
+    for tsv_file in tsv_files:
+        file_key = tsv_file.stem
+        stat_result = tsv_file.stat()
+        old = old_files.get(file_key)
+        if old is not None and file_key in old_data:
+            if (
+                old.get("size") == stat_result.st_size
+                and old.get("mtime_ns") == stat_result.st_mtime_ns
+            ):
+                fingerprints[file_key] = old
+                continue
+            digest = file_digest(tsv_file)
+            if digest == old.get("sha256"):
+                fingerprints[file_key] = _fingerprint(tsv_file, stat_result, digest)
+                continue
+        fingerprints[file_key] = _fingerprint(tsv_file, stat_result)
+        to_parse.append(tsv_file)
+
+    parsed = dict(zip((f.stem for f in to_parse), parse_files(to_parse, workers), strict=True))
+
+    result = merge_parsed_files(
+        [(f.stem, parsed[f.stem] if f.stem in parsed else old_data[f.stem]) for f in tsv_files]
+    )
+    new_manifest = {
+        "version": MANIFEST_VERSION,
+        "parser_sha256": parser_digest,
+        "files": fingerprints,
+    }
+    changes = {
+        "parsed": list(parsed),
+        "reused": [f.stem for f in tsv_files if f.stem not in parsed],
+        "removed": [key for key in old_data if key not in fingerprints],
+    }
+    return result, new_manifest, changes
+
+
+def load_previous_output(output_path):
+    """Load parsed data and its manifest from a previous run.
+
+    Anything missing, unreadable or out of sync with the manifest yields
+    (None, None), which makes the next run a full parse.
+
+    Args:
+        output_path: Path of the parsed data JSON file
+
+    Returns:
+        Tuple of (parsed data, manifest), or (None, None)
+    """
+    output_path = Path(output_path)
+    try:
+        manifest = json.loads(manifest_path_for(output_path).read_text(encoding="utf-8"))
+        content = output_path.read_bytes()
+        previous = json.loads(content)
+    except (OSError, ValueError):
+        return None, None
+    if not isinstance(manifest, dict) or manifest.get("output_sha256") != file_digest(output_path):
+        return None, None
+    return previous, manifest
+
+
+def write_parsed_output(result, manifest, output_path):
+    """Write parsed data and its manifest next to each other.
+
+    Args:
+        result: Parsed data dictionary
+        manifest: Manifest describing the parsed TSV files
+        output_path: Path of the parsed data JSON file
+
+    Returns:
+        The manifest as written, including the output file's SHA-256
+
+    Raises:
+        FileIOError: If either file cannot be written
+    """
+    output_path = Path(output_path)
+    manifest_path = manifest_path_for(output_path)
+    try:
+        _write_atomic(output_path, json.dumps(result, indent=2) + "\n")
+        manifest = dict(manifest, output_sha256=file_digest(output_path))
+        _write_atomic(manifest_path, json.dumps(manifest, indent=2, sort_keys=True) + "\n")
+    except OSError as e:
+        raise FileIOError(
+            f"Failed to write parsed data: {e}",
+            file_path=str(output_path),
+            suggestion="Check disk space and directory permissions",
+        ) from e
+    return manifest
+
+
+def _write_atomic(path, content):
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    tmp_path.write_text(content, encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def parse_args(argv=None):
+    """Parse command-line arguments.
+
+    Args:
+        argv: Argument list (defaults to no arguments)
+
+    Returns:
+        Parsed arguments namespace
+    """
+    parser = argparse.ArgumentParser(description="Parse raw/*.tsv into parsed data JSON")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for parsing (1 = serial, 0 = one per CPU)",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        help="Write JSON to this file (with a manifest next to it) instead of stdout; "
+        "re-runs only re-parse TSV files that changed",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="With --output, ignore the manifest and re-parse every file",
+    )
+    args = parser.parse_args(argv if argv is not None else [])
+    if args.workers < 0:
+        parser.error("--workers must be >= 0")
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
     """Main entry point with exit code handling.
 
+    Args:
+        argv: Command-line arguments (without the program name)
+
     Returns:
         Exit code: 0 for success, 1 for error, 130 for interrupt
     """
     try:
+        args = parse_args(argv)
         raw_folder = Path(__file__).parent / "raw"
-        result = parse_tsv_files(raw_folder)
-        print(json.dumps(result, indent=2))
+        if args.output is None:
+            result = parse_tsv_files(raw_folder, workers=args.workers)
+            print(json.dumps(result, indent=2))
+            return 0
+
+        previous, manifest = (None, None) if args.full else load_previous_output(args.output)
+        result, manifest, changes = parse_tsv_files_incremental(
+            raw_folder, previous, manifest, workers=args.workers
+        )
+        write_parsed_output(result, manifest, args.output)
+        print(
+            f"Wrote {args.output}: parsed {len(changes['parsed'])}, "
+            f"reused {len(changes['reused'])}, removed {len(changes['removed'])} file(s)"
+        )
         return 0
     except GrindPulseError as e:
         print(f"\nError: {e}", file=sys.stderr)
@@ -200,4 +565,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(main(sys.argv[1:]))
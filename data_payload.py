@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Problem Data Payload
+Compact columnar encoding of parsed data for embedding in tracker.html
+"""
+
+import json
+
+PAYLOAD_VERSION = 1
+
+# Columns stored as indexes into the shared string table (few distinct values)
+INTERNED_FIELDS = ("difficulty", "intermediate_time", "advanced_time", "top_time", "pattern")
+
+# Static problem fields in record order, with the values data_parser emits when a cell is blank
+STATIC_FIELDS = {
+    "name": "",
+    "difficulty": "Unknown",
+    "intermediate_time": "0",
+    "advanced_time": "0",
+    "top_time": "0",
+    "pattern": "Unknown",
+    "link": "",
+}
+
+# Canonical problem ID assigned by data_parser; stored as its own column
+ID_FIELD = "id"
+
+# Per-list tracking fields the tracker fills in; only non-default values are encoded
+USER_FIELDS = {
+    "solved": False,
+    "time_to_solve": "",
+    "comments": "",
+    "solved_date": "",
+}
+
+
+def encode_problem_data(parsed_data: dict) -> dict:
+    """Encode parsed data as a compact columnar payload.
+
+    Problems that are identical across lists are stored once as canonical
+    records, and each list holds only their indexes. Records keep the
+    canonical problem ID, which the browser uses to share one user-state
+    record between every list containing the problem. Low-cardinality columns
+    are stored as indexes into a shared string table. The duplicate map is
+    not stored at all because it can be derived from the lists.
+
+    Args:
+        parsed_data: Parsed data dictionary with keys: data, duplicate_map, file_list
+
+    Returns:
+        Payload dictionary with keys: version, file_list, strings, problems,
+        lists and state
+    """
+    strings: list[str] = []
+    string_index: dict[str, int] = {}
+    problems: dict[str, list] = {field: [] for field in (*STATIC_FIELDS, ID_FIELD)}
+    problem_index: dict[tuple, int] = {}
+    lists: dict[str, list[int]] = {}
+    state: dict[str, dict[str, dict]] = {}
+
+    def intern(value: str) -> int:
+        if value not in string_index:
+            string_index[value] = len(strings)
+            strings.append(value)
+        return string_index[value]
+
+    for file_key in parsed_data["file_list"]:
+        refs = []
+        for row, problem in enumerate(parsed_data["data"][file_key]):
+            record = (
+                *(problem.get(field, default) for field, default in STATIC_FIELDS.items()),
+                problem.get(ID_FIELD),
+            )
+            ref = problem_index.get(record)
+            if ref is None:
+                ref = problem_index[record] = len(problems["name"])
+                for field, value in zip((*STATIC_FIELDS, ID_FIELD), record, strict=True):
+                    problems[field].append(intern(value) if field in INTERNED_FIELDS else value)
+            refs.append(ref)
+
+            overrides = {
+                field: value
+                for field, value in problem.items()
+                if field not in STATIC_FIELDS
+                and field != ID_FIELD
+                and USER_FIELDS.get(field, object()) != value
+            }
+            if overrides:
+                state.setdefault(file_key, {})[str(row)] = overrides
+        lists[file_key] = refs
+
+    return {
+        "version": PAYLOAD_VERSION,
+        "file_list": list(parsed_data["file_list"]),
+        "strings": strings,
+        "problems": problems,
+        "lists": lists,
+        "state": state,
+    }
+
+
+def decode_problem_data(payload: dict) -> dict:
+    """Expand a payload back into the parsed data structure.
+
+    This mirrors decodeProblemData() in js_data_generator.py and is the
+    reference for its behavior.
+
+    Args:
+        payload: Dictionary produced by encode_problem_data
+
+    Returns:
+        dict with keys: data, duplicate_map, file_list
+    """
+    strings = payload["strings"]
+    columns = payload["problems"]
+    data = {}
+    all_problems: dict[str, list[str]] = {}
+
+    for file_key in payload["file_list"]:
+        overrides = payload["state"].get(file_key, {})
+        problems = []
+        for row, ref in enumerate(payload["lists"][file_key]):
+            problem = {
+                field: strings[columns[field][ref]]
+                if field in INTERNED_FIELDS
+                else columns[field][ref]
+                for field in STATIC_FIELDS
+            }
+            problem.update(USER_FIELDS)
+            problem.update(overrides.get(str(row), {}))
+            if columns[ID_FIELD][ref] is not None:
+                problem[ID_FIELD] = columns[ID_FIELD][ref]
+            problems.append(problem)
+            all_problems.setdefault(problem["name"], []).append(file_key)
+        data[file_key] = problems
+
+    return {
+        "data": data,
+        "duplicate_map": {name: files for name, files in all_problems.items() if len(files) > 1},
+        "file_list": list(payload["file_list"]),
+    }
+
+
+def payload_to_js_literal(payload: dict) -> str:
+    """Serialize a payload as a JavaScript string literal for JSON.parse().
+
+    JSON.parse() of a single string literal is parsed much faster than the
+    equivalent object literal. "</" is escaped so the payload can never
+    close the surrounding <script> element.
+    """
+    compact = json.dumps(payload, separators=(",", ":"))
+    return json.dumps(compact).replace("</", "<\\/")
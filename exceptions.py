@@ -12,6 +12,7 @@ class GrindPulseError(Exception):
     def __init__(
         self, message: str, file_path: str | None = None, suggestion: str | None = None
     ) -> None:
+        self.message = message
         self.file_path = file_path
         self.suggestion = suggestion
         full_message = message
@@ -21,6 +22,11 @@ class GrindPulseError(Exception):
             full_message = f"{full_message}\n  Suggestion: {suggestion}"
         super().__init__(full_message)
 
+    def __reduce__(self):
+        # Rebuild from the constructor arguments so errors raised in
+        # worker processes survive pickling with their attributes intact
+        return (type(self), (self.message, self.file_path, self.suggestion))
+
 
 class FileIOError(GrindPulseError):
     """Raised when file read/write operations fail."""
@@ -63,9 +69,14 @@ class TSVParseError(ParseError):
         suggestion: str | None = None,
     ) -> None:
         self.line_number = line_number
+        raw_message = message
         if line_number:
             message = f"{message} (line {line_number})"
         super().__init__(message, file_path, suggestion)
+        self.message = raw_message
+
+    def __reduce__(self):
+        return (type(self), (self.message, self.file_path, self.line_number, self.suggestion))
 
 
 class GeneratorError(GrindPulseError):
@@ -78,6 +89,9 @@ class GeneratorError(GrindPulseError):
         suggestion = "Check generator function implementation and input data"
         super().__init__(message, suggestion=suggestion)
 
+    def __reduce__(self):
+        return (type(self), (self.generator_name, self.original_error))
+
 
 class ValidationError(GrindPulseError):
     """Raised when data validation fails."""
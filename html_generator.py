@@ -179,12 +179,19 @@ def generate_html_structure(file_list, firebase_enabled=False):
             <img id="auth-avatar" class="auth-avatar" src="" alt="" style="display:none">
             <span id="auth-text">Sign In</span>
           </button>
+          <button id="review-queue-btn" class="refresh-btn review-queue-btn" title="Review Queue" aria-label="Review Queue" aria-pressed="false" aria-controls="review-queue"><span aria-hidden="true">&#128197;</span></button>
           <button id="refresh-btn" class="refresh-btn" title="Refresh Awareness Colors" aria-label="Refresh Awareness Colors" onclick="manualRefreshAwareness()"><span aria-hidden="true">&#8635;</span></button>
           <button id="settings-btn" class="settings-btn" title="Awareness Settings" aria-label="Awareness Settings"><span aria-hidden="true">&#9881;</span></button>
         </div>
       </div>
     </header>
 
+    <div class="global-search-section">
+      <input type="search" id="global-search" class="search-box global-search-box" placeholder="Search all lists..." aria-label="Search all lists" aria-controls="global-search-results" autocomplete="off">
+      <div id="global-search-results" class="global-search-results" role="region" aria-label="Search results" aria-live="polite" style="display:none"></div>
+      <div id="review-queue" class="global-search-results review-queue-section" role="region" aria-label="Review queue" style="display:none"></div>
+    </div>
+
     <div class="tab-container">
 {tabs_html}
     </div>
@@ -230,6 +237,9 @@ def generate_html_structure(file_list, firebase_enabled=False):
 {tab_contents_html}
   </div>
 
+  <!-- Problem row cloned by createTableRow() (cells match the table headers) -->
+  <template id="problem-row-template"><tr><td></td><td><span></span></td><td class="time-col"></td><td class="time-col"></td><td class="time-col"></td><td class="pattern-cell"><button class="pattern-toggle">Show</button><div class="pattern-text"></div></td><td><input type="checkbox" class="checkbox-input"></td><td><input type="number" class="time-input" placeholder="Minutes"></td><td><textarea class="comments-input" placeholder="Add notes..."></textarea></td><td class="solved-date"></td></tr></template>
+
   <script>
     // Data will be embedded here
     {{DATA_PLACEHOLDER}}
@@ -13,9 +13,12 @@ Implements spaced repetition awareness calculations and color management
 # - tests/awareness.js contains identical functions as a testable ES module
 # - This allows comprehensive unit testing of the awareness algorithm
 #
-# When modifying getTierName(), getTierDifficultyMultiplier(), getCommitmentFactor(),
-# getSolvedFactor(), getDaysSinceCompletion(), calculateAwarenessScore(), or getAwarenessClass(),
+# When modifying getTierName(), getAwarenessFactors(), getTierDifficultyMultiplier(),
+# getTotalUniqueSolvedCount(), getCommitmentFactor(), getSolvedFactor(), getDaysSinceCompletion(),
+# getAwarenessDailyRate(), calculateAwarenessScore(), or getAwarenessClass(),
 # you MUST update both files to keep them in sync.
+# pushAwarenessDue(), popAwarenessDue() and getNextAwarenessTransition() are
+# likewise duplicated in tests/awareness-schedule.js.
 # After changes, run tests to verify: cd tests && npm test
 
 
@@ -100,6 +103,7 @@ def generate_js_awareness():
           AWARENESS_CONFIG = JSON.parse(JSON.stringify(DEFAULT_AWARENESS_CONFIG));
         }
       }
+      invalidateAwarenessConfig();
     }
 
     // Deep merge two objects
@@ -117,6 +121,7 @@ def generate_js_awareness():
 
     // Save awareness config to localStorage
     function saveAwarenessConfig() {
+      invalidateAwarenessConfig();
       localStorage.setItem('tracker_awareness_config', JSON.stringify(AWARENESS_CONFIG));
     }
 
@@ -124,6 +129,49 @@ def generate_js_awareness():
     function resetAwarenessConfig() {
       AWARENESS_CONFIG = JSON.parse(JSON.stringify(DEFAULT_AWARENESS_CONFIG));
       localStorage.removeItem('tracker_awareness_config');
+      invalidateAwarenessConfig();
+    }
+
+    // === Memoized Scoring Inputs ===
+    // Scoring a row used to rebuild the unique solved count from every list,
+    // making a full recolor quadratic. The count is now kept up to date by
+    // setProblemField(), and each problem's tier-based factors are cached until
+    // its time_to_solve or the config changes.
+
+    // Unique solved problems (null = count the registry again on next use)
+    let uniqueSolvedCount = null;
+
+    // Bumped on every config change; factors cached under an older version are stale
+    let awarenessConfigVersion = 0;
+
+    // problem -> { timeToSolve, configVersion, tier, multiplier, solvedScaling }
+    const AWARENESS_FACTOR_CACHE = new WeakMap();
+
+    function invalidateAwarenessConfig() {
+      awarenessConfigVersion++;
+      scheduleAwarenessRescore();
+      scheduleReviewQueueRender();
+    }
+
+    function countSolvedProblems(states) {
+      let count = 0;
+      Object.keys(states).forEach(id => {
+        if (states[id].solved) count++;
+      });
+      return count;
+    }
+
+    // Called after the registry is replaced wholesale (loading saved progress)
+    function resetUniqueSolvedCount() {
+      uniqueSolvedCount = null;
+    }
+
+    // Called by setProblemField() when a problem's solved flag changes
+    function updateUniqueSolvedCount(wasSolved, isSolved) {
+      if (uniqueSolvedCount === null || !wasSolved === !isSolved) return;
+      uniqueSolvedCount += isSolved ? 1 : -1;
+      // Every solved row's decay rate depends on the count
+      scheduleAwarenessRescore();
     }
 
     // Get tier name as string (for matrix lookup and solved bonus)
@@ -150,30 +198,59 @@ def generate_js_awareness():
       }
     }
 
-    // Get combined tier-difficulty multiplier
-    // Top tier has inverted behavior: Easy=0 (mastered), Medium<Hard
-    // Other tiers: Easy>Medium>Hard (standard)
-    function getTierDifficultyMultiplier(problem) {
+    // Tier-based scoring factors of a problem, cached per problem object
+    function getAwarenessFactors(problem) {
+      const cached = AWARENESS_FACTOR_CACHE.get(problem);
+      // The tier also depends on the difficulty and tier times, which an import
+      // can edit in place
+      if (cached && cached.configVersion === awarenessConfigVersion &&
+          cached.timeToSolve === problem.time_to_solve &&
+          cached.difficulty === problem.difficulty &&
+          cached.topTime === problem.top_time &&
+          cached.advancedTime === problem.advanced_time &&
+          cached.intermediateTime === problem.intermediate_time) {
+        return cached;
+      }
+
       const tier = getTierName(problem);
       const difficulty = problem.difficulty || 'Medium';
       const matrix = AWARENESS_CONFIG.tierDifficultyMultipliers;
 
+      // Top tier has inverted behavior: Easy=0 (mastered), Medium<Hard
+      // Other tiers: Easy>Medium>Hard (standard)
       // Fallback to intermediate-Medium if tier or difficulty not found
-      if (!matrix[tier]) return 1.0;
-      if (matrix[tier][difficulty] === undefined) return 1.0;
+      let multiplier = 1.0;
+      if (matrix[tier] && matrix[tier][difficulty] !== undefined) {
+        multiplier = matrix[tier][difficulty];
+      }
 
-      return matrix[tier][difficulty];
+      const factors = {
+        timeToSolve: problem.time_to_solve,
+        difficulty: problem.difficulty,
+        topTime: problem.top_time,
+        advancedTime: problem.advanced_time,
+        intermediateTime: problem.intermediate_time,
+        configVersion: awarenessConfigVersion,
+        tier,
+        multiplier,
+        solvedScaling: AWARENESS_CONFIG.baseSolvedScaling + AWARENESS_CONFIG.tierSolvedBonus[tier]
+      };
+      AWARENESS_FACTOR_CACHE.set(problem, factors);
+      return factors;
     }
 
-    // Get total unique solved count across all problem lists
+    // Get combined tier-difficulty multiplier
+    function getTierDifficultyMultiplier(problem) {
+      return getAwarenessFactors(problem).multiplier;
+    }
+
+    // Get total unique solved count across all problem lists (every list row
+    // of a problem shares one registry record, so each is counted once)
     function getTotalUniqueSolvedCount() {
-      const solvedNames = new Set();
-      PROBLEM_DATA.file_list.forEach(fileKey => {
-        PROBLEM_DATA.data[fileKey].forEach(p => {
-          if (p.solved) solvedNames.add(p.name);
-        });
-      });
-      return solvedNames.size;
+      if (uniqueSolvedCount === null) {
+        uniqueSolvedCount = countSolvedProblems(PROBLEM_STATE);
+      }
+      return uniqueSolvedCount;
     }
 
     // Get commitment factor (higher commitment = faster decay)
@@ -186,13 +263,10 @@ def generate_js_awareness():
     // Get solved factor (higher solved count = slower decay, especially for higher tiers)
     function getSolvedFactor(problem) {
       const totalSolved = getTotalUniqueSolvedCount();
-      const tier = getTierName(problem);
-      const baseScaling = AWARENESS_CONFIG.baseSolvedScaling;
-      const tierBonus = AWARENESS_CONFIG.tierSolvedBonus[tier];
 
       // Logarithmic scaling: early solutions have big impact, diminishing returns later
       // log2(1) = 0, so minimum solved_factor is 1
-      return 1 + (baseScaling + tierBonus) * Math.log2(totalSolved + 1);
+      return 1 + getAwarenessFactors(problem).solvedScaling * Math.log2(totalSolved + 1);
     }
 
     // Normalize date to ISO format, returns null if invalid
@@ -227,6 +301,14 @@ def generate_js_awareness():
       return { days: diffDays, valid: true };
     }
 
+    // Awareness points a solved problem gains per day
+    function getAwarenessDailyRate(problem) {
+      const commitmentFactor = getCommitmentFactor();
+      const tierDiffMultiplier = getTierDifficultyMultiplier(problem);
+      const solvedFactor = getSolvedFactor(problem);
+      return AWARENESS_CONFIG.baseRate * commitmentFactor * tierDiffMultiplier / solvedFactor;
+    }
+
     // Calculate awareness score for a problem
     // Returns: { score: number, invalidDate: boolean }
     function calculateAwarenessScore(problem) {
@@ -241,10 +323,6 @@ def generate_js_awareness():
       // No valid date (unsolved)
       if (dateResult.days < 0) return { score: -1, invalidDate: false };
 
-      const commitmentFactor = getCommitmentFactor();
-      const tierDiffMultiplier = getTierDifficultyMultiplier(problem);
-      const solvedFactor = getSolvedFactor(problem);
-
       // Enhanced formula with combined tier-difficulty multiplier:
       // days * baseRate * commitmentFactor * tierDiffMult / solvedFactor
       //
@@ -252,7 +330,7 @@ def generate_js_awareness():
       // - Top tier + Easy = 0 multiplier = score stays 0 = always white (mastered)
       // - Top tier: Medium < Hard (inverted - deep mastery of medium decays slower)
       // - Other tiers: Easy > Medium > Hard (standard - easy problems forgotten faster)
-      const score = dateResult.days * AWARENESS_CONFIG.baseRate * commitmentFactor * tierDiffMultiplier / solvedFactor;
+      const score = dateResult.days * getAwarenessDailyRate(problem);
 
       return { score, invalidDate: false };
     }
@@ -291,31 +369,171 @@ def generate_js_awareness():
       };
     }
 
-    // Update awareness color for a single row
-    function updateRowAwareness(fileKey, idx) {
-      const tbody = document.getElementById(`tbody-${fileKey}`);
-      if (!tbody) return;
+    // Last computed awareness of every row, { fileKey: [{ className, invalidDate }] }.
+    // Rows rendered later and the color filter read it instead of rescoring.
+    const ROW_AWARENESS = {};
+
+    // === Scheduled Awareness Transitions ===
+    // A solved problem's score grows linearly with time, so the moment it
+    // crosses its next threshold is known in advance. Rows are kept in a
+    // min-heap by that time and one timer scheduler job rescores only the rows
+    // whose class is due to change. Changes that alter every row's rate (config
+    // or unique solved count) trigger one debounced full rescore instead.
+
+    const AWARENESS_THRESHOLD_KEYS = ['white', 'green', 'yellow', 'red', 'darkRed'];
+    const AWARENESS_DAY_MS = 1000 * 60 * 60 * 24;
+    // Fire just after the crossing so rounding cannot leave the old class
+    const AWARENESS_TRANSITION_SLACK_MS = 1000;
+
+    // Min-heap of { at, fileKey, idx } ordered by at
+    let AWARENESS_HEAP = [];
+    // Due time of each row's current heap entry, { fileKey: [at] }; entries
+    // whose time no longer matches are stale and skipped when popped
+    let AWARENESS_DUE = {};
+    // Due time of the scheduler's 'awareness' job
+    let awarenessTimerAt = Infinity;
+    // Timer armed only after initAwareness() and unless updates are manual only
+    let awarenessScheduleEnabled = false;
+
+    function pushAwarenessDue(heap, entry) {
+      heap.push(entry);
+      let i = heap.length - 1;
+      while (i > 0) {
+        const parent = (i - 1) >> 1;
+        if (heap[parent].at <= entry.at) break;
+        heap[i] = heap[parent];
+        i = parent;
+      }
+      heap[i] = entry;
+    }
+
+    function popAwarenessDue(heap) {
+      const top = heap[0];
+      const last = heap.pop();
+      if (heap.length === 0) return top;
+      let i = 0;
+      for (;;) {
+        const left = 2 * i + 1;
+        if (left >= heap.length) break;
+        const child = left + 1 < heap.length && heap[left + 1].at < heap[left].at ? left + 1 : left;
+        if (heap[child].at >= last.at) break;
+        heap[i] = heap[child];
+        i = child;
+      }
+      heap[i] = last;
+      return top;
+    }
+
+    // Time (ms) at which a problem's awareness class next changes, or
+    // Infinity if it never will (unsolved, invalid date, no decay, flashing)
+    function getNextAwarenessTransition(problem, score) {
+      if (score < 0) return Infinity;
+      const solvedAt = new Date(problem.solved_date).getTime();
+      if (isNaN(solvedAt)) return Infinity;
+      const dailyRate = getAwarenessDailyRate(problem);
+      if (!(dailyRate > 0)) return Infinity;
+
+      const thresholds = AWARENESS_CONFIG.thresholds;
+      const nextKey = AWARENESS_THRESHOLD_KEYS.find(key => thresholds[key] > score);
+      if (nextKey === undefined) return Infinity;
+      return solvedAt + thresholds[nextKey] / dailyRate * AWARENESS_DAY_MS;
+    }
+
+    function scheduleRowAwareness(fileKey, idx, at) {
+      if (!AWARENESS_DUE[fileKey]) AWARENESS_DUE[fileKey] = [];
+      AWARENESS_DUE[fileKey][idx] = at;
+      if (at === Infinity) return;
+      pushAwarenessDue(AWARENESS_HEAP, { at, fileKey, idx });
+      if (at + AWARENESS_TRANSITION_SLACK_MS < awarenessTimerAt) armAwarenessTimer();
+    }
+
+    function clearAwarenessSchedule(fileKey) {
+      if (fileKey) {
+        delete AWARENESS_DUE[fileKey];
+        return;
+      }
+      AWARENESS_HEAP = [];
+      AWARENESS_DUE = {};
+      armAwarenessTimer();
+    }
+
+    // Point the scheduler's awareness job at the earliest due row
+    function armAwarenessTimer() {
+      awarenessTimerAt = Infinity;
+      if (awarenessScheduleEnabled && AWARENESS_HEAP.length > 0) {
+        awarenessTimerAt = AWARENESS_HEAP[0].at + AWARENESS_TRANSITION_SLACK_MS;
+      }
+      setTimerJob('awareness', awarenessTimerAt, runDueAwareness);
+    }
+
+    // Rescore the rows whose transition time has passed
+    function runDueAwareness() {
+      const now = Date.now();
+      while (AWARENESS_HEAP.length > 0 && AWARENESS_HEAP[0].at + AWARENESS_TRANSITION_SLACK_MS <= now) {
+        const entry = popAwarenessDue(AWARENESS_HEAP);
+        const due = AWARENESS_DUE[entry.fileKey];
+        if (!due || due[entry.idx] !== entry.at) continue;
+        due[entry.idx] = Infinity;
+        const problems = PROBLEM_DATA.data[entry.fileKey];
+        if (problems && problems[entry.idx]) updateRowAwareness(entry.fileKey, entry.idx);
+      }
+      armAwarenessTimer();
+      // A problem may have started flashing
+      scheduleReviewQueueRender();
+    }
 
-      const row = tbody.querySelector(`tr[data-index="${idx}"]`);
-      if (!row) return;
+    // Rescore every row once after a change to all decay rates settles
+    const rescoreAwarenessDebounced = debounce(function() {
+      updateAwarenessColorsAsync(true);
+    }, 1000);
+
+    function scheduleAwarenessRescore() {
+      if (awarenessScheduleEnabled) rescoreAwarenessDebounced();
+    }
 
+    // Recompute and cache the awareness of a single row and schedule its next change
+    function refreshRowAwareness(fileKey, idx) {
       const problem = PROBLEM_DATA.data[fileKey][idx];
       const result = calculateAwarenessScore(problem);
-      const newClass = getAwarenessClass(result.score);
+      const awareness = { className: getAwarenessClass(result.score), invalidDate: result.invalidDate };
+      if (!ROW_AWARENESS[fileKey]) ROW_AWARENESS[fileKey] = [];
+      ROW_AWARENESS[fileKey][idx] = awareness;
+      scheduleRowAwareness(fileKey, idx, getNextAwarenessTransition(problem, result.score));
+      return awareness;
+    }
+
+    function getRowAwareness(fileKey, idx) {
+      const cached = ROW_AWARENESS[fileKey] && ROW_AWARENESS[fileKey][idx];
+      return cached || refreshRowAwareness(fileKey, idx);
+    }
 
+    // Set a row element's awareness classes
+    function paintRowAwareness(row, awareness) {
       // Remove all awareness classes and invalid-date class
       AWARENESS_CLASSES.forEach(cls => row.classList.remove(cls));
       row.classList.remove('invalid-date');
 
       // Add the new class
-      row.classList.add(newClass);
+      row.classList.add(awareness.className);
 
       // Add invalid-date indicator if needed
-      if (result.invalidDate) {
+      if (awareness.invalidDate) {
         row.classList.add('invalid-date');
       }
     }
 
+    // Update awareness color for a single row (rows outside the rendered
+    // window only update the cache and are painted when they are rendered)
+    function updateRowAwareness(fileKey, idx) {
+      paintRowAwarenessAt(fileKey, idx, refreshRowAwareness(fileKey, idx));
+    }
+
+    // Paint a row's awareness on the next frame if it is rendered then; the
+    // frame reads the class from ROW_AWARENESS, where awareness is stored
+    function paintRowAwarenessAt(fileKey, idx, awareness) {
+      scheduleRowRender(fileKey, idx);
+    }
+
     // Update awareness colors for all problems in a specific tab
     function updateTabAwareness(fileKey) {
       PROBLEM_DATA.data[fileKey].forEach((problem, idx) => {
@@ -327,8 +545,16 @@ def generate_js_awareness():
     // @param {boolean} allTabs - If true, update all tabs; if false, update only current tab
     function updateAwarenessColors(allTabs = false) {
       if (allTabs) {
+        // Every row is rescored below, so the schedule is rebuilt from scratch
+        clearAwarenessSchedule();
         PROBLEM_DATA.file_list.forEach(fileKey => {
-          updateTabAwareness(fileKey);
+          if (isTabHydrated(fileKey)) {
+            updateTabAwareness(fileKey);
+          } else {
+            // Not rendered yet: drop stale entries, rows are scored when first rendered
+            delete ROW_AWARENESS[fileKey];
+            clearAwarenessSchedule(fileKey);
+          }
         });
       } else {
         // Only update current visible tab (currentTab is defined in js_core_generator.py)
@@ -338,25 +564,18 @@ def generate_js_awareness():
 
     // Debounced version for interactive operations like settings preview
     // Uses aggressive 1000ms debounce since colors are day-based and don't need real-time updates
+    // Scores in the background worker (js_scoring_generator.py) when available
     const updateAwarenessColorsDebounced = debounce(function(allTabs = false) {
-      updateAwarenessColors(allTabs);
+      updateAwarenessColorsAsync(allTabs);
     }, 1000);
 
     // Auto-refresh management
-    let awarenessRefreshInterval = null;
     let focusHandler = null;
 
     function setupAwarenessRefresh() {
-      // Clear existing interval if any
-      if (awarenessRefreshInterval) {
-        clearInterval(awarenessRefreshInterval);
-        awarenessRefreshInterval = null;
-      }
-
-      // Set up new interval based on config (0 = manual only)
-      if (AWARENESS_CONFIG.refreshInterval > 0) {
-        awarenessRefreshInterval = setInterval(() => updateAwarenessColors(true), AWARENESS_CONFIG.refreshInterval);
-      }
+      // Scheduled transitions run unless updates are manual only (refreshInterval 0)
+      awarenessScheduleEnabled = AWARENESS_CONFIG.refreshInterval > 0;
+      armAwarenessTimer();
 
       // Remove existing focus listener if any
       if (focusHandler) {
@@ -367,7 +586,7 @@ def generate_js_awareness():
       // Add focus listener if enabled (debounced to prevent rapid updates)
       if (AWARENESS_CONFIG.refreshOnFocus) {
         focusHandler = debounce(function() {
-          updateAwarenessColors(true);  // Update all tabs on focus since user may have been away
+          updateAwarenessColorsAsync(true);  // Update all tabs on focus since user may have been away
         }, 300);
         window.addEventListener('focus', focusHandler);
       }
@@ -375,8 +594,10 @@ def generate_js_awareness():
 
     // Manual refresh function (can be called from button)
     function manualRefreshAwareness() {
-      updateAwarenessColors(true);  // Update all tabs for manual refresh
-      PROBLEM_DATA.file_list.forEach(function(fileKey) { if (typeof applyFilters === 'function') applyFilters(fileKey); });
+      // Update all tabs for manual refresh
+      return updateAwarenessColorsAsync(true).then(() => {
+        PROBLEM_DATA.file_list.forEach(function(fileKey) { if (typeof applyFilters === 'function') applyFilters(fileKey); });
+      });
     }
 
     // Initialize awareness on load
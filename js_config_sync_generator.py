@@ -140,29 +140,38 @@ def generate_js_config_sync():
     }
 
     /**
-     * Restore filter states from config to UI
+     * Restore a tab's filter state from config to UI and apply it
+     */
+    function restoreTabFilterState(fileKey) {
+      const state = FILTER_CONFIG.tabStates[fileKey];
+      if (!state) return;
+
+      const difficultyFilter = document.getElementById(`difficulty-filter-${fileKey}`);
+      const solvedFilter = document.getElementById(`solved-filter-${fileKey}`);
+      const patternFilter = document.getElementById(`pattern-filter-${fileKey}`);
+      const colorFilter = document.getElementById(`color-filter-${fileKey}`);
+      const searchBox = document.getElementById(`search-${fileKey}`);
+
+      if (difficultyFilter) difficultyFilter.value = state.difficultyFilter || 'all';
+      if (solvedFilter) solvedFilter.value = state.solvedFilter || 'all';
+      if (patternFilter) patternFilter.value = state.patternFilter || 'all';
+      if (colorFilter) colorFilter.value = state.colorFilter || 'all';
+      if (searchBox) searchBox.value = state.searchTerm || '';
+
+      // Apply filters after restoring
+      if (typeof applyFilters === 'function') {
+        applyFilters(fileKey);
+      }
+    }
+
+    /**
+     * Restore filter states from config to UI. Tabs that have not been
+     * activated yet restore theirs when they are first shown.
      */
     function restoreFilterStates() {
       PROBLEM_DATA.file_list.forEach(fileKey => {
-        const state = FILTER_CONFIG.tabStates[fileKey];
-        if (!state) return;
-
-        const difficultyFilter = document.getElementById(`difficulty-filter-${fileKey}`);
-        const solvedFilter = document.getElementById(`solved-filter-${fileKey}`);
-        const patternFilter = document.getElementById(`pattern-filter-${fileKey}`);
-        const colorFilter = document.getElementById(`color-filter-${fileKey}`);
-        const searchBox = document.getElementById(`search-${fileKey}`);
-
-        if (difficultyFilter) difficultyFilter.value = state.difficultyFilter || 'all';
-        if (solvedFilter) solvedFilter.value = state.solvedFilter || 'all';
-        if (patternFilter) patternFilter.value = state.patternFilter || 'all';
-        if (colorFilter) colorFilter.value = state.colorFilter || 'all';
-        if (searchBox) searchBox.value = state.searchTerm || '';
-
-        // Apply filters after restoring
-        if (typeof applyFilters === 'function') {
-          applyFilters(fileKey);
-        }
+        if (typeof isTabHydrated === 'function' && !isTabHydrated(fileKey)) return;
+        restoreTabFilterState(fileKey);
       });
     }
 
@@ -307,18 +316,18 @@ def generate_js_config_sync():
     /**
      * Apply column visibility to all tables
      */
-    function applyColumnVisibility() {
-      const columnMap = {
-        intermediateTime: 2,
-        advancedTime: 3,
-        topTime: 4,
-        pattern: 5,
-        comments: 8,
-        solvedDate: 9
-      };
+    const COLUMN_INDEXES = {
+      intermediateTime: 2,
+      advancedTime: 3,
+      topTime: 4,
+      pattern: 5,
+      comments: 8,
+      solvedDate: 9
+    };
 
+    function applyColumnVisibility() {
       Object.entries(UI_PREFS.columnVisibility).forEach(([column, visible]) => {
-        const colIndex = columnMap[column];
+        const colIndex = COLUMN_INDEXES[column];
         if (colIndex === undefined) return;
 
         // Apply to all tables
@@ -329,6 +338,19 @@ def generate_js_config_sync():
           });
         });
       });
+
+      // Detached rows waiting for reuse are not in any table
+      Object.values(TABLE_VIEWS).forEach(view => view.pool.forEach(applyColumnVisibilityToRow));
+    }
+
+    /**
+     * Apply column visibility to a newly created table row
+     */
+    function applyColumnVisibilityToRow(row) {
+      Object.entries(UI_PREFS.columnVisibility).forEach(([column, visible]) => {
+        const cell = row.children[COLUMN_INDEXES[column]];
+        if (cell) cell.style.display = visible ? '' : 'none';
+      });
     }
 
     /**
@@ -16,7 +16,6 @@ def generate_js_conflict_dialog():
     // Constants for import backup functionality
     const IMPORT_BACKUP_EXPIRY_MS = 3600000; // 1 hour - backups older than this cannot be restored
     const IMPORT_BACKUP_KEY = 'tracker_import_backup';
-    const TRACKER_DATA_PREFIX = 'tracker_'; // Consistent with js_core_generator.py
 
     /**
      * Handle Escape key to close conflict dialog
@@ -233,10 +232,11 @@ def generate_js_conflict_dialog():
      * Backup current state before bulk operations
      */
     function backupBeforeImport(fileKey) {
+      // Snapshot the registry itself; saved progress may live in IndexedDB
       const backup = {
         timestamp: Date.now(),
         fileKey: fileKey,
-        data: JSON.parse(localStorage.getItem(TRACKER_DATA_PREFIX + fileKey) || '{}')
+        data: serializeProblemState()
       };
       localStorage.setItem(IMPORT_BACKUP_KEY, JSON.stringify(backup));
     }
@@ -255,10 +255,22 @@ def generate_js_conflict_dialog():
         localStorage.removeItem(IMPORT_BACKUP_KEY);
         return false;
       }
-      localStorage.setItem(TRACKER_DATA_PREFIX + backup.fileKey, JSON.stringify(backup.data));
+      if (backup.data && !backup.data.problems) {
+        alert('This import backup was made by an older version and cannot be restored.');
+        localStorage.removeItem(IMPORT_BACKUP_KEY);
+        return false;
+      }
+      // Unsaved edits made since the import are dropped so they cannot
+      // overwrite the backup
+      discardPendingProblemState();
       localStorage.removeItem(IMPORT_BACKUP_KEY);
-      alert('Successfully restored data from before last import.');
-      location.reload();
+      replaceStoredProblemState(backup.data).then(() => {
+        alert('Successfully restored data from before last import.');
+        location.reload();
+      }).catch(e => {
+        console.error('Error restoring import backup:', e);
+        showStorageToast('Your progress could not be saved. Consider exporting your data as a backup.', 'warning');
+      });
       return true;
     }
 
@@ -14,6 +14,10 @@ def generate_js_core():
     let allPatterns = new Set();
     let sortState = {};
 
+    // Tabs whose table, filters and sort headers have been set up. A tab is
+    // hydrated the first time it is activated, so startup only pays for one.
+    const hydratedTabs = new Set();
+
     // Initialize on page load
     document.addEventListener('DOMContentLoaded', function() {
       // Initialize config sync first (loads filter/export/UI preferences from localStorage)
@@ -21,33 +25,35 @@ def generate_js_core():
         initConfigSync();
       }
 
-      if (!isLocalStorageAvailable()) {
+      if (!isLocalStorageAvailable() && !isIndexedDBAvailable()) {
         showStorageToast('localStorage is not available. Your progress will not be saved.', 'warning');
       }
-      loadFromLocalStorage();
-      populatePatternFilters();
-      PROBLEM_DATA.file_list.forEach(fileKey => {
-        PROBLEM_DATA.data[fileKey].forEach((problem, idx) => { problem._originalIndex = idx; });
-        restoreSortStateForTab(fileKey);
-      });
-      renderAllTabs();
+
+      restoreDirtyProblemIds();
+
+      // Progress in IndexedDB is read asynchronously; the UI starts once it is loaded
+      if (isIndexedDBAvailable()) {
+        loadFromIndexedDB().then(startTracker);
+      } else {
+        loadFromLocalStorage();
+        startTracker();
+      }
+    });
+
+    // Build the UI once progress has been loaded
+    function startTracker() {
       initAwareness();
       updateAllProgress();
-      PROBLEM_DATA.file_list.forEach(fileKey => {
-        updateRandomBtnState(fileKey);
-        updateUrgentBtnState(fileKey);
-        initSortHeaders(fileKey);
-      });
       setupEventListeners();
       initSettingsButton();
 
-      // Restore saved filter states and active tab from config
-      if (typeof restoreFilterStates === 'function') {
-        restoreFilterStates();
-      }
+      // Activate the saved tab (or the first one); only it is rendered now
       if (typeof restoreActiveTab === 'function') {
         restoreActiveTab();
       }
+      if (!isTabHydrated(currentTab)) {
+        switchTab(currentTab);
+      }
 
       // Initialize export preferences from saved config
       if (typeof initExportPreferences === 'function') {
@@ -58,7 +64,7 @@ def generate_js_core():
       if (typeof initFirebase === 'function') {
         initFirebase();
       }
-    });
+    }
 
     // Setup event listeners
     function setupEventListeners() {
@@ -77,10 +83,7 @@ def generate_js_core():
         const solvedFilter = document.getElementById(`solved-filter-${fileKey}`);
 
         if (searchBox) {
-          searchBox.addEventListener('input', () => {
-            applyFilters(fileKey);
-            if (typeof saveFilterState === 'function') saveFilterState(fileKey);
-          });
+          searchBox.addEventListener('input', () => applySearchDebounced(fileKey));
         }
         if (difficultyFilter) {
           difficultyFilter.addEventListener('change', () => {
@@ -109,11 +112,30 @@ def generate_js_core():
           });
         }
       });
+
+      initGlobalSearch();
+      initReviewQueue();
+    }
+
+    // Search input is filtered once typing pauses instead of on every keystroke
+    const SEARCH_DEBOUNCE_MS = 120;
+    const searchDebouncers = {};
+
+    function applySearchDebounced(fileKey) {
+      if (!searchDebouncers[fileKey]) {
+        searchDebouncers[fileKey] = debounce(() => {
+          applyFilters(fileKey);
+          if (typeof saveFilterState === 'function') saveFilterState(fileKey);
+        }, SEARCH_DEBOUNCE_MS);
+      }
+      searchDebouncers[fileKey]();
     }
 
     // Tab switching
     function switchTab(tabName) {
+      if (!document.getElementById(`tab-${tabName}`)) return;
       currentTab = tabName;
+      hydrateTab(tabName);
 
       // Save active tab to config
       if (typeof saveActiveTab === 'function') {
@@ -133,6 +155,11 @@ def generate_js_core():
         content.classList.remove('active');
       });
       document.getElementById(`tab-${tabName}`).classList.add('active');
+
+      // The window was computed while the tab was hidden
+      renderVirtualRows(tabName);
+      // Its dates were last refreshed while it was hidden
+      refreshRelativeDates();
     }
 
     // Check if localStorage is available
@@ -161,48 +188,171 @@ def generate_js_core():
       setTimeout(() => { if (toast.parentNode) toast.parentNode.removeChild(toast); }, 5000);
     }
 
-    // Load data from localStorage
+    // Load progress from localStorage into the problem registry. Returns false
+    // when saved progress exists but could not be read.
     function loadFromLocalStorage() {
-      PROBLEM_DATA.file_list.forEach(fileKey => {
+      try {
+        const saved = localStorage.getItem(PROBLEM_STATE_KEY);
+        if (saved) {
+          restoreProblemState(JSON.parse(saved));
+          return true;
+        }
+      } catch (e) {
+        console.error('Error loading saved progress:', e);
+        showStorageToast('Your saved progress could not be loaded. Data may be corrupted.', 'error');
+        return false;
+      }
+
+      // First load after upgrading: merge the old per-list saves into the registry
+      let readable = true;
+      const migrated = migrateLegacyProgress(PROBLEM_DATA.file_list, fileKey => {
         try {
           const saved = localStorage.getItem(`tracker_${fileKey}`);
-          if (saved) {
-            const savedData = JSON.parse(saved);
-            // Merge saved data with original data
-            const savedMap = {};
-            savedData.forEach(function(item) { if (item && item.name) savedMap[item.name] = item; });
-            PROBLEM_DATA.data[fileKey].forEach(function(problem) {
-              const saved = savedMap[problem.name];
-              if (saved) {
-                problem.solved = saved.solved || false;
-                problem.time_to_solve = saved.time_to_solve || "";
-                problem.comments = saved.comments || "";
-                problem.solved_date = saved.solved_date || "";
-              }
-            });
-          }
+          return saved ? JSON.parse(saved) : null;
         } catch (e) {
           console.error(`Error loading saved data for ${fileKey}:`, e);
           showStorageToast('Your saved progress could not be loaded. Data may be corrupted.', 'error');
+          readable = false;
+          return null;
         }
       });
+      if (migrated) {
+        saveProblemState();
+      }
+      return readable;
     }
 
-    // Save to localStorage
-    function saveToLocalStorage(fileKey) {
-      const data = PROBLEM_DATA.data[fileKey].map(p => ({
-        name: p.name,
-        solved: p.solved,
-        time_to_solve: p.time_to_solve,
-        comments: p.comments,
-        solved_date: p.solved_date
-      }));
+    // Keep the problems not yet uploaded to the cloud across reloads
+    function saveDirtyProblemIds() {
       try {
-        localStorage.setItem(`tracker_${fileKey}`, JSON.stringify(data));
+        if (DIRTY_PROBLEM_IDS.size > 0) {
+          localStorage.setItem(DIRTY_PROBLEM_IDS_KEY, JSON.stringify(Array.from(DIRTY_PROBLEM_IDS)));
+        } else {
+          localStorage.removeItem(DIRTY_PROBLEM_IDS_KEY);
+        }
       } catch (e) {
-        console.error(`Error saving data for ${fileKey}:`, e);
+        console.error('Error saving pending cloud changes:', e);
+      }
+    }
+
+    function restoreDirtyProblemIds() {
+      try {
+        const saved = JSON.parse(localStorage.getItem(DIRTY_PROBLEM_IDS_KEY) || '[]');
+        if (Array.isArray(saved)) saved.forEach(id => DIRTY_PROBLEM_IDS.add(id));
+      } catch (e) {
+        console.error('Error loading pending cloud changes:', e);
+      }
+    }
+
+    // Save the problem registry: changed records to IndexedDB when it is in
+    // use, otherwise the whole registry (one record per problem) to localStorage
+    function saveProblemState() {
+      saveDirtyProblemIds();
+      if (isProgressDbActive()) {
+        saveProblemStateToIndexedDB();
+        return;
+      }
+      // The database is failing this session: journal the changes so the
+      // next session that opens it does not ignore them
+      if (isIndexedDBAvailable()) writeProgressJournal(Array.from(UNSAVED_PROBLEM_IDS));
+      try {
+        localStorage.setItem(PROBLEM_STATE_KEY, JSON.stringify(serializeProblemState()));
+        UNSAVED_PROBLEM_IDS.clear();
+      } catch (e) {
+        console.error('Error saving progress:', e);
         showStorageToast('Your progress could not be saved. Consider exporting your data as a backup.', 'warning');
       }
+    }
+
+    // === Write-behind persistence ===
+    // Edits only mark the registry dirty; it is serialized once per idle
+    // period, and immediately when the page is hidden or unloaded so closing
+    // the tab never loses a write. IndexedDB writes are asynchronous, so on
+    // hide the uncommitted changes also go to a synchronous localStorage
+    // journal (js_storage_generator.py).
+
+    const PERSIST_IDLE_TIMEOUT_MS = 1000;
+
+    // Coalesce writes: markDirty() schedules a single write, flush() performs
+    // a pending write now and discard() drops it
+    function createWriteBehind(write, schedule, cancel) {
+      let dirty = false;
+      let handle = null;
+
+      function cancelScheduled() {
+        if (handle === null) return;
+        cancel(handle);
+        handle = null;
+      }
+
+      function flush() {
+        cancelScheduled();
+        if (!dirty) return false;
+        dirty = false;
+        write();
+        return true;
+      }
+
+      return {
+        markDirty() {
+          dirty = true;
+          if (handle === null) {
+            handle = schedule(() => {
+              handle = null;
+              flush();
+            });
+          }
+        },
+        flush,
+        discard() {
+          dirty = false;
+          cancelScheduled();
+        },
+        isDirty: () => dirty
+      };
+    }
+
+    function scheduleIdleTask(callback) {
+      if (typeof requestIdleCallback === 'function') {
+        return requestIdleCallback(callback, { timeout: PERSIST_IDLE_TIMEOUT_MS });
+      }
+      return setTimeout(callback, PERSIST_IDLE_TIMEOUT_MS);
+    }
+
+    function cancelIdleTask(handle) {
+      if (typeof cancelIdleCallback === 'function') {
+        cancelIdleCallback(handle);
+      } else {
+        clearTimeout(handle);
+      }
+    }
+
+    const problemStateWriter = createWriteBehind(saveProblemState, scheduleIdleTask, cancelIdleTask);
+
+    // Write pending progress now (before reading the saved copy back)
+    function flushProblemState() {
+      problemStateWriter.flush();
+    }
+
+    // Drop pending progress (before replacing the saved copy wholesale)
+    function discardPendingProblemState() {
+      problemStateWriter.discard();
+      discardUncommittedProgress();
+    }
+
+    function flushProblemStateOnHide() {
+      journalUncommittedProgress();
+      flushProblemState();
+    }
+
+    document.addEventListener('visibilitychange', () => {
+      if (document.visibilityState === 'hidden') flushProblemStateOnHide();
+    });
+    window.addEventListener('pagehide', flushProblemStateOnHide);
+
+    // Save after a change in a list (progress is stored once, not per list)
+    function saveToLocalStorage(fileKey) {
+      problemStateWriter.markDirty();
 
       // Trigger cloud sync (debounced) if Firebase is enabled
       if (typeof syncToCloudDebounced === 'function' && typeof isCloudSyncEnabled === 'function' && isCloudSyncEnabled()) {
@@ -210,57 +360,179 @@ def generate_js_core():
       }
     }
 
-    // Populate pattern filter dropdowns
-    function populatePatternFilters() {
-      PROBLEM_DATA.file_list.forEach(fileKey => {
-        PROBLEM_DATA.data[fileKey].forEach(problem => {
-          if (problem.pattern) {
-            allPatterns.add(problem.pattern);
-          }
+    // Populate a tab's pattern filter dropdown with the patterns of every list
+    function populatePatternFilter(fileKey) {
+      if (allPatterns.size === 0) {
+        PROBLEM_DATA.file_list.forEach(key => {
+          PROBLEM_DATA.data[key].forEach(problem => {
+            if (problem.pattern) {
+              allPatterns.add(problem.pattern);
+            }
+          });
         });
+      }
+
+      const select = document.getElementById(`pattern-filter-${fileKey}`);
+      Array.from(allPatterns).sort().forEach(pattern => {
+        const option = document.createElement('option');
+        option.value = pattern;
+        option.textContent = pattern;
+        select.appendChild(option);
       });
+    }
 
-      const sortedPatterns = Array.from(allPatterns).sort();
+    function isTabHydrated(fileKey) {
+      return hydratedTabs.has(fileKey);
+    }
 
-      PROBLEM_DATA.file_list.forEach(fileKey => {
-        const select = document.getElementById(`pattern-filter-${fileKey}`);
-        sortedPatterns.forEach(pattern => {
-          const option = document.createElement('option');
-          option.value = pattern;
-          option.textContent = pattern;
-          select.appendChild(option);
-        });
-      });
+    // Tabs created at runtime set up their own filters (see createTabUI) and
+    // only need the table listeners
+    function markTabHydrated(fileKey) {
+      hydratedTabs.add(fileKey);
+      initTableEvents(fileKey);
     }
 
-    // Render all tabs
+    // Set up a tab's filters, sort headers and table on first activation
+    function hydrateTab(fileKey) {
+      if (hydratedTabs.has(fileKey)) return;
+      hydratedTabs.add(fileKey);
+
+      populatePatternFilter(fileKey);
+      initTableEvents(fileKey);
+      if (typeof restoreTabFilterState === 'function') {
+        restoreTabFilterState(fileKey);
+      }
+      restoreSortStateForTab(fileKey);
+      initSortHeaders(fileKey);
+      renderTable(fileKey);
+      updateUrgentBtnState(fileKey);
+    }
+
+    // Re-render all hydrated tabs
     function renderAllTabs() {
       PROBLEM_DATA.file_list.forEach(fileKey => {
         renderTable(fileKey);
       });
     }
 
-    // Render table for a specific tab
+    // Render table for a specific tab (rows are materialized by renderVirtualRows).
+    // Tabs that were never activated are skipped; they render when hydrated.
     function renderTable(fileKey) {
+      if (!isTabHydrated(fileKey)) return;
+      invalidateFilterIndex(fileKey);
+      resetSortCache(fileKey);
+      getTableView(fileKey).order = getSortedOrder(fileKey);
+
+      releaseRenderedRows(fileKey);
+      applyFilters(fileKey);
+    }
+
+    // Create an empty table row by cloning the prebuilt row template. Rows
+    // carry no handlers; initTableEvents listens on the tbody instead.
+    function createTableRow(fileKey) {
+      const template = document.getElementById('problem-row-template');
+      const tr = template.content.firstElementChild.cloneNode(true);
+      tr.lastElementChild.dataset.fileKey = fileKey;
+      const cells = tr.children;
+      ROW_CELLS.set(tr, {
+        checkbox: cells[6].firstElementChild,
+        timeInput: cells[7].firstElementChild,
+        commentsInput: cells[8].firstElementChild,
+        dateCell: cells[9]
+      });
+
+      if (typeof applyColumnVisibilityToRow === 'function') {
+        applyColumnVisibilityToRow(tr);
+      }
+
+      return tr;
+    }
+
+    // Index of the problem bound to the row containing an element
+    function rowIndexOf(element) {
+      const row = element.closest('tr');
+      return row ? parseInt(row.dataset.index, 10) : NaN;
+    }
+
+    // One delegated listener per event type on a tab's tbody, for every row
+    function initTableEvents(fileKey) {
       const tbody = document.getElementById(`tbody-${fileKey}`);
-      tbody.innerHTML = '';
+      if (!tbody) return;
 
-      const sorted = getSortedProblems(fileKey);
-      sorted.forEach((problem) => {
-        const row = createTableRow(problem, problem._originalIndex, fileKey);
-        tbody.appendChild(row);
+      tbody.addEventListener('click', event => {
+        const toggle = event.target.closest('.pattern-toggle');
+        if (toggle) togglePatternText(toggle);
       });
 
-      applyFilters(fileKey);
+      tbody.addEventListener('change', event => {
+        const target = event.target;
+        if (!target.classList.contains('checkbox-input')) return;
+        const idx = rowIndexOf(target);
+        if (!isNaN(idx)) handleSolvedChange(fileKey, idx, target.checked);
+      });
+
+      tbody.addEventListener('input', event => {
+        const target = event.target;
+        const isTime = target.classList.contains('time-input');
+        if (!isTime && !target.classList.contains('comments-input')) return;
+        const idx = rowIndexOf(target);
+        if (isNaN(idx)) return;
+        if (isTime) {
+          handleTimeInput(fileKey, idx, target.value);
+        } else {
+          handleCommentsInput(fileKey, idx, target.value);
+        }
+      });
+    }
+
+    function togglePatternText(button) {
+      const textDiv = button.nextElementSibling;
+      textDiv.classList.toggle('visible');
+      button.textContent = textDiv.classList.contains('visible') ? 'Hide' : 'Show';
+    }
+
+    function handleSolvedChange(fileKey, idx, checked) {
+      const problem = PROBLEM_DATA.data[fileKey][idx];
+      problem.solved = checked;
+      if (checked && !problem.solved_date) {
+        problem.solved_date = new Date().toISOString();
+        updateSolvedDateDisplay(fileKey, idx);
+      } else if (!checked) {
+        problem.solved_date = "";
+        updateSolvedDateDisplay(fileKey, idx);
+      }
+      updateFilterIndexRow(fileKey, idx);
+      syncDuplicates(problem.name, 'solved', checked);
+      syncDuplicates(problem.name, 'solved_date', problem.solved_date);
+      saveToLocalStorage(fileKey);
+      updateProgress(fileKey);
+      updateOverallProgress();
+      updateRowAwareness(fileKey, idx);
+      updateUrgentBtnState(fileKey);
+    }
+
+    function handleTimeInput(fileKey, idx, value) {
+      const problem = PROBLEM_DATA.data[fileKey][idx];
+      problem.time_to_solve = value;
+      syncDuplicates(problem.name, 'time_to_solve', value);
+      saveToLocalStorage(fileKey);
+      updateRowAwareness(fileKey, idx);
     }
 
-    // Create table row
-    function createTableRow(problem, idx, fileKey) {
-      const tr = document.createElement('tr');
+    function handleCommentsInput(fileKey, idx, value) {
+      const problem = PROBLEM_DATA.data[fileKey][idx];
+      problem.comments = value;
+      syncDuplicates(problem.name, 'comments', value);
+      saveToLocalStorage(fileKey);
+    }
+
+    // Bind a row created by createTableRow to a problem
+    function fillTableRow(tr, problem, idx, fileKey) {
+      const cells = tr.children;
       tr.dataset.index = idx;
 
-      // Problem Name + Duplicate Badge
-      const nameTd = document.createElement('td');
+      const nameTd = cells[0];
+      nameTd.textContent = '';
 
       const rawLink = problem.link ? problem.link.trim() : '';
       const safeLink = rawLink && /^(https?:\\/\\/|\\/|[^:]*$)/.test(rawLink) &&
@@ -294,127 +566,35 @@ def generate_js_core():
         nameTd.appendChild(badge);
       }
 
-      // Difficulty
-      const difficultyTd = document.createElement('td');
-      const difficultyBadge = document.createElement('span');
+      const difficultyBadge = cells[1].firstElementChild;
       difficultyBadge.className = `difficulty-badge difficulty-${problem.difficulty}`;
       difficultyBadge.textContent = problem.difficulty;
-      difficultyTd.appendChild(difficultyBadge);
-
-      // Time columns
-      const intermediateTd = document.createElement('td');
-      intermediateTd.className = 'time-col';
-      intermediateTd.textContent = problem.intermediate_time ? `${problem.intermediate_time} min` : '-';
-
-      const advancedTd = document.createElement('td');
-      advancedTd.className = 'time-col';
-      advancedTd.textContent = problem.advanced_time ? `${problem.advanced_time} min` : '-';
 
-      const topTd = document.createElement('td');
-      topTd.className = 'time-col';
-      topTd.textContent = problem.top_time ? `${problem.top_time} min` : '-';
+      cells[2].textContent = problem.intermediate_time ? `${problem.intermediate_time} min` : '-';
+      cells[3].textContent = problem.advanced_time ? `${problem.advanced_time} min` : '-';
+      cells[4].textContent = problem.top_time ? `${problem.top_time} min` : '-';
 
-      // Pattern (collapsible)
-      const patternTd = document.createElement('td');
-      patternTd.className = 'pattern-cell';
-
-      const patternBtn = document.createElement('button');
-      patternBtn.className = 'pattern-toggle';
+      const patternBtn = cells[5].firstElementChild;
+      const patternText = patternBtn.nextElementSibling;
       patternBtn.textContent = 'Show';
-      patternBtn.onclick = function() {
-        const textDiv = this.nextElementSibling;
-        textDiv.classList.toggle('visible');
-        this.textContent = textDiv.classList.contains('visible') ? 'Hide' : 'Show';
-      };
-
-      const patternText = document.createElement('div');
-      patternText.className = 'pattern-text';
+      patternText.classList.remove('visible');
       patternText.textContent = problem.pattern || 'N/A';
 
-      patternTd.appendChild(patternBtn);
-      patternTd.appendChild(patternText);
-
-      // Solved checkbox
-      const solvedTd = document.createElement('td');
-      const solvedCheckbox = document.createElement('input');
-      solvedCheckbox.type = 'checkbox';
-      solvedCheckbox.className = 'checkbox-input';
-      solvedCheckbox.checked = problem.solved;
-      solvedCheckbox.onchange = function() {
-        problem.solved = this.checked;
-        if (this.checked && !problem.solved_date) {
-          problem.solved_date = new Date().toISOString();
-          updateSolvedDateDisplay(fileKey, idx);
-        } else if (!this.checked) {
-          problem.solved_date = "";
-          updateSolvedDateDisplay(fileKey, idx);
-        }
-        syncDuplicates(problem.name, 'solved', this.checked);
-        syncDuplicates(problem.name, 'solved_date', problem.solved_date);
-        saveToLocalStorage(fileKey);
-        updateProgress(fileKey);
-        updateOverallProgress();
-        updateRowAwareness(fileKey, idx);
-        updateUrgentBtnState(fileKey);
-      };
-      solvedTd.appendChild(solvedCheckbox);
-
-      // Time to Solve input
-      const timeTd = document.createElement('td');
-      const timeInput = document.createElement('input');
-      timeInput.type = 'number';
-      timeInput.className = 'time-input';
-      timeInput.placeholder = 'Minutes';
-      timeInput.value = problem.time_to_solve;
-      timeInput.oninput = function() {
-        problem.time_to_solve = this.value;
-        syncDuplicates(problem.name, 'time_to_solve', this.value);
-        saveToLocalStorage(fileKey);
-        updateRowAwareness(fileKey, idx);
-      };
-      timeTd.appendChild(timeInput);
-
-      // Comments textarea
-      const commentsTd = document.createElement('td');
-      const commentsInput = document.createElement('textarea');
-      commentsInput.className = 'comments-input';
-      commentsInput.placeholder = 'Add notes...';
-      commentsInput.value = problem.comments || "";
-      commentsInput.oninput = function() {
-        problem.comments = this.value;
-        syncDuplicates(problem.name, 'comments', this.value);
-        saveToLocalStorage(fileKey);
-      };
-      commentsTd.appendChild(commentsInput);
-
-      // Solved Date (display only)
-      const solvedDateTd = document.createElement('td');
-      solvedDateTd.className = 'solved-date';
-      solvedDateTd.dataset.fileKey = fileKey;
-      solvedDateTd.dataset.index = idx;
-      solvedDateTd.textContent = formatRelativeTime(problem.solved_date);
-
-      tr.appendChild(nameTd);
-      tr.appendChild(difficultyTd);
-      tr.appendChild(intermediateTd);
-      tr.appendChild(advancedTd);
-      tr.appendChild(topTd);
-      tr.appendChild(patternTd);
-      tr.appendChild(solvedTd);
-      tr.appendChild(timeTd);
-      tr.appendChild(commentsTd);
-      tr.appendChild(solvedDateTd);
+      cells[6].firstElementChild.checked = problem.solved;
+      cells[7].firstElementChild.value = problem.time_to_solve;
+      cells[8].firstElementChild.value = problem.comments || "";
 
-      return tr;
+      cells[9].dataset.index = idx;
+      cells[9].textContent = formatRelativeTime(problem.solved_date);
+      noteRelativeDate(cells[9], problem.solved_date);
+
+      paintRowAwareness(tr, getRowAwareness(fileKey, idx));
+      tr.classList.toggle('random-highlight', getTableView(fileKey).highlightIdx === idx);
     }
 
-    // Update solved date display
+    // Update solved date display (with the rest of the row, on the next frame)
     function updateSolvedDateDisplay(fileKey, idx) {
-      const cell = document.querySelector(`td.solved-date[data-file-key="${fileKey}"][data-index="${idx}"]`);
-      if (cell) {
-        const problem = PROBLEM_DATA.data[fileKey][idx];
-        cell.textContent = formatRelativeTime(problem.solved_date);
-      }
+      scheduleRowRender(fileKey, idx);
     }
 
     // Format relative time
@@ -443,72 +623,38 @@ def generate_js_core():
 
     // Apply filters
     function applyFilters(fileKey) {
+      if (!isTabHydrated(fileKey)) return;
       const urgentBtn = document.getElementById(`urgent-review-btn-${fileKey}`);
       if (urgentBtn) urgentBtn.classList.remove('active');
 
-      const searchTerm = document.getElementById(`search-${fileKey}`).value.toLowerCase();
-      const difficultyFilter = document.getElementById(`difficulty-filter-${fileKey}`).value;
-      const patternFilter = document.getElementById(`pattern-filter-${fileKey}`).value;
-      const solvedFilter = document.getElementById(`solved-filter-${fileKey}`).value;
-      const colorFilter = document.getElementById(`color-filter-${fileKey}`).value;
-
-      const tbody = document.getElementById(`tbody-${fileKey}`);
-      const rows = tbody.querySelectorAll('tr');
-
-      rows.forEach(row => {
-        const idx = parseInt(row.dataset.index, 10);
-        const problem = PROBLEM_DATA.data[fileKey][idx];
-
-        let show = true;
-
-        // Search filter
-        if (searchTerm && !problem.name.toLowerCase().includes(searchTerm)) {
-          show = false;
-        }
-
-        // Difficulty filter
-        if (difficultyFilter && problem.difficulty !== difficultyFilter) {
-          show = false;
-        }
-
-        // Pattern filter
-        if (patternFilter && problem.pattern !== patternFilter) {
-          show = false;
-        }
-
-        // Solved filter
-        if (solvedFilter === 'solved' && !problem.solved) {
-          show = false;
-        }
-        if (solvedFilter === 'unsolved' && problem.solved) {
-          show = false;
-        }
-
-        // Color filter - check if row has the awareness class
-        if (colorFilter && !row.classList.contains(colorFilter)) {
-          show = false;
-        }
+      const search = document.getElementById(`search-${fileKey}`).value.trim().toLowerCase();
+      const criteria = {
+        search,
+        // Rows the search index says may contain the search text
+        candidates: search ? searchSubstringCandidates(getSearchIndex(), search) : null,
+        difficulty: document.getElementById(`difficulty-filter-${fileKey}`).value,
+        pattern: document.getElementById(`pattern-filter-${fileKey}`).value,
+        solved: document.getElementById(`solved-filter-${fileKey}`).value,
+        // Color uses the row's last computed awareness class
+        color: document.getElementById(`color-filter-${fileKey}`).value
+      };
 
-        row.style.display = show ? '' : 'none';
-      });
+      const view = getTableView(fileKey);
+      view.visible = filterProblemIndexes(
+        getFilterIndex(fileKey),
+        view.order,
+        criteria,
+        idx => getRowAwareness(fileKey, idx).className
+      );
 
+      renderVirtualRows(fileKey);
       updateRandomBtnState(fileKey);
       updateUrgentBtnState(fileKey);
     }
 
-    // Update progress for a tab
+    // Update progress for a tab (drawn on the next frame by js_render_generator.py)
     function updateProgress(fileKey) {
-      const problems = PROBLEM_DATA.data[fileKey];
-      const solved = problems.filter(p => p.solved).length;
-      const total = problems.length;
-      const percentage = total > 0 ? Math.round((solved / total) * 100) : 0;
-
-      const progressBar = document.getElementById(`progress-${fileKey}`);
-      const progressText = document.getElementById(`progress-text-${fileKey}`);
-
-      progressBar.style.width = `${percentage}%`;
-      progressBar.textContent = `${percentage}%`;
-      progressText.textContent = `Solved ${solved} / ${total} problems (${percentage}%)`;
+      scheduleProgressRender(fileKey);
     }
 
     // Update all progress bars
@@ -521,24 +667,7 @@ def generate_js_core():
 
     // Update overall progress (unique problems only)
     function updateOverallProgress() {
-      const uniqueProblems = new Set();
-      const solvedProblems = new Set();
-
-      PROBLEM_DATA.file_list.forEach(fileKey => {
-        PROBLEM_DATA.data[fileKey].forEach(problem => {
-          uniqueProblems.add(problem.name);
-          if (problem.solved) {
-            solvedProblems.add(problem.name);
-          }
-        });
-      });
-
-      const total = uniqueProblems.size;
-      const solved = solvedProblems.size;
-      const percentage = total > 0 ? Math.round((solved / total) * 100) : 0;
-
-      const progressText = document.getElementById('overall-progress-text');
-      progressText.textContent = `Overall: ${solved} / ${total} unique problems (${percentage}%)`;
+      scheduleOverallProgressRender();
     }
 
     // Download file with specified MIME type
@@ -554,49 +683,62 @@ def generate_js_core():
 
     // Pick a random visible problem for the given tab
     function pickRandomProblem(fileKey) {
-      const tbody = document.getElementById(`tbody-${fileKey}`);
-      if (!tbody) return;
-      const visibleRows = Array.from(tbody.querySelectorAll('tr')).filter(
-        row => row.style.display !== 'none'
-      );
+      const view = getTableView(fileKey);
 
-      if (visibleRows.length === 0) {
+      if (view.visible.length === 0) {
         updateRandomBtnState(fileKey);
         return;
       }
 
-      const randomIndex = Math.floor(Math.random() * visibleRows.length);
-      const selectedRow = visibleRows[randomIndex];
+      const position = Math.floor(Math.random() * view.visible.length);
+      highlightProblemRow(fileKey, position);
+    }
+
+    // Scroll to a visible position and briefly highlight its problem
+    function highlightProblemRow(fileKey, position) {
+      const view = getTableView(fileKey);
+      const selectedIdx = view.visible[position];
+
+      // The highlight follows the problem, so it survives row recycling while scrolling
+      view.rows.forEach(r => r.classList.remove('random-highlight'));
+      view.highlightIdx = selectedIdx;
+      scrollToVirtualRow(fileKey, position);
+      const selectedRow = getRenderedRow(fileKey, selectedIdx);
+      if (selectedRow) selectedRow.classList.add('random-highlight');
+      setTimeout(() => {
+        if (view.highlightIdx !== selectedIdx) return;
+        view.highlightIdx = -1;
+        const row = getRenderedRow(fileKey, selectedIdx);
+        if (row) row.classList.remove('random-highlight');
+      }, 4000);
+    }
 
-      Array.from(tbody.querySelectorAll('tr')).forEach(r => r.classList.remove('random-highlight'));
-      selectedRow.scrollIntoView({ behavior: 'smooth', block: 'center' });
-      selectedRow.classList.add('random-highlight');
-      setTimeout(() => selectedRow.classList.remove('random-highlight'), 4000);
+    // Reset every filter of a tab (including urgent review) and show all rows
+    function clearFilters(fileKey) {
+      ['search', 'difficulty-filter', 'pattern-filter', 'solved-filter', 'color-filter'].forEach(prefix => {
+        const input = document.getElementById(`${prefix}-${fileKey}`);
+        if (input) input.value = '';
+      });
+      const urgentBtn = document.getElementById(`urgent-review-btn-${fileKey}`);
+      if (urgentBtn) urgentBtn.classList.remove('active');
+      applyFilters(fileKey);
+      updateProgress(fileKey);
+      if (typeof saveFilterState === 'function') saveFilterState(fileKey);
     }
 
     // Enable or disable the random button based on visible row count
     function updateRandomBtnState(fileKey) {
-      const btn = document.getElementById(`random-btn-${fileKey}`);
-      if (!btn) return;
-      const tbody = document.getElementById(`tbody-${fileKey}`);
-      if (!tbody) { btn.disabled = true; return; }
-      const visibleRows = Array.from(tbody.querySelectorAll('tr')).filter(
-        row => row.style.display !== 'none'
-      );
-      btn.disabled = visibleRows.length === 0;
+      scheduleButtonRender(fileKey);
     }
 
     // Calculate days until a problem starts flashing (awareness-flashing)
-    // Returns 0 if already flashing, Infinity if not solved or no date
-    function calculateDaysUntilFlashing(problem) {
+    // Returns 0 if already flashing, Infinity if not solved or no date.
+    // Pass the problem's awareness result when it has already been computed.
+    function calculateDaysUntilFlashing(problem, result = calculateAwarenessScore(problem)) {
       if (!problem.solved) return Infinity;
-      const result = calculateAwarenessScore(problem);
       if (result.score < 0) return Infinity;
       if (result.score >= AWARENESS_CONFIG.thresholds.darkRed) return 0;
-      const commitmentFactor = getCommitmentFactor();
-      const tierDiffMultiplier = getTierDifficultyMultiplier(problem);
-      const solvedFactor = getSolvedFactor(problem);
-      const dailyRate = AWARENESS_CONFIG.baseRate * commitmentFactor * tierDiffMultiplier / solvedFactor;
+      const dailyRate = getAwarenessDailyRate(problem);
       if (dailyRate <= 0) return Infinity;
       const daysNeeded = (AWARENESS_CONFIG.thresholds.darkRed - result.score) / dailyRate;
       return Math.ceil(daysNeeded);
@@ -612,56 +754,39 @@ def generate_js_core():
         return;
       }
 
-      const TIER_RANK = { 'awareness-flashing': 5, 'awareness-dark-red': 4, 'awareness-red': 3, 'awareness-yellow': 2, 'awareness-green': 1, 'awareness-white': 0, 'unsolved-problem': -1 };
       const problems = PROBLEM_DATA.data[fileKey];
-      const tbody = document.getElementById(`tbody-${fileKey}`);
-      if (!tbody) return;
-
-      const solvedProblems = problems
-        .map((problem, idx) => {
-          const days = calculateDaysUntilFlashing(problem);
-          if (days === Infinity) return null;
-          const scoreResult = calculateAwarenessScore(problem);
-          const tier = TIER_RANK[getAwarenessClass(scoreResult.score)] || 0;
-          return { idx, days, tier };
-        })
-        .filter(item => item !== null);
-
-      if (solvedProblems.length === 0) return;
-
-      const maxTier = Math.max(...solvedProblems.map(item => item.tier));
-      const globalMinDays = Math.min(...solvedProblems.map(item => item.days));
-      const urgentIndices = new Set(
-        solvedProblems.filter(item => item.tier === maxTier || item.days === globalMinDays).map(item => item.idx)
-      );
-
-      const rows = tbody.querySelectorAll('tr');
-      rows.forEach(row => {
-        const idx = parseInt(row.dataset.index, 10);
-        row.style.display = urgentIndices.has(idx) ? '' : 'none';
+      const view = TABLE_VIEWS[fileKey];
+      if (!view) return;
+
+      // Ranked by the scoring worker (js_scoring_generator.py) when available
+      return runScoring('urgent', { problems: problems.map(compactScoringProblem) }).then(ranking => {
+        // Skip if there is nothing to review or the tab was rebuilt meanwhile
+        if (!ranking || TABLE_VIEWS[fileKey] !== view || PROBLEM_DATA.data[fileKey] !== problems) return;
+        showUrgentProblems(fileKey, new Set(ranking.indices), ranking.globalMinDays);
       });
+    }
+
+    // Show only the ranked rows and report when they start flashing
+    function showUrgentProblems(fileKey, urgentIndices, globalMinDays) {
+      const btn = document.getElementById(`urgent-review-btn-${fileKey}`);
+      const view = TABLE_VIEWS[fileKey];
+      view.visible = view.order.filter(idx => urgentIndices.has(idx));
+      renderVirtualRows(fileKey);
 
       if (btn) btn.classList.add('active');
       updateRandomBtnState(fileKey);
       updateUrgentBtnState(fileKey);
 
       const count = urgentIndices.size;
-      const statusEl = document.getElementById(`progress-text-${fileKey}`);
-      if (statusEl) {
-        const msg = globalMinDays === 0
-          ? `${count} problem(s) flashing NOW`
-          : `${count} problem(s) flashing in ${globalMinDays} day(s)`;
-        statusEl.textContent = msg;
-      }
+      const msg = globalMinDays === 0
+        ? `${count} problem(s) flashing NOW`
+        : `${count} problem(s) flashing in ${globalMinDays} day(s)`;
+      scheduleProgressRender(fileKey, msg);
     }
 
     // Enable or disable the urgent-review button based on solved problems in tab
     function updateUrgentBtnState(fileKey) {
-      const btn = document.getElementById(`urgent-review-btn-${fileKey}`);
-      if (!btn) return;
-      const problems = PROBLEM_DATA.data[fileKey];
-      const hasSolved = problems.some(p => p.solved);
-      btn.disabled = !hasSolved;
+      scheduleButtonRender(fileKey);
     }
 
     // Sort support
@@ -691,22 +816,88 @@ def generate_js_core():
       }
     }
 
-    function getSortedProblems(fileKey) {
-      const problems = [...PROBLEM_DATA.data[fileKey]];
+    // Sort keys are computed once per column and sorted orders are kept per
+    // column and direction, so sorting never parses values in the comparator
+    // and switching back to a sort already seen reuses its order. Editing a
+    // user field drops that column's keys and orders; renderTable (called
+    // when a list's rows change) drops the whole list's cache.
+
+    // Columns whose values the user edits
+    const SORT_USER_COLUMNS = ['time_to_solve', 'solved_date'];
+
+    // fileKey -> { problems, length, keys: { column: [key] }, orders: { 'column:direction': [idx] } }
+    const SORT_CACHE = {};
+
+    function computeSortKeys(problems, column) {
+      return problems.map(problem => getSortValue(problem, column));
+    }
+
+    // Problem indexes ordered by key; empty keys last, ties in list order
+    function sortIndexesByKeys(keys, direction) {
+      const asc = direction === 'asc' ? 1 : -1;
+      const indexes = keys.map((key, idx) => idx);
+      return indexes.sort((a, b) => {
+        const va = keys[a];
+        const vb = keys[b];
+        if (va === null || vb === null) {
+          if (va !== vb) return va === null ? 1 : -1;
+          return a - b;
+        }
+        if (va < vb) return -asc;
+        if (va > vb) return asc;
+        return a - b;
+      });
+    }
+
+    function getSortCache(fileKey) {
+      const problems = PROBLEM_DATA.data[fileKey];
+      const cache = SORT_CACHE[fileKey];
+      if (cache && cache.problems === problems && cache.length === problems.length) return cache;
+      SORT_CACHE[fileKey] = { problems, length: problems.length, keys: {}, orders: {} };
+      return SORT_CACHE[fileKey];
+    }
+
+    function resetSortCache(fileKey) {
+      delete SORT_CACHE[fileKey];
+    }
+
+    // Drop keys and orders of an edited column (called by setProblemField)
+    function invalidateSortColumn(field) {
+      if (!SORT_USER_COLUMNS.includes(field)) return;
+      Object.keys(SORT_CACHE).forEach(fileKey => {
+        const cache = SORT_CACHE[fileKey];
+        delete cache.keys[field];
+        delete cache.orders[`${field}:asc`];
+        delete cache.orders[`${field}:desc`];
+      });
+    }
+
+    // Problem indexes of a tab in its current sort order (shared, do not modify)
+    function getSortedOrder(fileKey) {
+      const problems = PROBLEM_DATA.data[fileKey];
       const state = sortState[fileKey];
-      if (!state || !state.column || state.direction === 'none') return problems;
+      if (!state || !state.column || state.direction === 'none') return problems.map((problem, idx) => idx);
+
       const { column, direction } = state;
-      const asc = direction === 'asc';
-      return problems.sort((a, b) => {
-        const va = getSortValue(a, column);
-        const vb = getSortValue(b, column);
-        if (va === null && vb === null) return 0;
-        if (va === null) return 1;
-        if (vb === null) return -1;
-        if (va < vb) return asc ? -1 : 1;
-        if (va > vb) return asc ? 1 : -1;
-        return 0;
-      });
+      const cache = getSortCache(fileKey);
+      const orderKey = `${column}:${direction}`;
+      if (!cache.orders[orderKey]) {
+        if (!cache.keys[column]) cache.keys[column] = computeSortKeys(problems, column);
+        cache.orders[orderKey] = sortIndexesByKeys(cache.keys[column], direction);
+      }
+      return cache.orders[orderKey];
+    }
+
+    // Re-sort a tab keeping its filter: the shown rows are reordered and the
+    // rendered row elements are moved rather than rebuilt
+    function applySort(fileKey) {
+      if (!isTabHydrated(fileKey)) return;
+      const view = getTableView(fileKey);
+      const shown = new Uint8Array(PROBLEM_DATA.data[fileKey].length);
+      view.visible.forEach(idx => { shown[idx] = 1; });
+      view.order = getSortedOrder(fileKey);
+      view.visible = view.order.filter(idx => shown[idx] === 1);
+      renderVirtualRows(fileKey);
     }
 
     function saveSortStateForTab(fileKey) {
@@ -745,7 +936,7 @@ def generate_js_core():
           sortState[fileKey] = { column: col, direction: nextDir };
           saveSortStateForTab(fileKey);
           updateSortHeaders(fileKey);
-          renderTable(fileKey);
+          applySort(fileKey);
         });
       });
       updateSortHeaders(fileKey);
@@ -770,17 +961,6 @@ def generate_js_core():
         }
       });
     }
-
-    // Update relative times periodically
-    setInterval(() => {
-      PROBLEM_DATA.file_list.forEach(fileKey => {
-        PROBLEM_DATA.data[fileKey].forEach((problem, idx) => {
-          if (problem.solved_date) {
-            updateSolvedDateDisplay(fileKey, idx);
-          }
-        });
-      });
-    }, 60000); // Update every minute
     """
 
     return js
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Problem Data Generator
+Embeds the compact problem data payload, the browser-side decoder and the
+problem registry that holds one user-state record per unique problem.
+"""
+
+from data_payload import encode_problem_data, payload_to_js_literal
+
+
+def generate_js_data(parsed_data):
+    """Generate PROBLEM_DATA, DUPLICATE_MAP, the problem registry and locations.
+
+    The payload is decoded at page load into the same shape as
+    parsed_data.json. Each list's problem objects are only built the first
+    time PROBLEM_DATA.data[fileKey] is read. Their user fields are accessors
+    onto PROBLEM_STATE, so every list containing a problem shares its state.
+    PROBLEM_LOCATIONS maps each problem name to its (fileKey, idx) rows.
+    """
+    payload = payload_to_js_literal(encode_problem_data(parsed_data))
+    return (
+        """
+// === Problem Registry ===
+// One user-state record per unique problem, keyed by canonical problem ID.
+// Every list row for the same problem reads and writes that record.
+
+const PROBLEM_STATE_KEY = 'tracker_problem_state';
+const PROBLEM_STATE_VERSION = 1;
+const PROBLEM_STATE_FIELDS = ['solved', 'time_to_solve', 'comments', 'solved_date'];
+// importedAt is shared between lists like the fields above but never persisted
+const PROBLEM_SHARED_FIELDS = PROBLEM_STATE_FIELDS.concat(['importedAt']);
+const PROBLEM_STATE = {};
+const PROBLEM_NAMES = {};
+// Problems changed locally since the last cloud upload (saved under
+// DIRTY_PROBLEM_IDS_KEY with the registry so a reload still uploads them)
+const DIRTY_PROBLEM_IDS_KEY = 'tracker_cloud_dirty';
+const DIRTY_PROBLEM_IDS = new Set();
+// Problems changed since progress was last written to local storage
+const UNSAVED_PROBLEM_IDS = new Set();
+
+function defaultProblemState() {
+  return { solved: false, time_to_solve: '', comments: '', solved_date: '' };
+}
+
+function hasProblemProgress(state) {
+  return !!(state.solved || state.time_to_solve || state.comments || state.solved_date);
+}
+
+function getProblemState(id) {
+  if (!PROBLEM_STATE[id]) PROBLEM_STATE[id] = defaultProblemState();
+  return PROBLEM_STATE[id];
+}
+
+function problemIdForName(name) {
+  return PROBLEM_ID_BY_NAME[name] || `name:${name}`;
+}
+
+function setProblemField(id, field, value) {
+  const state = getProblemState(id);
+  const previous = state[field];
+  if (previous === value) return;
+  state[field] = value;
+  if (PROBLEM_STATE_FIELDS.includes(field)) {
+    DIRTY_PROBLEM_IDS.add(id);
+    UNSAVED_PROBLEM_IDS.add(id);
+  }
+  if (field === 'comments' && typeof updateSearchComments === 'function') {
+    updateSearchComments(id, value);
+  }
+  if (field === 'solved' && typeof updateUniqueSolvedCount === 'function') {
+    updateUniqueSolvedCount(previous, value);
+  }
+  if (field === 'solved' && typeof updateProgressCounts === 'function') {
+    updateProgressCounts(id, previous, value);
+  }
+  if (typeof invalidateSortColumn === 'function') invalidateSortColumn(field);
+  if (typeof updateReviewQueue === 'function') updateReviewQueue(id, field);
+}
+
+/**
+ * Turn a problem's user fields into accessors onto its registry record.
+ * Values already on the object fill the record's empty fields, or replace
+ * the record's values when overwrite is set (used for imports).
+ */
+function bindProblemState(problem, id, overwrite) {
+  const state = getProblemState(id);
+  PROBLEM_SHARED_FIELDS.forEach(field => {
+    if (!Object.prototype.hasOwnProperty.call(problem, field)) return;
+    if (overwrite || (problem[field] && !state[field])) {
+      setProblemField(id, field, problem[field]);
+    }
+  });
+  PROBLEM_NAMES[id] = problem.name;
+  Object.defineProperty(problem, 'id', { value: id, writable: true, enumerable: true, configurable: true });
+  PROBLEM_SHARED_FIELDS.forEach(field => {
+    Object.defineProperty(problem, field, {
+      enumerable: true,
+      configurable: true,
+      get() { return state[field]; },
+      set(value) { setProblemField(id, field, value); }
+    });
+  });
+  return problem;
+}
+
+function serializeProblemState() {
+  const problems = {};
+  Object.keys(PROBLEM_STATE).forEach(id => {
+    const state = PROBLEM_STATE[id];
+    if (hasProblemProgress(state)) {
+      problems[id] = {
+        solved: state.solved,
+        time_to_solve: state.time_to_solve,
+        comments: state.comments,
+        solved_date: state.solved_date
+      };
+    }
+  });
+  return { version: PROBLEM_STATE_VERSION, problems };
+}
+
+function restoreProblemState(saved) {
+  if (!saved || typeof saved.problems !== 'object' || saved.problems === null) return false;
+  Object.keys(saved.problems).forEach(id => {
+    const item = saved.problems[id];
+    if (!item) return;
+    const state = getProblemState(id);
+    state.solved = item.solved || false;
+    state.time_to_solve = item.time_to_solve || '';
+    state.comments = item.comments || '';
+    state.solved_date = item.solved_date || '';
+  });
+  if (typeof resetUniqueSolvedCount === 'function') resetUniqueSolvedCount();
+  if (typeof resetProgressCounts === 'function') resetProgressCounts();
+  return true;
+}
+
+/**
+ * Merge the old per-list saves (tracker_<fileKey>, arrays keyed by name) into
+ * the registry. A field is taken from the first list that has a value for it.
+ */
+function migrateLegacyProgress(fileList, readList) {
+  let migrated = false;
+  fileList.forEach(fileKey => {
+    const savedData = readList(fileKey);
+    if (!Array.isArray(savedData)) return;
+    savedData.forEach(item => {
+      if (!item || !item.name) return;
+      const state = getProblemState(problemIdForName(item.name));
+      PROBLEM_STATE_FIELDS.forEach(field => {
+        if (!state[field] && item[field]) state[field] = item[field];
+      });
+      migrated = true;
+    });
+  });
+  if (migrated && typeof resetUniqueSolvedCount === 'function') resetUniqueSolvedCount();
+  if (migrated && typeof resetProgressCounts === 'function') resetProgressCounts();
+  return migrated;
+}
+
+// === Problem Data ===
+
+const PAYLOAD_INTERNED_FIELDS = ['difficulty', 'intermediate_time', 'advanced_time', 'top_time', 'pattern'];
+const PAYLOAD_STATIC_FIELDS = ['name', 'difficulty', 'intermediate_time', 'advanced_time', 'top_time', 'pattern', 'link'];
+
+function expandPayloadProblem(payload, ref, overrides) {
+  const problem = {};
+  PAYLOAD_STATIC_FIELDS.forEach(field => {
+    const value = payload.problems[field][ref];
+    problem[field] = PAYLOAD_INTERNED_FIELDS.includes(field) ? payload.strings[value] : value;
+  });
+  if (overrides) Object.assign(problem, overrides);
+  return bindProblemState(problem, payload.problems.id[ref] || problemIdForName(problem.name));
+}
+
+function defineLazyList(data, fileKey, build) {
+  const define = value => Object.defineProperty(data, fileKey, {
+    value, writable: true, enumerable: true, configurable: true
+  });
+  Object.defineProperty(data, fileKey, {
+    enumerable: true,
+    configurable: true,
+    get() {
+      const problems = build();
+      define(problems);
+      return problems;
+    },
+    set(value) {
+      define(value);
+    }
+  });
+}
+
+// Record that list fileKey holds a problem at row idx and return the
+// problem's locations. A name repeated within one list keeps its first row.
+function addNameLocation(locations, name, fileKey, idx) {
+  if (!locations.has(name)) locations.set(name, []);
+  const entries = locations.get(name);
+  if (!entries.some(entry => entry.fileKey === fileKey)) entries.push({ fileKey, idx });
+  return entries;
+}
+
+function findLocationIndex(locations, fileKey, name) {
+  const entry = (locations.get(name) || []).find(item => item.fileKey === fileKey);
+  return entry ? entry.idx : -1;
+}
+
+function decodeProblemData(payload) {
+  const data = {};
+  const duplicateMap = {};
+  const idsByName = {};
+  const locations = new Map();
+
+  payload.file_list.forEach(fileKey => {
+    const refs = payload.lists[fileKey];
+    const overrides = payload.state[fileKey] || {};
+    defineLazyList(data, fileKey, () => refs.map((ref, row) => expandPayloadProblem(payload, ref, overrides[row])));
+
+    refs.forEach((ref, row) => {
+      const name = payload.problems.name[ref];
+      addNameLocation(locations, name, fileKey, row);
+      if (payload.problems.id[ref] && !idsByName[name]) idsByName[name] = payload.problems.id[ref];
+    });
+  });
+
+  locations.forEach((entries, name) => {
+    if (entries.length > 1) duplicateMap[name] = entries.map(entry => entry.fileKey);
+  });
+
+  return {
+    data,
+    duplicate_map: duplicateMap,
+    file_list: payload.file_list.slice(),
+    ids_by_name: idsByName,
+    problem_locations: locations
+  };
+}
+
+const PROBLEM_DATA = decodeProblemData(JSON.parse("""
+        + payload
+        + """));
+const DUPLICATE_MAP = PROBLEM_DATA.duplicate_map;
+const PROBLEM_ID_BY_NAME = PROBLEM_DATA.ids_by_name;
+
+// === Problem Locations ===
+// Problem name -> [{ fileKey, idx }] for every list row holding it, so lookups
+// by name never scan the lists. Built by the decoder and extended whenever a
+// list is created or grows; DUPLICATE_MAP is kept in step.
+const PROBLEM_LOCATIONS = PROBLEM_DATA.problem_locations;
+
+function addProblemLocation(name, fileKey, idx) {
+  const entries = addNameLocation(PROBLEM_LOCATIONS, name, fileKey, idx);
+  if (entries.length > 1) DUPLICATE_MAP[name] = entries.map(entry => entry.fileKey);
+}
+
+function indexProblemList(fileKey, problems) {
+  problems.forEach((problem, idx) => addProblemLocation(problem.name, fileKey, idx));
+}
+
+function getProblemLocations(name) {
+  return PROBLEM_LOCATIONS.get(name) || [];
+}
+
+function findProblemIndex(fileKey, name) {
+  return findLocationIndex(PROBLEM_LOCATIONS, fileKey, name);
+}
+"""
+    )
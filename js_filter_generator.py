@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Filter Engine Sub-Agent
+Precomputed per-tab filter keys and bitsets used by applyFilters
+"""
+
+
+def generate_js_filter():
+    """Generate JavaScript filter engine"""
+
+    js = """
+    // === Filter Engine ===
+    // Each tab gets a filter index with lowercase names and patterns and one
+    // bitset per difficulty, per pattern and for solved status. A filter pass
+    // ANDs the selected bitsets and then checks the search text (and color)
+    // only for rows still set in the mask. The tab search matches its own rows
+    // by substring, checking only the candidates the search index yields;
+    // ranked and fuzzy matching is left to the global search view.
+
+    const FILTER_INDEXES = {};
+
+    function createBitset(size) {
+      return new Uint32Array((size + 31) >>> 5);
+    }
+
+    function bitsetSet(bits, i) {
+      bits[i >>> 5] |= 1 << (i & 31);
+    }
+
+    function bitsetClear(bits, i) {
+      bits[i >>> 5] &= ~(1 << (i & 31));
+    }
+
+    function bitsetHas(bits, i) {
+      return (bits[i >>> 5] & (1 << (i & 31))) !== 0;
+    }
+
+    function buildFilterIndex(problems) {
+      const size = problems.length;
+      const index = {
+        size,
+        problems,
+        names: new Array(size),
+        patterns: new Array(size),
+        all: createBitset(size),
+        solved: createBitset(size),
+        difficulty: {},
+        pattern: {}
+      };
+      const addToGroup = (groups, key, idx) => {
+        if (!groups[key]) groups[key] = createBitset(size);
+        bitsetSet(groups[key], idx);
+      };
+
+      problems.forEach((problem, idx) => {
+        index.names[idx] = (problem.name || '').toLowerCase();
+        index.patterns[idx] = (problem.pattern || '').toLowerCase();
+        bitsetSet(index.all, idx);
+        addToGroup(index.difficulty, problem.difficulty, idx);
+        addToGroup(index.pattern, problem.pattern, idx);
+        if (problem.solved) bitsetSet(index.solved, idx);
+      });
+      return index;
+    }
+
+    function getFilterIndex(fileKey) {
+      if (!FILTER_INDEXES[fileKey]) {
+        FILTER_INDEXES[fileKey] = buildFilterIndex(PROBLEM_DATA.data[fileKey]);
+      }
+      return FILTER_INDEXES[fileKey];
+    }
+
+    // Drop a tab's index after its problem list changed; rebuilt on next use
+    function invalidateFilterIndex(fileKey) {
+      delete FILTER_INDEXES[fileKey];
+    }
+
+    // Refresh the mutable (status) bits of one row after its problem changed
+    function updateFilterIndexRow(fileKey, idx) {
+      const index = FILTER_INDEXES[fileKey];
+      if (!index || idx >= index.size) return;
+      if (PROBLEM_DATA.data[fileKey][idx].solved) {
+        bitsetSet(index.solved, idx);
+      } else {
+        bitsetClear(index.solved, idx);
+      }
+    }
+
+    // AND together the bitsets selected by the difficulty, pattern and status criteria
+    function computeFilterMask(index, criteria) {
+      const mask = index.all.slice();
+      const intersect = bits => {
+        if (!bits) {
+          mask.fill(0);
+          return;
+        }
+        for (let i = 0; i < mask.length; i++) mask[i] &= bits[i];
+      };
+
+      if (criteria.difficulty) intersect(index.difficulty[criteria.difficulty]);
+      if (criteria.pattern) intersect(index.pattern[criteria.pattern]);
+      if (criteria.solved === 'solved') {
+        intersect(index.solved);
+      } else if (criteria.solved === 'unsolved') {
+        for (let i = 0; i < mask.length; i++) mask[i] &= ~index.solved[i];
+      }
+      return mask;
+    }
+
+    // Whether a row's name, pattern or comments contain the (lowercase) search text
+    function rowMatchesSearch(index, idx, search) {
+      if (index.names[idx].includes(search) || index.patterns[idx].includes(search)) return true;
+      const comments = index.problems[idx].comments;
+      return !!comments && comments.toLowerCase().includes(search);
+    }
+
+    /**
+     * Filter a tab's row order down to the rows matching the criteria.
+     * criteria: { search (lowercase), candidates, difficulty, pattern, solved, color };
+     * empty values match everything. candidates is the Set of problem IDs
+     * that may match the search (see searchSubstringCandidates), or null to
+     * check every row. getColorClass(idx) returns a row's
+     * awareness class and is only called for rows passing the other filters.
+     */
+    function filterProblemIndexes(index, order, criteria, getColorClass) {
+      const mask = computeFilterMask(index, criteria);
+      const visible = [];
+      for (let i = 0; i < order.length; i++) {
+        const idx = order[i];
+        if (!bitsetHas(mask, idx)) continue;
+        if (criteria.candidates && !criteria.candidates.has(index.problems[idx].id)) continue;
+        if (criteria.search && !rowMatchesSearch(index, idx, criteria.search)) continue;
+        if (criteria.color && getColorClass(idx) !== criteria.color) continue;
+        visible.push(idx);
+      }
+      return visible;
+    }
+    """
+
+    return js
+
+
+if __name__ == "__main__":
+    print(generate_js_filter())
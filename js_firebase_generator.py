@@ -662,7 +662,9 @@ def generate_js_firebase(firebase_config=None):
     }
 
     /**
-     * Sync a specific file's problems to cloud
+     * Upload the problems changed since the last upload
+     * Each unique problem is written once, however many lists contain it, and
+     * un-solving a problem is uploaded too. The fileKey only names the queue entry.
      * Includes rate limiting to prevent quota exhaustion
      */
     async function syncFileToCloud(fileKey) {
@@ -678,40 +680,56 @@ def generate_js_firebase(firebase_config=None):
 
       updateSyncStatusUI('syncing');
 
+      const dirtyIds = Array.from(DIRTY_PROBLEM_IDS);
+      DIRTY_PROBLEM_IDS.clear();
+
       try {
-        const problems = PROBLEM_DATA.data[fileKey];
-        const batch = firebaseDb.batch();
         const userRef = firebaseDb.collection('users').doc(currentUser.uid);
+        let batch = firebaseDb.batch();
+        let batchCount = 0;
         let writeCount = 0;
 
-        for (const problem of problems) {
-          if (problem.solved || problem.time_to_solve || problem.comments) {
-            const docId = sanitizeProblemName(problem.name);
-            const docRef = userRef.collection('progress').doc(docId);
-
-            batch.set(docRef, {
-              name: problem.name,
-              solved: problem.solved || false,
-              time_to_solve: problem.time_to_solve || '',
-              comments: problem.comments || '',
-              solved_date: problem.solved_date || '',
-              updatedAt: firebase.firestore.FieldValue.serverTimestamp(),
-              updatedFrom: 'web',
-              updatedFromDevice: DEVICE_ID
-            }, { merge: true });
-            writeCount++;
+        for (const id of dirtyIds) {
+          const state = PROBLEM_STATE[id];
+          const name = PROBLEM_NAMES[id];
+          if (!state || !name) continue;
+
+          const docRef = userRef.collection('progress').doc(sanitizeProblemName(name));
+          batch.set(docRef, {
+            name: name,
+            solved: state.solved || false,
+            time_to_solve: state.time_to_solve || '',
+            comments: state.comments || '',
+            solved_date: state.solved_date || '',
+            updatedAt: firebase.firestore.FieldValue.serverTimestamp(),
+            updatedFrom: 'web',
+            updatedFromDevice: DEVICE_ID
+          }, { merge: true });
+          batchCount++;
+          writeCount++;
+
+          if (batchCount >= FIRESTORE_BATCH_SIZE_LIMIT) {
+            await batch.commit();
+            batch = firebaseDb.batch();
+            batchCount = 0;
           }
         }
 
-        if (writeCount > 0) {
+        if (batchCount > 0) {
           await batch.commit();
+        }
+        if (writeCount > 0) {
           lastWriteTime = Date.now();
-          console.log('Synced', writeCount, 'problems for', fileKey);
+          console.log('Synced', writeCount, 'changed problems');
         }
 
         pendingChanges.delete(fileKey);
+        saveDirtyProblemIds();
         updateSyncStatusUI('synced');
       } catch (error) {
+        // Keep the changes queued for the next upload
+        dirtyIds.forEach(id => DIRTY_PROBLEM_IDS.add(id));
+        saveDirtyProblemIds();
         console.error('Sync to cloud failed:', error);
         if (isQuotaExceededError(error)) {
           console.warn('Firebase quota exceeded. Uploads paused. Cached reads still work.');
@@ -946,22 +964,31 @@ def generate_js_firebase(firebase_config=None):
         });
         console.log('Cloud problems with solved=true:', solvedCount);
 
-        // Merge with local data
+        // Merge with local data (once per unique problem; lists share its state)
         const conflicts = [];
+        const mergedIds = new Set();
 
         for (const fileKey of PROBLEM_DATA.file_list) {
           const problems = PROBLEM_DATA.data[fileKey];
 
           for (let idx = 0; idx < problems.length; idx++) {
             const problem = problems[idx];
+            const problemId = problem.id || problem.name;
+            if (mergedIds.has(problemId)) continue;
+            mergedIds.add(problemId);
             const cloud = cloudData[problem.name];
 
+            // Local progress the cloud lacks is queued for upload
+            if (!cloud && problem.id && hasProblemProgress(getProblemState(problem.id))) {
+              DIRTY_PROBLEM_IDS.add(problem.id);
+            }
+
             if (cloud) {
               // Check for conflicts
               const conflict = detectSyncConflict(problem, cloud);
 
               if (conflict.cleanupImportedAt) {
-                delete problem.importedAt;
+                problem.importedAt = undefined;
                 saveToLocalStorage(fileKey);
               }
 
@@ -978,12 +1005,22 @@ def generate_js_firebase(firebase_config=None):
                 console.log('Applying cloud data for:', problem.name, '| solved:', cloud.solved);
                 applyCloudData(problem, cloud);
                 saveToLocalStorage(fileKey);
+              } else if (conflict.winner === 'local' && problem.id) {
+                // Local is newer: keep it and queue it for upload
+                DIRTY_PROBLEM_IDS.add(problem.id);
               }
-              // If winner is 'local' or no winner, keep local data
+              // With no winner, keep local data
             }
           }
         }
 
+        // Upload local changes the cloud is missing (including ones queued
+        // before a reload, an offline period or a failed upload)
+        if (DIRTY_PROBLEM_IDS.size > 0) {
+          saveDirtyProblemIds();
+          syncToCloudDebounced(currentTab);
+        }
+
         // Handle conflicts
         if (conflicts.length > 0) {
           showSyncConflictDialog(conflicts);
@@ -1029,6 +1066,8 @@ def generate_js_firebase(firebase_config=None):
       problem.time_to_solve = cloud.time_to_solve || '';
       problem.comments = cloud.comments || '';
       problem.solved_date = cloud.solved_date || '';
+      // Already matches the cloud, so there is nothing to upload
+      if (problem.id) DIRTY_PROBLEM_IDS.delete(problem.id);
     }
 
     /**
@@ -1132,32 +1171,28 @@ def generate_js_firebase(firebase_config=None):
         return;
       }
 
-      const problemName = cloudData.name;
-
-      // Find and update all instances of this problem
-      for (const fileKey of PROBLEM_DATA.file_list) {
-        const problems = PROBLEM_DATA.data[fileKey];
-        const idx = problems.findIndex(p => p.name === problemName);
+      const locations = getProblemLocations(cloudData.name);
+      if (locations.length > 0) {
+        // Every location reads the same registry record, so the state is applied once
+        const problem = PROBLEM_DATA.data[locations[0].fileKey][locations[0].idx];
 
-        if (idx !== -1) {
-          const problem = problems[idx];
+        // Update if cloud is newer (compare timestamps)
+        const localDate = problem.solved_date ? new Date(problem.solved_date) : new Date(0);
+        const cloudDate = cloudData.updatedAt ? cloudData.updatedAt.toDate() : new Date(0);
 
-          // Update if cloud is newer (compare timestamps)
-          const localDate = problem.solved_date ? new Date(problem.solved_date) : new Date(0);
-          const cloudDate = cloudData.updatedAt ? cloudData.updatedAt.toDate() : new Date(0);
+        if (cloudDate > localDate || !problem.solved_date) {
+          applyCloudData(problem, cloudData);
+          saveToLocalStorage(locations[0].fileKey);
 
-          if (cloudDate > localDate || !problem.solved_date) {
-            applyCloudData(problem, cloudData);
-            saveToLocalStorage(fileKey);
-
-            // Update DOM
+          // Only each location's row and list progress need repainting
+          for (const { fileKey, idx } of locations) {
+            if (typeof updateFilterIndexRow === 'function') {
+              updateFilterIndexRow(fileKey, idx);
+            }
+            // Schedules a render of the whole row, so one field covers all three
             if (typeof updateDOMField === 'function') {
               updateDOMField(fileKey, idx, 'solved', problem.solved);
-              updateDOMField(fileKey, idx, 'time_to_solve', problem.time_to_solve);
-              updateDOMField(fileKey, idx, 'comments', problem.comments);
             }
-
-            // Update awareness and progress
             if (typeof updateRowAwareness === 'function') {
               updateRowAwareness(fileKey, idx);
             }
@@ -939,7 +939,7 @@ def generate_js_import_export():
       const conflicts = [];
 
       importedData.forEach((imported, importIdx) => {
-        const existingIdx = existingData.findIndex(e => e.name === imported.name);
+        const existingIdx = findProblemIndex(fileKey, imported.name);
 
         if (existingIdx !== -1) {
           const existing = existingData[existingIdx];
@@ -998,7 +998,7 @@ def generate_js_import_export():
       const importedNames = new Set();
 
       importedData.forEach(imported => {
-        const existingIdx = existingData.findIndex(e => e.name === imported.name);
+        const existingIdx = findProblemIndex(fileKey, imported.name);
         const resolution = resolutions[imported.name] || 'overwrite';
 
         // Track this problem name for cloud sync (even if skipped, we want to ensure cloud matches)
@@ -1051,7 +1051,9 @@ def generate_js_import_export():
             solved_date: imported.solved_date || '',
             importedAt: new Date().toISOString()
           };
-          existingData.push(newProblem);
+          // Imported values replace any progress the problem has in other lists
+          existingData.push(bindProblemState(newProblem, problemIdForName(newProblem.name), true));
+          addProblemLocation(newProblem.name, fileKey, existingData.length - 1);
           addedCount++;
         }
       });
@@ -1060,9 +1062,16 @@ def generate_js_import_export():
       saveToLocalStorage(fileKey);
       syncAfterImport(fileKey);
       renderTable(fileKey);
+      // Difficulty and pattern may have been edited in place
+      resetProgressCounts();
       updateProgress(fileKey);
       updateOverallProgress();
 
+      // Tier times and difficulty may have been edited in place too: drop
+      // every cached tier and rebuild the review queue on next use
+      if ((mode === 'problems' || mode === 'full') && typeof invalidateAwarenessConfig === 'function') {
+        invalidateAwarenessConfig();
+      }
       if (typeof updateAwarenessColors === 'function') {
         updateAwarenessColors();
       }
@@ -1155,7 +1164,8 @@ def generate_js_import_export():
       }
 
       // Add to PROBLEM_DATA
-      PROBLEM_DATA.data[fileKey] = validProblems.map(p => ({
+      // Problems already in other lists keep their progress; new values only fill gaps
+      PROBLEM_DATA.data[fileKey] = validProblems.map(p => bindProblemState({
         name: p.name.trim(),
         difficulty: p.difficulty || 'Medium',
         intermediate_time: p.intermediate_time || '',
@@ -1166,21 +1176,11 @@ def generate_js_import_export():
         time_to_solve: p.time_to_solve || '',
         comments: p.comments || '',
         solved_date: p.solved_date || ''
-      }));
+      }, problemIdForName(p.name.trim())));
       PROBLEM_DATA.file_list.push(fileKey);
 
-      // Update duplicate map
-      validProblems.forEach(p => {
-        const existingFiles = [];
-        PROBLEM_DATA.file_list.forEach(fk => {
-          if (PROBLEM_DATA.data[fk].some(prob => prob.name === p.name)) {
-            existingFiles.push(fk);
-          }
-        });
-        if (existingFiles.length > 1) {
-          DUPLICATE_MAP[p.name] = existingFiles;
-        }
-      });
+      // Index the new rows by name (also updates the duplicate map)
+      indexProblemList(fileKey, PROBLEM_DATA.data[fileKey]);
 
       // Dynamically create tab UI
       createTabUI(fileKey);
@@ -1359,7 +1359,7 @@ def generate_js_import_export():
       const solvedFilter = document.getElementById(`solved-filter-${fileKey}`);
       const colorFilter = document.getElementById(`color-filter-${fileKey}`);
 
-      if (searchBox) searchBox.addEventListener('input', () => applyFilters(fileKey));
+      if (searchBox) searchBox.addEventListener('input', () => applySearchDebounced(fileKey));
       if (difficultyFilter) difficultyFilter.addEventListener('change', () => applyFilters(fileKey));
       if (patternFilter) patternFilter.addEventListener('change', () => applyFilters(fileKey));
       if (solvedFilter) solvedFilter.addEventListener('change', () => applyFilters(fileKey));
@@ -1377,6 +1377,9 @@ def generate_js_import_export():
         option.textContent = pattern;
         patternSelect.appendChild(option);
       });
+
+      // Filters are set up above, so the tab only needs its table rendered
+      markTabHydrated(fileKey);
     }
     """
 
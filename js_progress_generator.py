@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Progress Counters Sub-Agent
+Solved/total counters per list and over unique problems, kept up to date per change
+"""
+
+
+def generate_js_progress():
+    """Generate JavaScript progress counters"""
+
+    js = """
+    // === Progress Counters ===
+    // Solved and total counts for each list and for the unique problems of all
+    // lists, with the same counts broken down by difficulty and pattern. Each
+    // list is counted once (again only if it is replaced or grows); after that
+    // setProblemField adjusts the counters of the rows holding a problem when
+    // its solved flag changes, so progress bars never rescan the lists.
+
+    const PROGRESS_DIFFICULTY_ORDER = ['Easy', 'Medium', 'Hard'];
+
+    // fileKey -> { problems, length, counts, rowsById: Map id -> [idx] }
+    const LIST_PROGRESS = {};
+    // { lists: [[problems, length]], counts, problems: Map id -> { difficulty, patterns } }
+    let overallProgress = null;
+
+    // counts: { solved, total, difficulty: { name: { solved, total } }, pattern: { ... } }
+    function createProgressCounts() {
+      return { solved: 0, total: 0, difficulty: {}, pattern: {} };
+    }
+
+    function addProgressBucket(buckets, key, solved, total) {
+      if (!key) return;
+      const bucket = buckets[key] || (buckets[key] = { solved: 0, total: 0 });
+      bucket.solved += solved;
+      bucket.total += total;
+    }
+
+    // Add (or with negative amounts, remove) one problem's contribution
+    function addProgressCount(counts, difficulty, patterns, solved, total) {
+      counts.solved += solved;
+      counts.total += total;
+      addProgressBucket(counts.difficulty, difficulty, solved, total);
+      patterns.forEach(pattern => addProgressBucket(counts.pattern, pattern, solved, total));
+    }
+
+    function countListProgress(problems) {
+      const counts = createProgressCounts();
+      const rowsById = new Map();
+      problems.forEach((problem, idx) => {
+        addProgressCount(counts, problem.difficulty, [problem.pattern], problem.solved ? 1 : 0, 1);
+        if (!rowsById.has(problem.id)) rowsById.set(problem.id, []);
+        rowsById.get(problem.id).push(idx);
+      });
+      return { problems, length: problems.length, counts, rowsById };
+    }
+
+    // Progress of one list (every row counts, as shown in its table)
+    function getListProgress(fileKey) {
+      const problems = PROBLEM_DATA.data[fileKey] || [];
+      const model = LIST_PROGRESS[fileKey];
+      if (model && model.problems === problems && model.length === problems.length) return model.counts;
+      LIST_PROGRESS[fileKey] = countListProgress(problems);
+      return LIST_PROGRESS[fileKey].counts;
+    }
+
+    function isOverallProgressCurrent() {
+      if (overallProgress === null || overallProgress.lists.length !== PROBLEM_DATA.file_list.length) return false;
+      return PROBLEM_DATA.file_list.every((fileKey, i) => {
+        const [problems, length] = overallProgress.lists[i];
+        const current = PROBLEM_DATA.data[fileKey] || [];
+        return problems === current && length === current.length;
+      });
+    }
+
+    // Progress over unique problems; a problem counts once under each pattern
+    // it has in any list
+    function getOverallProgress() {
+      if (isOverallProgressCurrent()) return overallProgress.counts;
+
+      const lists = [];
+      const problems = new Map();
+      PROBLEM_DATA.file_list.forEach(fileKey => {
+        const list = PROBLEM_DATA.data[fileKey] || [];
+        lists.push([list, list.length]);
+        list.forEach(problem => {
+          let entry = problems.get(problem.id);
+          if (!entry) {
+            entry = { difficulty: problem.difficulty, patterns: [] };
+            problems.set(problem.id, entry);
+          }
+          if (problem.pattern && !entry.patterns.includes(problem.pattern)) entry.patterns.push(problem.pattern);
+        });
+      });
+
+      const counts = createProgressCounts();
+      problems.forEach((entry, id) => {
+        addProgressCount(counts, entry.difficulty, entry.patterns, getProblemState(id).solved ? 1 : 0, 1);
+      });
+      overallProgress = { lists, counts, problems };
+      return counts;
+    }
+
+    // Called by setProblemField() when a problem's solved flag changes
+    function updateProgressCounts(id, wasSolved, isSolved) {
+      if (!wasSolved === !isSolved) return;
+      const delta = isSolved ? 1 : -1;
+      Object.keys(LIST_PROGRESS).forEach(fileKey => {
+        const model = LIST_PROGRESS[fileKey];
+        (model.rowsById.get(id) || []).forEach(idx => {
+          const problem = model.problems[idx];
+          addProgressCount(model.counts, problem.difficulty, [problem.pattern], delta, 0);
+        });
+      });
+      const entry = overallProgress && overallProgress.problems.get(id);
+      if (entry) addProgressCount(overallProgress.counts, entry.difficulty, entry.patterns, delta, 0);
+    }
+
+    // Called after the registry is replaced wholesale or rows are edited in place
+    function resetProgressCounts() {
+      Object.keys(LIST_PROGRESS).forEach(fileKey => delete LIST_PROGRESS[fileKey]);
+      overallProgress = null;
+    }
+
+    // One line per difficulty, e.g. "Easy: 3 / 10"
+    function formatProgressBreakdown(counts) {
+      const known = PROGRESS_DIFFICULTY_ORDER.filter(difficulty => counts.difficulty[difficulty]);
+      const others = Object.keys(counts.difficulty).filter(difficulty => !PROGRESS_DIFFICULTY_ORDER.includes(difficulty)).sort();
+      return known.concat(others)
+        .map(difficulty => `${difficulty}: ${counts.difficulty[difficulty].solved} / ${counts.difficulty[difficulty].total}`)
+        .join('\\n');
+    }
+    """
+
+    return js
+
+
+if __name__ == "__main__":
+    print(generate_js_progress())
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Render Scheduler Sub-Agent
+Coalesces row, progress and button updates into one animation frame
+"""
+
+
+def generate_js_render():
+    """Generate JavaScript frame-coalescing render scheduler"""
+
+    js = """
+    // === Render Scheduler ===
+    // Row fields and awareness colors, progress bars and the random/urgent
+    // button states are not written when they change. Callers mark them dirty
+    // (updateDOMField, updateSolvedDateDisplay, paintRowAwarenessAt,
+    // updateProgress, updateOverallProgress, update*BtnState) and a single
+    // requestAnimationFrame pass applies everything marked since the last
+    // frame: first every element and value is read, then all writes are made,
+    // so a solve, an import or a cloud merge touches each row once per frame.
+
+    // fileKey -> Set of problem indexes whose rendered row needs refreshing
+    const RENDER_ROWS = new Map();
+    // fileKey -> status text for the progress line, or null for the counts
+    const RENDER_PROGRESS = new Map();
+    // Tabs whose random and urgent-review buttons need updating
+    const RENDER_BUTTONS = new Set();
+    let renderOverallProgress = false;
+    let renderFrame = null;
+
+    function scheduleRenderFrame() {
+      if (renderFrame === null) renderFrame = requestAnimationFrame(flushRender);
+    }
+
+    function scheduleRowRender(fileKey, idx) {
+      if (!RENDER_ROWS.has(fileKey)) RENDER_ROWS.set(fileKey, new Set());
+      RENDER_ROWS.get(fileKey).add(idx);
+      scheduleRenderFrame();
+    }
+
+    function scheduleProgressRender(fileKey, status = null) {
+      RENDER_PROGRESS.set(fileKey, status);
+      scheduleRenderFrame();
+    }
+
+    function scheduleOverallProgressRender() {
+      renderOverallProgress = true;
+      scheduleRenderFrame();
+    }
+
+    function scheduleButtonRender(fileKey) {
+      RENDER_BUTTONS.add(fileKey);
+      scheduleRenderFrame();
+    }
+
+    // Each read*Update reads what it needs and returns the writes to make
+    // (or null when there is nothing on screen to update)
+
+    // The row and its cells come from the virtual table's registries, not DOM queries
+    function readRowUpdate(fileKey, idx) {
+      const row = getRenderedRow(fileKey, idx);
+      const problem = PROBLEM_DATA.data[fileKey][idx];
+      if (!row || !problem) return null;
+
+      const { checkbox, timeInput, commentsInput, dateCell } = ROW_CELLS.get(row);
+      const solved = !!problem.solved;
+      const time = problem.time_to_solve || '';
+      const comments = problem.comments || '';
+      const solvedDate = problem.solved_date;
+      const date = formatRelativeTime(solvedDate);
+      const awareness = getRowAwareness(fileKey, idx);
+
+      return () => {
+        // Inputs already holding the value (the one being typed in) are left alone
+        if (checkbox.checked !== solved) checkbox.checked = solved;
+        if (timeInput.value !== time) timeInput.value = time;
+        if (commentsInput.value !== comments) commentsInput.value = comments;
+        if (dateCell.textContent !== date) dateCell.textContent = date;
+        noteRelativeDate(dateCell, solvedDate);
+        paintRowAwareness(row, awareness);
+      };
+    }
+
+    function readProgressUpdate(fileKey, status) {
+      const progressBar = document.getElementById(`progress-${fileKey}`);
+      const progressText = document.getElementById(`progress-text-${fileKey}`);
+      if (!progressBar || !progressText) return null;
+      if (status !== null) return () => { progressText.textContent = status; };
+
+      const counts = getListProgress(fileKey);
+      const { solved, total } = counts;
+      const percentage = total > 0 ? Math.round((solved / total) * 100) : 0;
+      const breakdown = formatProgressBreakdown(counts);
+      return () => {
+        progressBar.style.width = `${percentage}%`;
+        progressBar.textContent = `${percentage}%`;
+        progressText.textContent = `Solved ${solved} / ${total} problems (${percentage}%)`;
+        progressText.title = breakdown;
+      };
+    }
+
+    function readOverallProgressUpdate() {
+      const progressText = document.getElementById('overall-progress-text');
+      if (!progressText) return null;
+      const counts = getOverallProgress();
+      const { solved, total } = counts;
+      const percentage = total > 0 ? Math.round((solved / total) * 100) : 0;
+      const breakdown = formatProgressBreakdown(counts);
+      return () => {
+        progressText.textContent = `Overall: ${solved} / ${total} unique problems (${percentage}%)`;
+        progressText.title = breakdown;
+      };
+    }
+
+    // Random needs a visible row; urgent review needs a solved problem in the tab
+    function readButtonUpdate(fileKey) {
+      const randomBtn = document.getElementById(`random-btn-${fileKey}`);
+      const urgentBtn = document.getElementById(`urgent-review-btn-${fileKey}`);
+      const view = TABLE_VIEWS[fileKey];
+      const randomDisabled = !view || view.visible.length === 0;
+      const urgentDisabled = getListProgress(fileKey).solved === 0;
+      return () => {
+        if (randomBtn) randomBtn.disabled = randomDisabled;
+        if (urgentBtn) urgentBtn.disabled = urgentDisabled;
+      };
+    }
+
+    // Apply everything marked since the last frame
+    function flushRender() {
+      renderFrame = null;
+      const writes = [];
+      RENDER_ROWS.forEach((indexes, fileKey) => {
+        if (!PROBLEM_DATA.data[fileKey]) return;
+        indexes.forEach(idx => writes.push(readRowUpdate(fileKey, idx)));
+      });
+      RENDER_PROGRESS.forEach((status, fileKey) => writes.push(readProgressUpdate(fileKey, status)));
+      if (renderOverallProgress) writes.push(readOverallProgressUpdate());
+      RENDER_BUTTONS.forEach(fileKey => writes.push(readButtonUpdate(fileKey)));
+
+      RENDER_ROWS.clear();
+      RENDER_PROGRESS.clear();
+      RENDER_BUTTONS.clear();
+      renderOverallProgress = false;
+
+      writes.forEach(write => { if (write) write(); });
+    }
+    """
+
+    return js
+
+
+if __name__ == "__main__":
+    print(generate_js_render())
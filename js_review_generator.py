@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Review Queue Sub-Agent
+Cross-list spaced-repetition review queue ordered by time until flashing
+"""
+
+
+def generate_js_review():
+    """Generate JavaScript review queue view"""
+
+    js = """
+    // === Review Queue ===
+    // Every solved problem, across all lists, in an indexed min-heap keyed by
+    // the time its awareness reaches the flashing threshold. Solving a problem
+    // or editing its date or time updates only that problem's entry (called by
+    // setProblemField), so the view shows the next problems due and a per-day
+    // forecast without rescoring the catalog. A config change, which alters
+    // every decay rate, rebuilds the queue on next use; a change in the unique
+    // solved count shifts every rate slightly and is picked up when the view
+    // is opened.
+
+    const REVIEW_QUEUE_LIMIT = 20;
+    const REVIEW_FORECAST_DAYS = 14;
+    const REVIEW_QUEUE_FIELDS = ['solved', 'solved_date', 'time_to_solve'];
+
+    // heap: [{ id, at }] ordered by at; positions: id -> heap index
+    function createReviewQueue() {
+      return { heap: [], positions: new Map() };
+    }
+
+    function reviewQueueMove(queue, entry, i) {
+      queue.heap[i] = entry;
+      queue.positions.set(entry.id, i);
+    }
+
+    function reviewQueueSiftUp(queue, i) {
+      const heap = queue.heap;
+      const entry = heap[i];
+      while (i > 0) {
+        const parent = (i - 1) >> 1;
+        if (heap[parent].at <= entry.at) break;
+        reviewQueueMove(queue, heap[parent], i);
+        i = parent;
+      }
+      reviewQueueMove(queue, entry, i);
+    }
+
+    function reviewQueueSiftDown(queue, i) {
+      const heap = queue.heap;
+      const entry = heap[i];
+      for (;;) {
+        const left = 2 * i + 1;
+        if (left >= heap.length) break;
+        const child = left + 1 < heap.length && heap[left + 1].at < heap[left].at ? left + 1 : left;
+        if (heap[child].at >= entry.at) break;
+        reviewQueueMove(queue, heap[child], i);
+        i = child;
+      }
+      reviewQueueMove(queue, entry, i);
+    }
+
+    // Insert a problem or move it to a new time; Infinity (never due) removes it
+    function reviewQueueSet(queue, id, at) {
+      if (!(at < Infinity)) {
+        reviewQueueRemove(queue, id);
+        return;
+      }
+      const i = queue.positions.get(id);
+      if (i === undefined) {
+        queue.heap.push({ id, at });
+        reviewQueueSiftUp(queue, queue.heap.length - 1);
+        return;
+      }
+      const previous = queue.heap[i].at;
+      queue.heap[i].at = at;
+      if (at < previous) {
+        reviewQueueSiftUp(queue, i);
+      } else {
+        reviewQueueSiftDown(queue, i);
+      }
+    }
+
+    function reviewQueueRemove(queue, id) {
+      const i = queue.positions.get(id);
+      if (i === undefined) return false;
+      queue.positions.delete(id);
+      const last = queue.heap.pop();
+      if (i < queue.heap.length) {
+        reviewQueueMove(queue, last, i);
+        reviewQueueSiftUp(queue, i);
+        reviewQueueSiftDown(queue, queue.positions.get(last.id));
+      }
+      return true;
+    }
+
+    // Entries due by `until`, earliest first, at most `limit` of them. Walks
+    // the heap through a frontier of candidates, so only the entries returned
+    // (and their children) are visited and the queue is left untouched.
+    function reviewQueueWalk(queue, limit, until = Infinity) {
+      const heap = queue.heap;
+      const entries = [];
+      const frontier = [];
+      if (heap.length > 0 && heap[0].at <= until) pushAwarenessDue(frontier, { at: heap[0].at, i: 0 });
+      while (frontier.length > 0 && entries.length < limit) {
+        const { i } = popAwarenessDue(frontier);
+        entries.push(heap[i]);
+        for (let child = 2 * i + 1; child <= 2 * i + 2 && child < heap.length; child++) {
+          if (heap[child].at <= until) pushAwarenessDue(frontier, { at: heap[child].at, i: child });
+        }
+      }
+      return entries;
+    }
+
+    // Whole days until a queued time (0 once it is flashing)
+    function getReviewDueDays(at, now) {
+      return Math.max(0, Math.ceil((at - now) / AWARENESS_DAY_MS));
+    }
+
+    // Problems due now (index 0) and on each of the next `days` days
+    function reviewForecast(queue, now, days) {
+      const counts = new Array(days + 1).fill(0);
+      reviewQueueWalk(queue, Infinity, now + days * AWARENESS_DAY_MS)
+        .forEach(entry => counts[getReviewDueDays(entry.at, now)]++);
+      return counts;
+    }
+
+    // Time (ms) at which a problem starts flashing, or Infinity if it never will
+    function getReviewFlashTime(problem) {
+      if (!problem || !problem.solved) return Infinity;
+      const solvedAt = new Date(problem.solved_date).getTime();
+      if (isNaN(solvedAt)) return Infinity;
+      const dailyRate = getAwarenessDailyRate(problem);
+      if (!(dailyRate > 0)) return Infinity;
+      return solvedAt + AWARENESS_CONFIG.thresholds.darkRed / dailyRate * AWARENESS_DAY_MS;
+    }
+
+    const REVIEW_QUEUE = createReviewQueue();
+    // A list row for each queued problem; its tier times give the decay rate
+    const REVIEW_ROWS = new Map();
+    // Config version and solved count the queue was built with (null = not built)
+    let reviewQueueVersion = null;
+    let reviewQueueSolvedCount = null;
+
+    function findReviewRow(name) {
+      const location = getProblemLocations(name)[0];
+      return location ? PROBLEM_DATA.data[location.fileKey][location.idx] : null;
+    }
+
+    function rebuildReviewQueue() {
+      // Indexing builds every list and gives each problem's name and lists
+      const index = getSearchIndex();
+      REVIEW_QUEUE.heap = [];
+      REVIEW_QUEUE.positions.clear();
+      REVIEW_ROWS.clear();
+      index.docs.forEach(doc => {
+        if (!PROBLEM_STATE[doc.id] || !PROBLEM_STATE[doc.id].solved) return;
+        const row = findReviewRow(doc.name);
+        if (!row) return;
+        REVIEW_ROWS.set(doc.id, row);
+        reviewQueueSet(REVIEW_QUEUE, doc.id, getReviewFlashTime(row));
+      });
+      reviewQueueVersion = awarenessConfigVersion;
+      reviewQueueSolvedCount = getTotalUniqueSolvedCount();
+    }
+
+    // Build the queue if missing or made stale by a config change (or, when
+    // exact, by a change in the solved count since it was built)
+    function ensureReviewQueue(exact) {
+      if (reviewQueueVersion === awarenessConfigVersion &&
+          (!exact || reviewQueueSolvedCount === getTotalUniqueSolvedCount())) {
+        return REVIEW_QUEUE;
+      }
+      rebuildReviewQueue();
+      return REVIEW_QUEUE;
+    }
+
+    // Re-time one problem after a field it is scored on changed (called by setProblemField)
+    function updateReviewQueue(id, field) {
+      if (reviewQueueVersion === null || !REVIEW_QUEUE_FIELDS.includes(field)) return;
+      let row = REVIEW_ROWS.get(id);
+      if (!row) {
+        const doc = SEARCH_INDEX.docs.get(id);
+        row = doc ? findReviewRow(doc.name) : null;
+      }
+      if (!row) {
+        // Not indexed yet (a list still being built): rebuild on next use
+        reviewQueueVersion = null;
+      } else {
+        REVIEW_ROWS.set(id, row);
+        reviewQueueSet(REVIEW_QUEUE, id, getReviewFlashTime(row));
+      }
+      scheduleReviewQueueRender();
+    }
+
+    function isReviewQueueOpen() {
+      const section = document.getElementById('review-queue');
+      return !!section && section.style.display !== 'none';
+    }
+
+    function formatReviewDue(days) {
+      if (days === 0) return 'Due now';
+      return `In ${days} day${days === 1 ? '' : 's'}`;
+    }
+
+    function createReviewQueueItem(entry, now) {
+      const item = createGlobalSearchItem(entry);
+      const days = getReviewDueDays(entry.at, now);
+      const due = document.createElement('span');
+      due.className = days === 0 ? 'review-due review-due-now' : 'review-due';
+      due.textContent = formatReviewDue(days);
+      due.title = new Date(entry.at).toLocaleDateString();
+      item.insertBefore(due, item.querySelector('.global-search-tags'));
+      return item;
+    }
+
+    function createReviewForecast(counts) {
+      const forecast = document.createElement('ol');
+      forecast.className = 'review-forecast';
+      forecast.setAttribute('aria-label', 'Problems due per day');
+      const max = Math.max(1, ...counts);
+      counts.forEach((count, days) => {
+        const day = document.createElement('li');
+        day.className = days === 0 ? 'review-forecast-day review-forecast-now' : 'review-forecast-day';
+        day.title = `${count} problem${count === 1 ? '' : 's'} ${days === 0 ? 'due now' : `due in ${days} day${days === 1 ? '' : 's'}`}`;
+
+        const value = document.createElement('span');
+        value.className = 'review-forecast-count';
+        value.textContent = count;
+        const bar = document.createElement('span');
+        bar.className = 'review-forecast-bar';
+        bar.style.height = `${Math.round(count / max * 100)}%`;
+        const label = document.createElement('span');
+        label.className = 'review-forecast-label';
+        label.textContent = days === 0 ? 'Now' : `${days}d`;
+
+        day.appendChild(value);
+        day.appendChild(bar);
+        day.appendChild(label);
+        forecast.appendChild(day);
+      });
+      return forecast;
+    }
+
+    function renderReviewQueue(exact = false) {
+      const section = document.getElementById('review-queue');
+      if (!section) return;
+      const queue = ensureReviewQueue(exact);
+      const now = Date.now();
+      const counts = reviewForecast(queue, now, REVIEW_FORECAST_DAYS);
+      const upcoming = counts.reduce((sum, count) => sum + count, 0) - counts[0];
+      section.innerHTML = '';
+
+      const summary = document.createElement('div');
+      summary.className = 'global-search-summary';
+      if (queue.heap.length === 0) {
+        summary.textContent = 'No solved problems to review yet';
+        section.appendChild(summary);
+        return;
+      }
+      summary.textContent = `${counts[0]} due now, ${upcoming} more in the next ${REVIEW_FORECAST_DAYS} days`;
+      section.appendChild(summary);
+      section.appendChild(createReviewForecast(counts));
+
+      const list = document.createElement('ul');
+      list.className = 'global-search-list review-queue-list';
+      reviewQueueWalk(queue, REVIEW_QUEUE_LIMIT).forEach(entry => list.appendChild(createReviewQueueItem(entry, now)));
+      section.appendChild(list);
+    }
+
+    // Redraw an open view once a burst of edits settles
+    const renderReviewQueueDebounced = debounce(() => renderReviewQueue(), 300);
+
+    function scheduleReviewQueueRender() {
+      if (isReviewQueueOpen()) renderReviewQueueDebounced();
+    }
+
+    function toggleReviewQueue() {
+      const section = document.getElementById('review-queue');
+      const btn = document.getElementById('review-queue-btn');
+      if (!section) return;
+      const open = !isReviewQueueOpen();
+      section.style.display = open ? '' : 'none';
+      if (btn) btn.setAttribute('aria-pressed', String(open));
+      if (open) renderReviewQueue(true);
+    }
+
+    function initReviewQueue() {
+      const section = document.getElementById('review-queue');
+      const btn = document.getElementById('review-queue-btn');
+      if (!section || !btn) return;
+
+      btn.addEventListener('click', toggleReviewQueue);
+      section.addEventListener('click', event => {
+        const tag = event.target.closest('.global-search-tag');
+        if (tag) openSearchHit(tag.dataset.tab, tag.dataset.problemId);
+      });
+    }
+    """
+
+    return js
+
+
+if __name__ == "__main__":
+    print(generate_js_review())
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Scoring Worker Sub-Agent
+Runs awareness scoring and urgent-review ranking in a Web Worker
+"""
+
+
+def generate_js_scoring():
+    """Generate JavaScript awareness scoring worker"""
+
+    js = """
+    // === Awareness Scoring Worker ===
+    // Full recolors (settings preview, rescoring after a config or solved
+    // count change, focus and manual refresh) and the urgent-review ranking
+    // score problems in a Web Worker so input is not blocked on big catalogs.
+    // The worker is built from a Blob holding the same scoring functions the
+    // page uses, so both threads compute identical results. Problems are sent
+    // in compact batches with AWARENESS_CONFIG and the unique solved count;
+    // replies carry only the rows whose class changed plus each row's next
+    // transition time. Where Workers cannot be created (some file:// setups)
+    // or the worker fails, the same tasks run synchronously.
+
+    const SCORING_BATCH_SIZE = 500;
+
+    // Urgency of each awareness class for the urgent-review filter
+    const URGENT_TIER_RANK = { 'awareness-flashing': 5, 'awareness-dark-red': 4, 'awareness-red': 3, 'awareness-yellow': 2, 'awareness-green': 1, 'awareness-white': 0, 'unsolved-problem': -1 };
+
+    // Worker instance, null before first use, false once unavailable
+    let scoringWorker = null;
+    let scoringRequestId = 0;
+    // Requests waiting for the worker, id -> { type, payload, resolve }
+    const SCORING_REQUESTS = new Map();
+
+    // The fields scoring reads, copied off a problem (also used as a snapshot
+    // to spot rows edited while their batch was being scored)
+    function compactScoringProblem(problem) {
+      return {
+        solved: problem.solved,
+        solved_date: problem.solved_date,
+        time_to_solve: problem.time_to_solve,
+        top_time: problem.top_time,
+        advanced_time: problem.advanced_time,
+        intermediate_time: problem.intermediate_time,
+        difficulty: problem.difficulty
+      };
+    }
+
+    function scoringSnapshotMatches(snapshot, problem) {
+      return !!problem &&
+        snapshot.solved === problem.solved &&
+        snapshot.solved_date === problem.solved_date &&
+        snapshot.time_to_solve === problem.time_to_solve;
+    }
+
+    // Awareness class and invalid-date flag as one number (-1 = not scored)
+    function awarenessCode(className, invalidDate) {
+      return AWARENESS_CLASSES.indexOf(className) * 2 + (invalidDate ? 1 : 0);
+    }
+
+    // Score a batch: rows whose class differs from current, and every row's
+    // next transition time
+    function scoreAwarenessBatch(problems, current) {
+      const changes = [];
+      const due = [];
+      problems.forEach((problem, i) => {
+        const result = calculateAwarenessScore(problem);
+        const code = awarenessCode(getAwarenessClass(result.score), result.invalidDate);
+        if (code !== current[i]) changes.push([i, code]);
+        due.push(getNextAwarenessTransition(problem, result.score));
+      });
+      return { changes, due };
+    }
+
+    // Urgent-review ranking: solved problems in the most urgent class, plus
+    // those that start flashing soonest. Returns null when none are solved.
+    function rankUrgentProblems(problems) {
+      let maxTier = -Infinity;
+      let globalMinDays = Infinity;
+      const solvedProblems = [];
+      problems.forEach((problem, idx) => {
+        const scoreResult = calculateAwarenessScore(problem);
+        const days = calculateDaysUntilFlashing(problem, scoreResult);
+        if (days === Infinity) return;
+        const tier = URGENT_TIER_RANK[getAwarenessClass(scoreResult.score)] || 0;
+        solvedProblems.push({ idx, days, tier });
+        maxTier = Math.max(maxTier, tier);
+        globalMinDays = Math.min(globalMinDays, days);
+      });
+
+      if (solvedProblems.length === 0) return null;
+
+      const indices = solvedProblems
+        .filter(item => item.tier === maxTier || item.days === globalMinDays)
+        .map(item => item.idx);
+      return { indices, globalMinDays };
+    }
+
+    function runScoringTask(type, payload) {
+      if (type === 'urgent') return rankUrgentProblems(payload.problems);
+      return scoreAwarenessBatch(payload.problems, payload.current);
+    }
+
+    function buildScoringWorkerSource() {
+      const functions = [
+        getTierName, getAwarenessFactors, getTierDifficultyMultiplier, getCommitmentFactor,
+        getSolvedFactor, getDaysSinceCompletion, getAwarenessDailyRate, calculateAwarenessScore,
+        getAwarenessClass, getNextAwarenessTransition, calculateDaysUntilFlashing,
+        awarenessCode, scoreAwarenessBatch, rankUrgentProblems, runScoringTask
+      ];
+      return [
+        'let AWARENESS_CONFIG = null;',
+        'let awarenessConfigVersion = 0;',
+        'let uniqueSolvedCount = 0;',
+        'const AWARENESS_FACTOR_CACHE = new WeakMap();',
+        `const AWARENESS_CLASSES = ${JSON.stringify(AWARENESS_CLASSES)};`,
+        `const AWARENESS_THRESHOLD_KEYS = ${JSON.stringify(AWARENESS_THRESHOLD_KEYS)};`,
+        `const AWARENESS_DAY_MS = ${AWARENESS_DAY_MS};`,
+        `const URGENT_TIER_RANK = ${JSON.stringify(URGENT_TIER_RANK)};`,
+        'function getTotalUniqueSolvedCount() { return uniqueSolvedCount; }'
+      ].concat(functions.map(fn => fn.toString()), [
+        `self.onmessage = function(event) {
+          const request = event.data;
+          AWARENESS_CONFIG = request.config;
+          uniqueSolvedCount = request.solvedCount;
+          awarenessConfigVersion++;
+          self.postMessage({ id: request.id, result: runScoringTask(request.type, request.payload) });
+        };`
+      ]).join('\\n');
+    }
+
+    // Stop using the worker and finish its pending requests on this thread
+    function disableScoringWorker(error) {
+      if (error) console.warn('Scoring worker unavailable, scoring on the main thread:', error);
+      if (scoringWorker) scoringWorker.terminate();
+      scoringWorker = false;
+      SCORING_REQUESTS.forEach(request => request.resolve(runScoringTask(request.type, request.payload)));
+      SCORING_REQUESTS.clear();
+    }
+
+    function getScoringWorker() {
+      if (scoringWorker !== null) return scoringWorker;
+      scoringWorker = false;
+      if (typeof Worker === 'undefined' || typeof Blob === 'undefined' || typeof URL === 'undefined') {
+        return scoringWorker;
+      }
+      try {
+        const url = URL.createObjectURL(new Blob([buildScoringWorkerSource()], { type: 'text/javascript' }));
+        const worker = new Worker(url);
+        URL.revokeObjectURL(url);
+        worker.onmessage = event => {
+          const request = SCORING_REQUESTS.get(event.data.id);
+          if (!request) return;
+          SCORING_REQUESTS.delete(event.data.id);
+          request.resolve(event.data.result);
+        };
+        worker.onerror = event => {
+          if (event && typeof event.preventDefault === 'function') event.preventDefault();
+          disableScoringWorker((event && event.message) || event);
+        };
+        scoringWorker = worker;
+      } catch (e) {
+        disableScoringWorker(e);
+      }
+      return scoringWorker;
+    }
+
+    // Run a scoring task in the worker, or synchronously without one
+    function runScoring(type, payload) {
+      const worker = getScoringWorker();
+      if (!worker) return Promise.resolve(runScoringTask(type, payload));
+
+      return new Promise(resolve => {
+        const id = ++scoringRequestId;
+        SCORING_REQUESTS.set(id, { type, payload, resolve });
+        try {
+          worker.postMessage({
+            id,
+            type,
+            payload,
+            config: AWARENESS_CONFIG,
+            solvedCount: getTotalUniqueSolvedCount()
+          });
+        } catch (e) {
+          disableScoringWorker(e);
+        }
+      });
+    }
+
+    // Score rows [start, end) of a tab and apply the changed classes and
+    // transition times. Rows edited meanwhile were already rescored and are skipped.
+    function scoreAwarenessRows(fileKey, start, end) {
+      const problems = PROBLEM_DATA.data[fileKey];
+      const cached = ROW_AWARENESS[fileKey] || [];
+      const batch = [];
+      const current = [];
+      for (let idx = start; idx < end; idx++) {
+        batch.push(compactScoringProblem(problems[idx]));
+        current.push(cached[idx] ? awarenessCode(cached[idx].className, cached[idx].invalidDate) : -1);
+      }
+
+      return runScoring('awareness', { problems: batch, current }).then(result => {
+        if (PROBLEM_DATA.data[fileKey] !== problems) return;
+        const changed = new Map(result.changes);
+        batch.forEach((snapshot, i) => {
+          const idx = start + i;
+          if (!scoringSnapshotMatches(snapshot, problems[idx])) return;
+          if (changed.has(i)) {
+            const code = changed.get(i);
+            const awareness = { className: AWARENESS_CLASSES[code >> 1], invalidDate: (code & 1) === 1 };
+            if (!ROW_AWARENESS[fileKey]) ROW_AWARENESS[fileKey] = [];
+            ROW_AWARENESS[fileKey][idx] = awareness;
+            paintRowAwarenessAt(fileKey, idx, awareness);
+          }
+          scheduleRowAwareness(fileKey, idx, result.due[i]);
+        });
+      });
+    }
+
+    /**
+     * updateAwarenessColors() for background recolors: scores in batches off
+     * the main thread where possible. Resolves once every batch is applied.
+     */
+    function updateAwarenessColorsAsync(allTabs = false) {
+      const fileKeys = allTabs ? PROBLEM_DATA.file_list : [currentTab];
+      if (allTabs) clearAwarenessSchedule();
+
+      const batches = [];
+      fileKeys.forEach(fileKey => {
+        if (!isTabHydrated(fileKey)) {
+          // Not rendered yet: drop stale entries, rows are scored when first rendered
+          delete ROW_AWARENESS[fileKey];
+          clearAwarenessSchedule(fileKey);
+          return;
+        }
+        const count = PROBLEM_DATA.data[fileKey].length;
+        for (let start = 0; start < count; start += SCORING_BATCH_SIZE) {
+          batches.push(scoreAwarenessRows(fileKey, start, Math.min(start + SCORING_BATCH_SIZE, count)));
+        }
+      });
+      return Promise.all(batches);
+    }
+    """
+
+    return js
+
+
+if __name__ == "__main__":
+    print(generate_js_scoring())
@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""
+Search Index Sub-Agent
+Inverted token and trigram index over problem names, patterns and comments
+"""
+
+
+def generate_js_search():
+    """Generate JavaScript search index"""
+
+    js = """
+    // === Search Index ===
+    // One document per unique problem (canonical ID), shared by every list.
+    // Tokens from the name, pattern(s) and the user's comments map to the
+    // documents containing them; trigrams map to tokens for substring and
+    // fuzzy lookups, and a sorted token list serves prefix lookups. The index
+    // is built on the first search and comments are re-indexed as they change.
+    // The tab search uses it to narrow its substring scan to candidate rows.
+
+    const SEARCH_FIELDS = { name: 1, pattern: 2, comments: 4 };
+    const SEARCH_FIELD_WEIGHTS = { name: 3, pattern: 2, comments: 1 };
+    const SEARCH_MATCH_SCORES = { exact: 1, prefix: 0.8, substring: 0.5, fuzzy: 0.4 };
+
+    function createSearchIndex() {
+      return {
+        docs: new Map(),       // id -> { id, name, difficulty, lists, patterns, fields }
+        postings: new Map(),   // token -> Map(id -> field bitmask)
+        grams: new Map(),      // trigram -> Set(token)
+        sortedTokens: null,    // lazily rebuilt when the vocabulary changes
+        lists: new Map()       // fileKey -> [problems array, length] last indexed
+      };
+    }
+
+    const SEARCH_INDEX = createSearchIndex();
+
+    // Lowercase words, plus their letter and digit runs ("3sum" -> 3sum, 3, sum)
+    function tokenizeSearchText(text) {
+      const words = String(text || '').toLowerCase().match(/[a-z0-9]+/g) || [];
+      const tokens = [];
+      words.forEach(word => {
+        tokens.push(word);
+        const parts = word.match(/[a-z]+|[0-9]+/g);
+        if (parts.length > 1) tokens.push(...parts);
+      });
+      return Array.from(new Set(tokens));
+    }
+
+    function searchTrigrams(token) {
+      const grams = [];
+      for (let i = 0; i + 3 <= token.length; i++) grams.push(token.slice(i, i + 3));
+      return grams;
+    }
+
+    function addSearchPosting(index, token, id, field) {
+      let docs = index.postings.get(token);
+      if (!docs) {
+        docs = new Map();
+        index.postings.set(token, docs);
+        searchTrigrams(token).forEach(gram => {
+          if (!index.grams.has(gram)) index.grams.set(gram, new Set());
+          index.grams.get(gram).add(token);
+        });
+        index.sortedTokens = null;
+      }
+      docs.set(id, (docs.get(id) || 0) | field);
+    }
+
+    function removeSearchPosting(index, token, id, field) {
+      const docs = index.postings.get(token);
+      if (!docs || !docs.has(id)) return;
+      const mask = docs.get(id) & ~field;
+      if (mask) {
+        docs.set(id, mask);
+        return;
+      }
+      docs.delete(id);
+      if (docs.size > 0) return;
+      index.postings.delete(token);
+      searchTrigrams(token).forEach(gram => {
+        const tokens = index.grams.get(gram);
+        if (!tokens) return;
+        tokens.delete(token);
+        if (tokens.size === 0) index.grams.delete(gram);
+      });
+      index.sortedTokens = null;
+    }
+
+    // Replace the tokens of one field of a document
+    function setSearchField(index, doc, fieldName, text) {
+      const field = SEARCH_FIELDS[fieldName];
+      const tokens = tokenizeSearchText(text);
+      const kept = new Set(tokens);
+      doc.fields[fieldName].forEach(token => {
+        if (!kept.has(token)) removeSearchPosting(index, token, doc.id, field);
+      });
+      tokens.forEach(token => addSearchPosting(index, token, doc.id, field));
+      doc.fields[fieldName] = tokens;
+    }
+
+    // Add a problem to the index; a problem seen in several lists keeps one
+    // document and collects the list keys and the pattern of each list
+    function indexSearchProblem(index, problem, fileKey) {
+      let doc = index.docs.get(problem.id);
+      if (!doc) {
+        doc = {
+          id: problem.id,
+          name: problem.name,
+          difficulty: problem.difficulty,
+          lists: [],
+          patterns: [],
+          fields: { name: [], pattern: [], comments: [] }
+        };
+        index.docs.set(problem.id, doc);
+        setSearchField(index, doc, 'name', problem.name);
+        setSearchField(index, doc, 'comments', problem.comments);
+      }
+      if (fileKey && !doc.lists.includes(fileKey)) doc.lists.push(fileKey);
+      if (problem.pattern && !doc.patterns.includes(problem.pattern)) {
+        doc.patterns.push(problem.pattern);
+        setSearchField(index, doc, 'pattern', doc.patterns.join(' '));
+      }
+    }
+
+    // Index lists that are new or changed since the last search
+    function getSearchIndex() {
+      PROBLEM_DATA.file_list.forEach(fileKey => {
+        const problems = PROBLEM_DATA.data[fileKey] || [];
+        const indexed = SEARCH_INDEX.lists.get(fileKey);
+        if (indexed && indexed[0] === problems && indexed[1] === problems.length) return;
+        problems.forEach(problem => indexSearchProblem(SEARCH_INDEX, problem, fileKey));
+        SEARCH_INDEX.lists.set(fileKey, [problems, problems.length]);
+      });
+      return SEARCH_INDEX;
+    }
+
+    // Keep a problem's comment tokens current (called by setProblemField)
+    function updateSearchComments(id, comments) {
+      const doc = SEARCH_INDEX.docs.get(id);
+      if (doc) setSearchField(SEARCH_INDEX, doc, 'comments', comments);
+    }
+
+    // Edit distance between a and b, or limit + 1 once it exceeds limit
+    function boundedEditDistance(a, b, limit) {
+      if (Math.abs(a.length - b.length) > limit) return limit + 1;
+      let prev = Array.from({ length: b.length + 1 }, (_, j) => j);
+      for (let i = 1; i <= a.length; i++) {
+        const row = [i];
+        let best = i;
+        for (let j = 1; j <= b.length; j++) {
+          const cost = a[i - 1] === b[j - 1] ? 0 : 1;
+          row[j] = Math.min(prev[j] + 1, row[j - 1] + 1, prev[j - 1] + cost);
+          if (row[j] < best) best = row[j];
+        }
+        if (best > limit) return limit + 1;
+        prev = row;
+      }
+      return prev[b.length];
+    }
+
+    // Weight of the most important field a token appears in
+    function searchFieldWeight(mask) {
+      if (mask & SEARCH_FIELDS.name) return SEARCH_FIELD_WEIGHTS.name;
+      if (mask & SEARCH_FIELDS.pattern) return SEARCH_FIELD_WEIGHTS.pattern;
+      return SEARCH_FIELD_WEIGHTS.comments;
+    }
+
+    function tokensWithPrefix(index, prefix) {
+      if (!index.sortedTokens) index.sortedTokens = Array.from(index.postings.keys()).sort();
+      const tokens = index.sortedTokens;
+      let lo = 0;
+      let hi = tokens.length;
+      while (lo < hi) {
+        const mid = (lo + hi) >>> 1;
+        if (tokens[mid] < prefix) lo = mid + 1; else hi = mid;
+      }
+      const matches = [];
+      for (let i = lo; i < tokens.length && tokens[i].startsWith(prefix); i++) matches.push(tokens[i]);
+      return matches;
+    }
+
+    // Vocabulary tokens matching one query term, each with a match score
+    function matchSearchTerm(index, term) {
+      const matches = new Map();
+      const add = (token, score) => {
+        if (!matches.has(token) || matches.get(token) < score) matches.set(token, score);
+      };
+
+      tokensWithPrefix(index, term).forEach(token => {
+        add(token, token === term ? SEARCH_MATCH_SCORES.exact : SEARCH_MATCH_SCORES.prefix);
+      });
+
+      const grams = searchTrigrams(term);
+      if (grams.length === 0) return matches;
+
+      // Count shared trigrams per token; a substring shares all of them
+      const shared = new Map();
+      grams.forEach(gram => {
+        (index.grams.get(gram) || []).forEach(token => shared.set(token, (shared.get(token) || 0) + 1));
+      });
+
+      const maxEdits = term.length >= 8 ? 2 : 1;
+      const minShared = Math.max(1, grams.length - 3 * maxEdits);
+      shared.forEach((count, token) => {
+        if (matches.has(token)) return;
+        if (count === grams.length && token.includes(term)) {
+          add(token, SEARCH_MATCH_SCORES.substring);
+        } else if (term.length >= 4 && count >= minShared &&
+                   boundedEditDistance(term, token, maxEdits) <= maxEdits) {
+          add(token, SEARCH_MATCH_SCORES.fuzzy);
+        }
+      });
+      return matches;
+    }
+
+    // IDs of the documents whose text may contain the search text as a
+    // substring, or null when no run of 3+ letters or digits narrows it down.
+    // Such a run lies inside one word of any text containing it, so the
+    // documents with a token containing the longest run cover every match.
+    function searchSubstringCandidates(index, search) {
+      const runs = String(search || '').toLowerCase().match(/[a-z0-9]+/g) || [];
+      const run = runs.reduce((longest, part) => (part.length > longest.length ? part : longest), '');
+      if (run.length < 3) return null;
+
+      // Tokens containing the run share all its trigrams; start from the rarest
+      let tokens = null;
+      for (const gram of searchTrigrams(run)) {
+        const withGram = index.grams.get(gram);
+        if (!withGram) return new Set();
+        if (!tokens || withGram.size < tokens.size) tokens = withGram;
+      }
+      const ids = new Set();
+      tokens.forEach(token => {
+        if (token.includes(run)) index.postings.get(token).forEach((_, id) => ids.add(id));
+      });
+      return ids;
+    }
+
+    /**
+     * Search every list at once. Each query term must match a name, pattern
+     * or comment token exactly, as a prefix, as a substring (3+ characters)
+     * or within a small edit distance (4+ characters). Returns
+     * [{ id, name, score }] ranked by score, best first; ties go to the
+     * shorter (more specific) name.
+     */
+    function searchProblemIndex(index, query) {
+      const terms = Array.from(new Set(String(query || '').toLowerCase().match(/[a-z0-9]+/g) || []));
+      if (terms.length === 0) return [];
+
+      let scores = null;
+      for (const term of terms) {
+        const termScores = new Map();
+        matchSearchTerm(index, term).forEach((matchScore, token) => {
+          index.postings.get(token).forEach((mask, id) => {
+            if (scores && !scores.has(id)) return;
+            const score = matchScore * searchFieldWeight(mask);
+            if (!termScores.has(id) || termScores.get(id) < score) termScores.set(id, score);
+          });
+        });
+        if (scores) termScores.forEach((score, id) => termScores.set(id, score + scores.get(id)));
+        scores = termScores;
+        if (scores.size === 0) break;
+      }
+
+      return Array.from(scores, ([id, score]) => ({ id, name: index.docs.get(id).name, score }))
+        .sort((a, b) => b.score - a.score || a.name.length - b.name.length || a.name.localeCompare(b.name));
+    }
+
+    function searchProblems(query) {
+      return searchProblemIndex(getSearchIndex(), query);
+    }
+
+    // === Global Search View ===
+    // One result per unique problem across every list, tagged with the lists
+    // containing it. Clicking a tag opens that list at the problem's row.
+
+    const GLOBAL_SEARCH_LIMIT = 50;
+
+    function getListLabel(fileKey) {
+      const btn = document.querySelector(`.tab-button[data-tab="${fileKey}"]`);
+      return btn ? btn.textContent.trim() : fileKey;
+    }
+
+    function createGlobalSearchItem(hit) {
+      const doc = SEARCH_INDEX.docs.get(hit.id);
+      const item = document.createElement('li');
+      item.className = 'global-search-item';
+
+      const name = document.createElement('span');
+      name.className = 'global-search-name';
+      name.textContent = doc.name;
+      if (getProblemState(hit.id).solved) {
+        item.classList.add('solved');
+        name.title = 'Solved';
+      }
+      item.appendChild(name);
+
+      if (doc.difficulty) {
+        const badge = document.createElement('span');
+        badge.className = `difficulty-badge difficulty-${doc.difficulty}`;
+        badge.textContent = doc.difficulty;
+        item.appendChild(badge);
+      }
+
+      const tags = document.createElement('span');
+      tags.className = 'global-search-tags';
+      doc.lists.forEach(fileKey => {
+        const tag = document.createElement('button');
+        tag.type = 'button';
+        tag.className = 'global-search-tag';
+        tag.dataset.tab = fileKey;
+        tag.dataset.problemId = hit.id;
+        tag.textContent = getListLabel(fileKey);
+        tag.title = `Open in ${tag.textContent}`;
+        tags.appendChild(tag);
+      });
+      item.appendChild(tags);
+      return item;
+    }
+
+    function renderGlobalSearchResults(query) {
+      const container = document.getElementById('global-search-results');
+      if (!container) return;
+      container.innerHTML = '';
+      if (!query.trim()) {
+        container.style.display = 'none';
+        return;
+      }
+
+      const hits = searchProblems(query);
+      const summary = document.createElement('div');
+      summary.className = 'global-search-summary';
+      if (hits.length === 0) {
+        summary.textContent = 'No problems found';
+      } else if (hits.length > GLOBAL_SEARCH_LIMIT) {
+        summary.textContent = `Showing ${GLOBAL_SEARCH_LIMIT} of ${hits.length} problems`;
+      } else {
+        summary.textContent = `${hits.length} problem${hits.length === 1 ? '' : 's'}`;
+      }
+      container.appendChild(summary);
+
+      const list = document.createElement('ul');
+      list.className = 'global-search-list';
+      hits.slice(0, GLOBAL_SEARCH_LIMIT).forEach(hit => list.appendChild(createGlobalSearchItem(hit)));
+      container.appendChild(list);
+      container.style.display = '';
+    }
+
+    // Show a search hit in one of its lists, clearing filters that hide it
+    function openSearchHit(fileKey, id) {
+      switchTab(fileKey);
+      const idx = findProblemIndex(fileKey, PROBLEM_NAMES[id]);
+      if (idx === -1) return;
+
+      const view = getTableView(fileKey);
+      if (!view.visible.includes(idx)) clearFilters(fileKey);
+      const position = view.visible.indexOf(idx);
+      if (position !== -1) highlightProblemRow(fileKey, position);
+    }
+
+    function initGlobalSearch() {
+      const input = document.getElementById('global-search');
+      const container = document.getElementById('global-search-results');
+      if (!input || !container) return;
+
+      const update = debounce(() => renderGlobalSearchResults(input.value), SEARCH_DEBOUNCE_MS);
+      input.addEventListener('input', update);
+      input.addEventListener('keydown', event => {
+        if (event.key === 'Escape') {
+          input.value = '';
+          renderGlobalSearchResults('');
+        }
+      });
+      container.addEventListener('click', event => {
+        const tag = event.target.closest('.global-search-tag');
+        if (tag) openSearchHit(tag.dataset.tab, tag.dataset.problemId);
+      });
+    }
+    """
+
+    return js
+
+
+if __name__ == "__main__":
+    print(generate_js_search())
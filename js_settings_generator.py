@@ -71,14 +71,11 @@ def generate_js_settings():
 
           <div class="settings-section">
             <h3>Auto-Refresh</h3>
-            <p class="settings-hint">How often to update awareness colors automatically</p>
+            <p class="settings-hint">Automatic updates change each color exactly when a problem crosses a threshold</p>
             <label>
-              Refresh interval:
+              Color updates:
               <select id="setting-refreshInterval" class="settings-input settings-select">
-                <option value="3600000">Every hour</option>
-                <option value="21600000">Every 6 hours</option>
-                <option value="43200000">Every 12 hours</option>
-                <option value="86400000">Daily (recommended)</option>
+                <option value="86400000">Automatic (recommended)</option>
                 <option value="0">Manual only</option>
               </select>
             </label>
@@ -400,8 +397,10 @@ def generate_js_settings():
       document.getElementById('setting-threshold-darkRed').value = validatedThresholds.darkRed;
 
       // Refresh settings
-      AWARENESS_CONFIG.refreshInterval = parseInt(document.getElementById('setting-refreshInterval').value) || 86400000;
+      const refreshInterval = parseInt(document.getElementById('setting-refreshInterval').value);
+      AWARENESS_CONFIG.refreshInterval = isNaN(refreshInterval) ? 86400000 : refreshInterval;
       AWARENESS_CONFIG.refreshOnFocus = document.getElementById('setting-refreshOnFocus').checked;
+      invalidateAwarenessConfig();
     }
 
     // Setup real-time preview on input change
@@ -453,7 +452,7 @@ def generate_js_settings():
       }
 
       updateAwarenessColors();
-      setupAwarenessRefresh();  // Re-setup with new interval
+      setupAwarenessRefresh();  // Re-setup with new update mode
       const overlay = document.getElementById('settings-overlay');
       if (overlay) {
         overlay.classList.remove('visible');
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Progress Storage Sub-Agent
+Optional IndexedDB backend storing one record per canonical problem
+"""
+
+
+def generate_js_storage():
+    """Generate JavaScript IndexedDB progress storage"""
+
+    js = """
+    // === IndexedDB Progress Storage ===
+    // When IndexedDB is available, progress is stored there as one record per
+    // canonical problem (plus a meta record in the config store) instead of a
+    // single localStorage blob. Only problems changed since the last write are
+    // stored, in one asynchronous transaction per flush. The first run copies
+    // the localStorage progress (current or legacy tracker_<fileKey> saves)
+    // into the database. Without IndexedDB, localStorage is used as before.
+    // Records carry the time they were written (savedAt) so they can be
+    // compared with the progress journal below.
+
+    const PROGRESS_DB_NAME = 'grindpulse';
+    const PROGRESS_DB_VERSION = 1;
+    const PROGRESS_STORE = 'problems';
+    const PROGRESS_CONFIG_STORE = 'config';
+    const PROGRESS_META_KEY = 'meta';
+
+    // Open database once progress is stored in IndexedDB, otherwise null
+    let progressDb = null;
+
+    function isIndexedDBAvailable() {
+      try {
+        return typeof indexedDB !== 'undefined' && indexedDB !== null;
+      } catch (e) {
+        return false;
+      }
+    }
+
+    function isProgressDbActive() {
+      return progressDb !== null;
+    }
+
+    // Stored form of a problem's progress, or null when there is nothing to keep
+    function toProblemRecord(id, state) {
+      if (!state || !hasProblemProgress(state)) return null;
+      return {
+        id,
+        solved: state.solved,
+        time_to_solve: state.time_to_solve,
+        comments: state.comments,
+        solved_date: state.solved_date
+      };
+    }
+
+    // Stored records in the shape accepted by restoreProblemState()
+    function recordsToSavedState(records) {
+      const problems = {};
+      records.forEach(record => {
+        if (record && record.id) problems[record.id] = record;
+      });
+      return { version: PROBLEM_STATE_VERSION, problems };
+    }
+
+    function promisifyRequest(request) {
+      return new Promise((resolve, reject) => {
+        request.onsuccess = () => resolve(request.result);
+        request.onerror = () => reject(request.error);
+      });
+    }
+
+    function transactionDone(tx) {
+      return new Promise((resolve, reject) => {
+        tx.oncomplete = () => resolve();
+        tx.onerror = () => reject(tx.error);
+        tx.onabort = () => reject(tx.error || new Error('Transaction aborted'));
+      });
+    }
+
+    function openProgressDb() {
+      return new Promise((resolve, reject) => {
+        const request = indexedDB.open(PROGRESS_DB_NAME, PROGRESS_DB_VERSION);
+        request.onupgradeneeded = () => {
+          const db = request.result;
+          if (!db.objectStoreNames.contains(PROGRESS_STORE)) {
+            db.createObjectStore(PROGRESS_STORE, { keyPath: 'id' });
+          }
+          if (!db.objectStoreNames.contains(PROGRESS_CONFIG_STORE)) {
+            db.createObjectStore(PROGRESS_CONFIG_STORE, { keyPath: 'key' });
+          }
+        };
+        request.onsuccess = () => resolve(request.result);
+        request.onerror = () => reject(request.error);
+        request.onblocked = () => reject(new Error('Progress database upgrade blocked by another tab'));
+      });
+    }
+
+    // Put or delete the records of the given problems in one transaction
+    function writeProblemRecords(db, ids, meta) {
+      const tx = db.transaction([PROGRESS_STORE, PROGRESS_CONFIG_STORE], 'readwrite');
+      const store = tx.objectStore(PROGRESS_STORE);
+      const savedAt = Date.now();
+      ids.forEach(id => {
+        const record = toProblemRecord(id, PROBLEM_STATE[id]);
+        if (record) {
+          record.savedAt = savedAt;
+          store.put(record);
+        } else {
+          store.delete(id);
+        }
+      });
+      if (meta) tx.objectStore(PROGRESS_CONFIG_STORE).put(meta);
+      const done = transactionDone(tx);
+      if (typeof tx.commit === 'function') tx.commit();
+      return done;
+    }
+
+    // Move localStorage progress into the database, then drop the old keys
+    // (kept if they could not be read, so nothing unreadable is thrown away)
+    async function migrateProgressToIndexedDB(db) {
+      const loaded = loadFromLocalStorage();
+      await writeProblemRecords(db, Object.keys(PROBLEM_STATE), {
+        key: PROGRESS_META_KEY,
+        version: PROBLEM_STATE_VERSION,
+        migratedAt: new Date().toISOString()
+      });
+      if (!loaded) return;
+      localStorage.removeItem(PROBLEM_STATE_KEY);
+      PROBLEM_DATA.file_list.forEach(fileKey => localStorage.removeItem(`tracker_${fileKey}`));
+    }
+
+    // === Progress Journal ===
+    // An IndexedDB write started as the page is hidden or closed may never
+    // commit. So when the page is hidden, the problems not yet committed are
+    // also written synchronously to a localStorage journal, as is every change
+    // saved while the database is failing (browser-storage fallback). The next
+    // load with the database applies the journal entries newer than the
+    // stored records, writes them back and clears the journal.
+
+    const PROGRESS_JOURNAL_KEY = 'tracker_progress_journal';
+    // Problem IDs of IndexedDB writes not yet committed, one array per write
+    const PROGRESS_WRITES_IN_FLIGHT = new Set();
+
+    // id -> { savedAt, record } (record is null when the problem has no progress)
+    function readProgressJournal() {
+      try {
+        const journal = JSON.parse(localStorage.getItem(PROGRESS_JOURNAL_KEY) || '{}');
+        return journal && typeof journal === 'object' ? journal : {};
+      } catch (e) {
+        console.error('Error reading progress journal:', e);
+        return {};
+      }
+    }
+
+    // Add the current state of the given problems to the journal
+    function writeProgressJournal(ids) {
+      if (ids.length === 0) return;
+      const savedAt = Date.now();
+      try {
+        const journal = readProgressJournal();
+        ids.forEach(id => {
+          journal[id] = { savedAt, record: toProblemRecord(id, PROBLEM_STATE[id]) };
+        });
+        localStorage.setItem(PROGRESS_JOURNAL_KEY, JSON.stringify(journal));
+      } catch (e) {
+        console.error('Error writing progress journal:', e);
+      }
+    }
+
+    function clearProgressJournal() {
+      try {
+        localStorage.removeItem(PROGRESS_JOURNAL_KEY);
+      } catch (e) {
+        console.error('Error clearing progress journal:', e);
+      }
+    }
+
+    // Problems changed but not yet committed to the database
+    function getUncommittedProblemIds() {
+      const ids = new Set(UNSAVED_PROBLEM_IDS);
+      PROGRESS_WRITES_IN_FLIGHT.forEach(write => write.forEach(id => ids.add(id)));
+      return Array.from(ids);
+    }
+
+    // Forget the uncommitted problems when the stored copy is replaced
+    // wholesale, so hiding the page does not journal them over it
+    function discardUncommittedProgress() {
+      UNSAVED_PROBLEM_IDS.clear();
+      PROGRESS_WRITES_IN_FLIGHT.clear();
+    }
+
+    // Stored records with the newer journal entries applied, and the IDs
+    // taken from the journal
+    function mergeProgressJournal(records, journal) {
+      const merged = new Map();
+      records.forEach(record => {
+        if (record && record.id) merged.set(record.id, record);
+      });
+      const applied = [];
+      Object.keys(journal).forEach(id => {
+        const entry = journal[id];
+        if (!entry || typeof entry.savedAt !== 'number') return;
+        const stored = merged.get(id);
+        if (stored && (stored.savedAt || 0) >= entry.savedAt) return;
+        if (entry.record) {
+          merged.set(id, entry.record);
+        } else {
+          merged.delete(id);
+        }
+        applied.push(id);
+      });
+      return { records: Array.from(merged.values()), applied };
+    }
+
+    /**
+     * Load progress from IndexedDB into the registry, migrating on first use.
+     * Falls back to localStorage (with a toast) if the database fails.
+     */
+    async function loadFromIndexedDB() {
+      try {
+        const db = await openProgressDb();
+        const tx = db.transaction([PROGRESS_STORE, PROGRESS_CONFIG_STORE], 'readonly');
+        const [records, meta] = await Promise.all([
+          promisifyRequest(tx.objectStore(PROGRESS_STORE).getAll()),
+          promisifyRequest(tx.objectStore(PROGRESS_CONFIG_STORE).get(PROGRESS_META_KEY))
+        ]);
+
+        if (meta) {
+          const merged = mergeProgressJournal(records, readProgressJournal());
+          restoreProblemState(recordsToSavedState(merged.records));
+          if (merged.applied.length > 0) await writeProblemRecords(db, merged.applied);
+        } else {
+          await migrateProgressToIndexedDB(db);
+        }
+        clearProgressJournal();
+        UNSAVED_PROBLEM_IDS.clear();
+        progressDb = db;
+      } catch (e) {
+        console.error('IndexedDB unavailable, using localStorage for progress:', e);
+        showStorageToast('Your progress database could not be opened. Progress is saved in browser storage instead.', 'warning');
+        progressDb = null;
+        loadFromLocalStorage();
+      }
+    }
+
+    // Write problems changed since the last write (called by saveProblemState)
+    function saveProblemStateToIndexedDB() {
+      const ids = Array.from(UNSAVED_PROBLEM_IDS);
+      UNSAVED_PROBLEM_IDS.clear();
+      if (ids.length === 0) return Promise.resolve();
+
+      PROGRESS_WRITES_IN_FLIGHT.add(ids);
+      return writeProblemRecords(progressDb, ids).catch(e => {
+        console.error('Error saving progress:', e);
+        ids.forEach(id => UNSAVED_PROBLEM_IDS.add(id));
+        showStorageToast('Your progress could not be saved. Consider exporting your data as a backup.', 'warning');
+      }).finally(() => PROGRESS_WRITES_IN_FLIGHT.delete(ids));
+    }
+
+    // Called as the page is hidden or closed, before the pending write starts
+    function journalUncommittedProgress() {
+      if (isProgressDbActive()) writeProgressJournal(getUncommittedProblemIds());
+    }
+
+    // Replace all stored progress with a serialized registry (or clear it)
+    function replaceStoredProblemState(saved) {
+      // Older journal entries must not be applied over the replacement
+      clearProgressJournal();
+      if (!isProgressDbActive()) {
+        if (saved) {
+          localStorage.setItem(PROBLEM_STATE_KEY, JSON.stringify(saved));
+        } else {
+          localStorage.removeItem(PROBLEM_STATE_KEY);
+        }
+        return Promise.resolve();
+      }
+
+      const tx = progressDb.transaction([PROGRESS_STORE], 'readwrite');
+      const store = tx.objectStore(PROGRESS_STORE);
+      store.clear();
+      const problems = (saved && saved.problems) || {};
+      const savedAt = Date.now();
+      Object.keys(problems).forEach(id => {
+        const record = toProblemRecord(id, problems[id]);
+        if (record) store.put({ ...record, savedAt });
+      });
+      return transactionDone(tx);
+    }
+    """
+
+    return js
+
+
+if __name__ == "__main__":
+    print(generate_js_storage())
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Timer Scheduler Sub-Agent
+One visibility-aware timer for awareness transitions and relative solved dates
+"""
+
+
+def generate_js_timers():
+    """Generate JavaScript timer scheduler"""
+
+    js = """
+    // === Timer Scheduler ===
+    // Every deferred wake-up of the page goes through one setTimeout armed for
+    // the earliest named job: the awareness transitions ('awareness') and the
+    // relative "Solved" dates of the visible tab ('relative-dates'). While the
+    // page is hidden the timer is cleared; when it becomes visible again the
+    // jobs that fell due meanwhile run once and the timer is re-armed.
+
+    // setTimeout delays above this overflow; longer waits re-arm on wake-up
+    const TIMER_MAX_MS = 2147483647;
+
+    // name -> { at, fn }; only a handful of jobs, so a scan finds the earliest
+    const TIMER_JOBS = new Map();
+    let timerHandle = null;
+    let timerHandleAt = Infinity;
+
+    function isPageHidden() {
+      return document.visibilityState === 'hidden';
+    }
+
+    // Run fn at time `at` (ms), replacing the job's previous time; Infinity cancels it
+    function setTimerJob(name, at, fn) {
+      if (at < Infinity) {
+        TIMER_JOBS.set(name, { at, fn });
+      } else if (!TIMER_JOBS.delete(name)) {
+        return;
+      }
+      armTimers();
+    }
+
+    function getTimerJobAt(name) {
+      const job = TIMER_JOBS.get(name);
+      return job ? job.at : Infinity;
+    }
+
+    // Point the single timer at the earliest job (none while hidden)
+    function armTimers() {
+      let next = Infinity;
+      if (!isPageHidden()) TIMER_JOBS.forEach(job => { next = Math.min(next, job.at); });
+      if (next === timerHandleAt) return;
+      if (timerHandle !== null) clearTimeout(timerHandle);
+      timerHandle = null;
+      timerHandleAt = next;
+      if (next === Infinity) return;
+      timerHandle = setTimeout(runTimerJobs, Math.min(Math.max(0, next - Date.now()), TIMER_MAX_MS));
+    }
+
+    // Run the jobs that are due; each may schedule itself again
+    function runTimerJobs() {
+      if (timerHandle !== null) clearTimeout(timerHandle);
+      timerHandle = null;
+      timerHandleAt = Infinity;
+      const now = Date.now();
+      const due = [];
+      TIMER_JOBS.forEach((job, name) => { if (job.at <= now) due.push([name, job]); });
+      due.forEach(([name, job]) => {
+        if (TIMER_JOBS.get(name) !== job) return;
+        TIMER_JOBS.delete(name);
+        try {
+          job.fn();
+        } catch (e) {
+          console.error(`Timer job ${name} failed:`, e);
+        }
+      });
+      armTimers();
+    }
+
+    document.addEventListener('visibilitychange', () => {
+      if (isPageHidden()) {
+        armTimers();
+      } else {
+        runTimerJobs();
+      }
+    });
+
+    // === Relative Solved Dates ===
+    // formatRelativeTime() shows a whole number of minutes, hours, days,
+    // weeks, months or years, so the moment each cell's text next changes is
+    // known when it is written. Cells record that time, and one timer job
+    // refreshes just the rendered rows of the visible tab whose text is due;
+    // other tabs are caught up when switched to.
+
+    const RELATIVE_TIME_MINUTE_MS = 60 * 1000;
+    const RELATIVE_TIME_DAY_MS = 24 * 60 * RELATIVE_TIME_MINUTE_MS;
+    // [age limit, unit] for each wording after "just now" (see formatRelativeTime)
+    const RELATIVE_TIME_STEPS = [
+      [60 * RELATIVE_TIME_MINUTE_MS, RELATIVE_TIME_MINUTE_MS],
+      [RELATIVE_TIME_DAY_MS, 60 * RELATIVE_TIME_MINUTE_MS],
+      [7 * RELATIVE_TIME_DAY_MS, RELATIVE_TIME_DAY_MS],
+      [28 * RELATIVE_TIME_DAY_MS, 7 * RELATIVE_TIME_DAY_MS],
+      [360 * RELATIVE_TIME_DAY_MS, 30 * RELATIVE_TIME_DAY_MS],
+      [Infinity, 365 * RELATIVE_TIME_DAY_MS]
+    ];
+
+    // Time (ms) after `now` at which formatRelativeTime(isoDate) next changes,
+    // or Infinity if it never will (no date, invalid date)
+    function getRelativeTimeChangeAt(isoDate, now) {
+      if (!isoDate) return Infinity;
+      const date = new Date(isoDate).getTime();
+      if (isNaN(date)) return Infinity;
+      const diffMs = now - date;
+      if (diffMs < RELATIVE_TIME_MINUTE_MS) return date + RELATIVE_TIME_MINUTE_MS;
+      const [, unit] = RELATIVE_TIME_STEPS.find(([limit]) => diffMs < limit);
+      return date + (Math.floor(diffMs / unit) + 1) * unit;
+    }
+
+    // Date cell -> time its text goes stale
+    const RELATIVE_DATE_DUE = new WeakMap();
+
+    // Called whenever a date cell is written
+    function noteRelativeDate(cell, isoDate) {
+      const at = getRelativeTimeChangeAt(isoDate, Date.now());
+      if (at === Infinity) {
+        RELATIVE_DATE_DUE.delete(cell);
+        return;
+      }
+      RELATIVE_DATE_DUE.set(cell, at);
+      if (at < getTimerJobAt('relative-dates')) setTimerJob('relative-dates', at, refreshRelativeDates);
+    }
+
+    // Re-render the visible tab's rows whose date text is stale and wait for the next one
+    function refreshRelativeDates() {
+      const view = TABLE_VIEWS[currentTab];
+      const now = Date.now();
+      let next = Infinity;
+      if (view) {
+        view.rows.forEach((row, idx) => {
+          const at = RELATIVE_DATE_DUE.get(ROW_CELLS.get(row).dateCell);
+          if (at === undefined) return;
+          if (at <= now) {
+            // Rewriting the cell notes its next change
+            scheduleRowRender(currentTab, idx);
+          } else {
+            next = Math.min(next, at);
+          }
+        });
+      }
+      setTimerJob('relative-dates', next, refreshRelativeDates);
+    }
+    """
+
+    return js
+
+
+if __name__ == "__main__":
+    print(generate_js_timers())
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Virtual Table Sub-Agent
+Renders only the table rows in or near the viewport and recycles row elements
+"""
+
+
+def generate_js_virtual_table():
+    """Generate JavaScript for virtualized table rendering"""
+
+    js = """
+    // === Virtualized Table ===
+    // Each tab keeps its rows as arrays of problem indexes: `order` (sorted)
+    // and `visible` (sorted and filtered). Only the visible rows in or near
+    // the viewport exist in the DOM; two spacer rows stand in for the rest.
+    // Row elements that scroll out of the window are pooled and rebound.
+
+    const VIRTUAL_TABLE_CONFIG = {
+      minRows: 100,          // Lists with at most this many visible rows render every row
+      overscan: 10,          // Extra rows rendered above and below the viewport
+      defaultRowHeight: 56   // Row height estimate (px) until a rendered row is measured
+    };
+
+    const TABLE_VIEWS = {};
+
+    function getTableView(fileKey) {
+      if (!TABLE_VIEWS[fileKey]) {
+        TABLE_VIEWS[fileKey] = {
+          order: [],
+          visible: [],
+          rows: new Map(),   // problem index -> rendered <tr>
+          pool: [],          // detached rows ready for reuse
+          start: 0,
+          end: 0,
+          rowHeight: 0,
+          highlightIdx: -1,
+          topSpacer: null,
+          bottomSpacer: null
+        };
+      }
+      return TABLE_VIEWS[fileKey];
+    }
+
+    // Rendered row for a problem, or null when it is outside the window
+    function getRenderedRow(fileKey, idx) {
+      const view = TABLE_VIEWS[fileKey];
+      return (view && view.rows.get(idx)) || null;
+    }
+
+    // <tr> -> { checkbox, timeInput, commentsInput, dateCell }, registered by
+    // createTableRow() so per-row updates never search a row for its cells
+    const ROW_CELLS = new WeakMap();
+
+    // Range [start, end) of visible positions to render for a scroll offset
+    // measured from the top of the table body
+    function computeVirtualRange(count, scrollOffset, viewportHeight, rowHeight, config) {
+      if (count <= config.minRows) return { start: 0, end: count };
+      const offset = Math.max(0, scrollOffset);
+      const first = Math.min(count, Math.floor(offset / rowHeight));
+      const last = Math.min(count, Math.ceil((offset + viewportHeight) / rowHeight));
+      return {
+        start: Math.max(0, first - config.overscan),
+        end: Math.min(count, last + config.overscan)
+      };
+    }
+
+    function createSpacerRow() {
+      const tr = document.createElement('tr');
+      tr.className = 'virtual-spacer';
+      tr.setAttribute('aria-hidden', 'true');
+      const td = document.createElement('td');
+      td.colSpan = 10;
+      tr.appendChild(td);
+      return tr;
+    }
+
+    function setSpacerHeight(spacer, height) {
+      spacer.style.height = `${height}px`;
+      spacer.style.display = height > 0 ? '' : 'none';
+    }
+
+    // Detach every rendered row so the next render rebinds them from the data
+    function releaseRenderedRows(fileKey) {
+      const view = getTableView(fileKey);
+      view.rows.forEach(row => {
+        row.remove();
+        view.pool.push(row);
+      });
+      view.rows.clear();
+    }
+
+    // Make the DOM match the window of view.visible around the viewport
+    function renderVirtualRows(fileKey) {
+      const tbody = document.getElementById(`tbody-${fileKey}`);
+      if (!tbody) return;
+      const view = getTableView(fileKey);
+      const problems = PROBLEM_DATA.data[fileKey];
+
+      if (!view.topSpacer || view.topSpacer.parentNode !== tbody) {
+        tbody.innerHTML = '';
+        view.rows.clear();
+        view.pool = [];
+        view.topSpacer = createSpacerRow();
+        view.bottomSpacer = createSpacerRow();
+        tbody.appendChild(view.topSpacer);
+        tbody.appendChild(view.bottomSpacer);
+      }
+
+      const rowHeight = view.rowHeight || VIRTUAL_TABLE_CONFIG.defaultRowHeight;
+      const { start, end } = computeVirtualRange(
+        view.visible.length,
+        -tbody.getBoundingClientRect().top,
+        window.innerHeight,
+        rowHeight,
+        VIRTUAL_TABLE_CONFIG
+      );
+      view.start = start;
+      view.end = end;
+
+      // Release rows that left the window
+      const wanted = new Set(view.visible.slice(start, end));
+      view.rows.forEach((row, idx) => {
+        if (!wanted.has(idx)) {
+          row.remove();
+          view.rows.delete(idx);
+          view.pool.push(row);
+        }
+      });
+
+      // Bind rows that entered it and put everything in visible order
+      let prev = view.topSpacer;
+      for (let pos = start; pos < end; pos++) {
+        const idx = view.visible[pos];
+        let row = view.rows.get(idx);
+        if (!row) {
+          row = view.pool.pop() || createTableRow(fileKey);
+          fillTableRow(row, problems[idx], idx, fileKey);
+          view.rows.set(idx, row);
+        }
+        if (prev.nextSibling !== row) tbody.insertBefore(row, prev.nextSibling);
+        prev = row;
+      }
+
+      setSpacerHeight(view.topSpacer, start * rowHeight);
+      setSpacerHeight(view.bottomSpacer, (view.visible.length - end) * rowHeight);
+
+      // Replace the estimate with the real row height once rows are laid out
+      if (!view.rowHeight && view.rows.size > 0) {
+        let total = 0;
+        view.rows.forEach(row => { total += row.offsetHeight; });
+        const measured = total / view.rows.size;
+        if (measured > 0) {
+          view.rowHeight = measured;
+          if (Math.abs(measured - rowHeight) > 1) renderVirtualRows(fileKey);
+        }
+      }
+    }
+
+    // Re-render the active tab only when its window moved
+    function updateVirtualWindow() {
+      const tbody = document.getElementById(`tbody-${currentTab}`);
+      if (!tbody) return;
+      const view = getTableView(currentTab);
+      const { start, end } = computeVirtualRange(
+        view.visible.length,
+        -tbody.getBoundingClientRect().top,
+        window.innerHeight,
+        view.rowHeight || VIRTUAL_TABLE_CONFIG.defaultRowHeight,
+        VIRTUAL_TABLE_CONFIG
+      );
+      if (start !== view.start || end !== view.end) renderVirtualRows(currentTab);
+    }
+
+    let virtualWindowFrame = null;
+    function scheduleVirtualWindowUpdate() {
+      if (virtualWindowFrame !== null) return;
+      virtualWindowFrame = requestAnimationFrame(() => {
+        virtualWindowFrame = null;
+        updateVirtualWindow();
+      });
+    }
+
+    window.addEventListener('scroll', scheduleVirtualWindowUpdate, { passive: true });
+    window.addEventListener('resize', scheduleVirtualWindowUpdate);
+
+    // Scroll the page so a visible position is centered; rows along the way
+    // are rendered by the scroll handler
+    function scrollToVirtualRow(fileKey, position) {
+      const tbody = document.getElementById(`tbody-${fileKey}`);
+      if (!tbody) return;
+      const view = getTableView(fileKey);
+      const rowHeight = view.rowHeight || VIRTUAL_TABLE_CONFIG.defaultRowHeight;
+      const rowTop = window.scrollY + tbody.getBoundingClientRect().top + position * rowHeight;
+      window.scrollTo({ top: Math.max(0, rowTop - (window.innerHeight - rowHeight) / 2), behavior: 'smooth' });
+    }
+    """
+
+    return js
+
+
+if __name__ == "__main__":
+    print(generate_js_virtual_table())
@@ -0,0 +1,58 @@
+/**
+ * Awareness Transition Scheduling (Extracted for Testing)
+ *
+ * SYNCHRONIZATION REQUIREMENT:
+ * These functions mirror the JavaScript code generated by js_awareness_generator.py
+ * (pushAwarenessDue, popAwarenessDue, getNextAwarenessTransition).
+ * When modifying those functions, update this file to keep them in sync.
+ * After changes, verify with: npm test
+ */
+
+import { getAwarenessDailyRate, getConfig } from './awareness.js';
+
+export const AWARENESS_THRESHOLD_KEYS = ['white', 'green', 'yellow', 'red', 'darkRed'];
+export const AWARENESS_DAY_MS = 1000 * 60 * 60 * 24;
+
+export function pushAwarenessDue(heap, entry) {
+  heap.push(entry);
+  let i = heap.length - 1;
+  while (i > 0) {
+    const parent = (i - 1) >> 1;
+    if (heap[parent].at <= entry.at) break;
+    heap[i] = heap[parent];
+    i = parent;
+  }
+  heap[i] = entry;
+}
+
+export function popAwarenessDue(heap) {
+  const top = heap[0];
+  const last = heap.pop();
+  if (heap.length === 0) return top;
+  let i = 0;
+  for (;;) {
+    const left = 2 * i + 1;
+    if (left >= heap.length) break;
+    const child = left + 1 < heap.length && heap[left + 1].at < heap[left].at ? left + 1 : left;
+    if (heap[child].at >= last.at) break;
+    heap[i] = heap[child];
+    i = child;
+  }
+  heap[i] = last;
+  return top;
+}
+
+// Time (ms) at which a problem's awareness class next changes, or
+// Infinity if it never will (unsolved, invalid date, no decay, flashing)
+export function getNextAwarenessTransition(problem, score) {
+  if (score < 0) return Infinity;
+  const solvedAt = new Date(problem.solved_date).getTime();
+  if (isNaN(solvedAt)) return Infinity;
+  const dailyRate = getAwarenessDailyRate(problem);
+  if (!(dailyRate > 0)) return Infinity;
+
+  const thresholds = getConfig().thresholds;
+  const nextKey = AWARENESS_THRESHOLD_KEYS.find(key => thresholds[key] > score);
+  if (nextKey === undefined) return Infinity;
+  return solvedAt + thresholds[nextKey] / dailyRate * AWARENESS_DAY_MS;
+}
@@ -0,0 +1,75 @@
+/**
+ * Unit Tests for Awareness Transition Scheduling
+ */
+
+import {
+  AWARENESS_DAY_MS,
+  pushAwarenessDue,
+  popAwarenessDue,
+  getNextAwarenessTransition
+} from './awareness-schedule.js';
+import {
+  calculateAwarenessScore,
+  getAwarenessClass,
+  getAwarenessDailyRate,
+  setMockProblemData,
+  resetConfig
+} from './awareness.js';
+
+beforeEach(() => {
+  resetConfig();
+  setMockProblemData({ file_list: ['list1'], data: { list1: [] } });
+});
+
+describe('awareness due heap', () => {
+  test('pops entries in time order', () => {
+    const heap = [];
+    [50, 10, 40, 30, 20, 60, 5].forEach(at => pushAwarenessDue(heap, { at }));
+    const order = [];
+    while (heap.length > 0) order.push(popAwarenessDue(heap).at);
+    expect(order).toEqual([5, 10, 20, 30, 40, 50, 60]);
+  });
+
+  test('keeps the minimum on top after mixed pushes and pops', () => {
+    const heap = [];
+    pushAwarenessDue(heap, { at: 3 });
+    pushAwarenessDue(heap, { at: 1 });
+    expect(popAwarenessDue(heap).at).toBe(1);
+    pushAwarenessDue(heap, { at: 2 });
+    expect(heap[0].at).toBe(2);
+    expect(popAwarenessDue(heap).at).toBe(2);
+    expect(popAwarenessDue(heap).at).toBe(3);
+    expect(heap).toEqual([]);
+  });
+});
+
+describe('getNextAwarenessTransition', () => {
+  const solvedAgo = days => new Date(Date.now() - days * AWARENESS_DAY_MS).toISOString();
+  const problem = days => ({ solved: true, time_to_solve: '', difficulty: 'Medium', solved_date: solvedAgo(days) });
+
+  test('returns the time the score reaches the next threshold', () => {
+    const p = problem(2);
+    const { score } = calculateAwarenessScore(p);
+    const at = getNextAwarenessTransition(p, score);
+    const expected = Date.parse(p.solved_date) + 10 / getAwarenessDailyRate(p) * AWARENESS_DAY_MS;
+    expect(getAwarenessClass(score)).toBe('awareness-white');
+    expect(at).toBeCloseTo(expected, 0);
+  });
+
+  test('keeps the class until the returned time and changes it just after', () => {
+    const p = problem(4);
+    const at = getNextAwarenessTransition(p, calculateAwarenessScore(p).score);
+    const shifted = ms => ({ ...p, solved_date: new Date(Date.parse(p.solved_date) - (at - Date.now()) + ms).toISOString() });
+    expect(getAwarenessClass(calculateAwarenessScore(p).score)).toBe('awareness-green');
+    expect(getAwarenessClass(calculateAwarenessScore(shifted(1000)).score)).toBe('awareness-green');
+    expect(getAwarenessClass(calculateAwarenessScore(shifted(-1000)).score)).toBe('awareness-yellow');
+  });
+
+  test('never changes unsolved, invalid-date, mastered or flashing problems', () => {
+    expect(getNextAwarenessTransition({ solved: false }, -1)).toBe(Infinity);
+    expect(getNextAwarenessTransition({ solved: true, solved_date: 'bad' }, 5)).toBe(Infinity);
+    const mastered = { solved: true, time_to_solve: '5', top_time: '10', difficulty: 'Easy', solved_date: solvedAgo(3) };
+    expect(getNextAwarenessTransition(mastered, 0)).toBe(Infinity);
+    expect(getNextAwarenessTransition(problem(400), 95)).toBe(Infinity);
+  });
+});
@@ -6,8 +6,9 @@
 /**
  * SYNCHRONIZATION REQUIREMENT:
  * These functions mirror the JavaScript code generated by js_awareness_generator.py.
- * When modifying getTierName(), getTierDifficultyMultiplier(), getCommitmentFactor(),
- * getSolvedFactor(), getDaysSinceCompletion(), calculateAwarenessScore(), or getAwarenessClass(),
+ * When modifying getTierName(), getAwarenessFactors(), getTierDifficultyMultiplier(),
+ * getTotalUniqueSolvedCount(), getCommitmentFactor(), getSolvedFactor(), getDaysSinceCompletion(),
+ * getAwarenessDailyRate(), calculateAwarenessScore(), or getAwarenessClass(),
  * you MUST update both files to keep them in sync.
  * After changes, verify with: npm test
  */
@@ -62,17 +63,31 @@ export const DEFAULT_AWARENESS_CONFIG = {
 // Current awareness config
 let AWARENESS_CONFIG = JSON.parse(JSON.stringify(DEFAULT_AWARENESS_CONFIG));
 
-// Mock global state for testing
-let PROBLEM_DATA = {
-  file_list: [],
-  data: {}
-};
+// Mock problem registry for testing: one record per problem name
+let PROBLEM_STATE = {};
+
+// Unique solved problems (null = count the registry again on next use)
+let uniqueSolvedCount = null;
+
+// Bumped on every config change; factors cached under an older version are stale
+let awarenessConfigVersion = 0;
+
+// problem -> { timeToSolve, configVersion, tier, multiplier, solvedScaling }
+const AWARENESS_FACTOR_CACHE = new WeakMap();
 
 /**
- * Set mock problem data for testing
+ * Set mock problem data for testing. Rows of the same problem share one
+ * registry record, as they do in the generated code.
  */
 export function setMockProblemData(data) {
-  PROBLEM_DATA = data;
+  PROBLEM_STATE = {};
+  data.file_list.forEach(fileKey => {
+    data.data[fileKey].forEach(p => {
+      if (!PROBLEM_STATE[p.name]) PROBLEM_STATE[p.name] = { solved: false };
+      if (p.solved) PROBLEM_STATE[p.name].solved = true;
+    });
+  });
+  resetUniqueSolvedCount();
 }
 
 /**
@@ -80,6 +95,7 @@ export function setMockProblemData(data) {
  */
 export function resetConfig() {
   AWARENESS_CONFIG = JSON.parse(JSON.stringify(DEFAULT_AWARENESS_CONFIG));
+  invalidateAwarenessConfig();
 }
 
 /**
@@ -87,6 +103,34 @@ export function resetConfig() {
  */
 export function setConfig(config) {
   AWARENESS_CONFIG = config;
+  invalidateAwarenessConfig();
+}
+
+export function invalidateAwarenessConfig() {
+  awarenessConfigVersion++;
+}
+
+export function countSolvedProblems(states) {
+  let count = 0;
+  Object.keys(states).forEach(id => {
+    if (states[id].solved) count++;
+  });
+  return count;
+}
+
+/**
+ * Called after the registry is replaced wholesale (loading saved progress)
+ */
+export function resetUniqueSolvedCount() {
+  uniqueSolvedCount = null;
+}
+
+/**
+ * Called by setProblemField() when a problem's solved flag changes
+ */
+export function updateUniqueSolvedCount(wasSolved, isSolved) {
+  if (uniqueSolvedCount === null || !wasSolved === !isSolved) return;
+  uniqueSolvedCount += isSolved ? 1 : -1;
 }
 
 /**
@@ -123,31 +167,61 @@ export function getTierName(problem) {
 }
 
 /**
- * Get combined tier-difficulty multiplier
+ * Tier-based scoring factors of a problem, cached per problem object
  */
-export function getTierDifficultyMultiplier(problem) {
+export function getAwarenessFactors(problem) {
+  const cached = AWARENESS_FACTOR_CACHE.get(problem);
+  // The tier also depends on the difficulty and tier times, which an import
+  // can edit in place
+  if (cached && cached.configVersion === awarenessConfigVersion &&
+      cached.timeToSolve === problem.time_to_solve &&
+      cached.difficulty === problem.difficulty &&
+      cached.topTime === problem.top_time &&
+      cached.advancedTime === problem.advanced_time &&
+      cached.intermediateTime === problem.intermediate_time) {
+    return cached;
+  }
+
   const tier = getTierName(problem);
   const difficulty = problem.difficulty || 'Medium';
   const matrix = AWARENESS_CONFIG.tierDifficultyMultipliers;
 
   // Fallback to 1.0 if tier or difficulty not found
-  if (!matrix[tier]) return 1.0;
-  if (matrix[tier][difficulty] === undefined) return 1.0;
+  let multiplier = 1.0;
+  if (matrix[tier] && matrix[tier][difficulty] !== undefined) {
+    multiplier = matrix[tier][difficulty];
+  }
 
-  return matrix[tier][difficulty];
+  const factors = {
+    timeToSolve: problem.time_to_solve,
+    difficulty: problem.difficulty,
+    topTime: problem.top_time,
+    advancedTime: problem.advanced_time,
+    intermediateTime: problem.intermediate_time,
+    configVersion: awarenessConfigVersion,
+    tier,
+    multiplier,
+    solvedScaling: AWARENESS_CONFIG.baseSolvedScaling + AWARENESS_CONFIG.tierSolvedBonus[tier]
+  };
+  AWARENESS_FACTOR_CACHE.set(problem, factors);
+  return factors;
+}
+
+/**
+ * Get combined tier-difficulty multiplier
+ */
+export function getTierDifficultyMultiplier(problem) {
+  return getAwarenessFactors(problem).multiplier;
 }
 
 /**
  * Get total unique solved count across all problem lists
  */
 export function getTotalUniqueSolvedCount() {
-  const solvedNames = new Set();
-  PROBLEM_DATA.file_list.forEach(fileKey => {
-    PROBLEM_DATA.data[fileKey].forEach(p => {
-      if (p.solved) solvedNames.add(p.name);
-    });
-  });
-  return solvedNames.size;
+  if (uniqueSolvedCount === null) {
+    uniqueSolvedCount = countSolvedProblems(PROBLEM_STATE);
+  }
+  return uniqueSolvedCount;
 }
 
 /**
@@ -164,11 +238,8 @@ export function getCommitmentFactor() {
  */
 export function getSolvedFactor(problem) {
   const totalSolved = getTotalUniqueSolvedCount();
-  const tier = getTierName(problem);
-  const baseScaling = AWARENESS_CONFIG.baseSolvedScaling;
-  const tierBonus = AWARENESS_CONFIG.tierSolvedBonus[tier];
 
-  return 1 + (baseScaling + tierBonus) * Math.log2(totalSolved + 1);
+  return 1 + getAwarenessFactors(problem).solvedScaling * Math.log2(totalSolved + 1);
 }
 
 /**
@@ -207,6 +278,16 @@ export function getDaysSinceCompletion(solvedDate) {
   return { days: diffDays, valid: true };
 }
 
+/**
+ * Awareness points a solved problem gains per day
+ */
+export function getAwarenessDailyRate(problem) {
+  const commitmentFactor = getCommitmentFactor();
+  const tierDiffMultiplier = getTierDifficultyMultiplier(problem);
+  const solvedFactor = getSolvedFactor(problem);
+  return AWARENESS_CONFIG.baseRate * commitmentFactor * tierDiffMultiplier / solvedFactor;
+}
+
 /**
  * Calculate awareness score for a problem
  * Returns: { score: number, invalidDate: boolean }
@@ -223,11 +304,7 @@ export function calculateAwarenessScore(problem) {
   // No valid date (unsolved)
   if (dateResult.days < 0) return { score: -1, invalidDate: false };
 
-  const commitmentFactor = getCommitmentFactor();
-  const tierDiffMultiplier = getTierDifficultyMultiplier(problem);
-  const solvedFactor = getSolvedFactor(problem);
-
-  const score = dateResult.days * AWARENESS_CONFIG.baseRate * commitmentFactor * tierDiffMultiplier / solvedFactor;
+  const score = dateResult.days * getAwarenessDailyRate(problem);
 
   return { score, invalidDate: false };
 }
@@ -11,6 +11,10 @@ import {
   getCommitmentFactor,
   getSolvedFactor,
   getTotalUniqueSolvedCount,
+  updateUniqueSolvedCount,
+  resetUniqueSolvedCount,
+  getAwarenessFactors,
+  invalidateAwarenessConfig,
   normalizeDateToISO,
   getAwarenessClass,
   validateThresholdOrdering,
@@ -370,6 +374,81 @@ describe('Awareness Indicator System', () => {
 
       expect(getTotalUniqueSolvedCount()).toBe(0);
     });
+
+    it('should update the memoized count when a solved flag changes', () => {
+      setMockProblemData({
+        file_list: ['list1'],
+        data: { list1: [{ name: 'Two Sum', solved: true }] }
+      });
+      expect(getTotalUniqueSolvedCount()).toBe(1);
+
+      updateUniqueSolvedCount(false, true);
+      updateUniqueSolvedCount(true, true);
+      expect(getTotalUniqueSolvedCount()).toBe(2);
+
+      updateUniqueSolvedCount(true, false);
+      updateUniqueSolvedCount('', false);
+      expect(getTotalUniqueSolvedCount()).toBe(1);
+    });
+
+    it('should recount after a reset', () => {
+      setMockProblemData({
+        file_list: ['list1'],
+        data: { list1: [{ name: 'Two Sum', solved: true }] }
+      });
+      getTotalUniqueSolvedCount();
+      updateUniqueSolvedCount(false, true);
+      expect(getTotalUniqueSolvedCount()).toBe(2);
+
+      resetUniqueSolvedCount();
+      expect(getTotalUniqueSolvedCount()).toBe(1);
+    });
+  });
+
+  describe('getAwarenessFactors', () => {
+    it('should reuse cached factors while nothing changes', () => {
+      const problem = { time_to_solve: 10, top_time: 15, difficulty: 'Hard' };
+      const factors = getAwarenessFactors(problem);
+      expect(factors.tier).toBe('top');
+      expect(factors.multiplier).toBe(0.4);
+      expect(factors.solvedScaling).toBeCloseTo(0.4);
+      expect(getAwarenessFactors(problem)).toBe(factors);
+    });
+
+    it('should recompute when time_to_solve changes', () => {
+      const problem = { time_to_solve: 10, top_time: 15, advanced_time: 20, difficulty: 'Hard' };
+      getAwarenessFactors(problem);
+      problem.time_to_solve = 18;
+      expect(getAwarenessFactors(problem).tier).toBe('advanced');
+      expect(getTierDifficultyMultiplier(problem)).toBe(0.7);
+    });
+
+    it('should recompute when difficulty or tier times change in place', () => {
+      const problem = { time_to_solve: 18, top_time: 15, advanced_time: 20, difficulty: 'Hard' };
+      expect(getAwarenessFactors(problem).tier).toBe('advanced');
+
+      problem.top_time = 20;
+      expect(getAwarenessFactors(problem).tier).toBe('top');
+
+      problem.difficulty = 'Easy';
+      expect(getTierDifficultyMultiplier(problem)).toBe(0);
+
+      problem.top_time = 15;
+      problem.advanced_time = 16;
+      problem.intermediate_time = 25;
+      expect(getAwarenessFactors(problem).tier).toBe('intermediate');
+    });
+
+    it('should recompute when the config changes', () => {
+      const problem = { time_to_solve: 10, top_time: 15, difficulty: 'Hard' };
+      getAwarenessFactors(problem);
+
+      getConfig().tierDifficultyMultipliers.top.Hard = 0.5;
+      expect(getTierDifficultyMultiplier(problem)).toBe(0.4);
+
+      invalidateAwarenessConfig();
+      expect(getTierDifficultyMultiplier(problem)).toBe(0.5);
+    });
   });
 
   describe('getCommitmentFactor', () => {
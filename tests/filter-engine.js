@@ -0,0 +1,117 @@
+/**
+ * Filter Engine (Extracted for Testing)
+ *
+ * SYNCHRONIZATION REQUIREMENT:
+ * These functions mirror the JavaScript code generated by js_filter_generator.py
+ * (bitset helpers, buildFilterIndex, computeFilterMask, rowMatchesSearch and
+ * filterProblemIndexes).
+ * When modifying those, update this file to keep them in sync.
+ * After changes, verify with: npm test
+ */
+
+export function createBitset(size) {
+  return new Uint32Array((size + 31) >>> 5);
+}
+
+export function bitsetSet(bits, i) {
+  bits[i >>> 5] |= 1 << (i & 31);
+}
+
+export function bitsetClear(bits, i) {
+  bits[i >>> 5] &= ~(1 << (i & 31));
+}
+
+export function bitsetHas(bits, i) {
+  return (bits[i >>> 5] & (1 << (i & 31))) !== 0;
+}
+
+export function buildFilterIndex(problems) {
+  const size = problems.length;
+  const index = {
+    size,
+    problems,
+    names: new Array(size),
+    patterns: new Array(size),
+    all: createBitset(size),
+    solved: createBitset(size),
+    difficulty: {},
+    pattern: {}
+  };
+  const addToGroup = (groups, key, idx) => {
+    if (!groups[key]) groups[key] = createBitset(size);
+    bitsetSet(groups[key], idx);
+  };
+
+  problems.forEach((problem, idx) => {
+    index.names[idx] = (problem.name || '').toLowerCase();
+    index.patterns[idx] = (problem.pattern || '').toLowerCase();
+    bitsetSet(index.all, idx);
+    addToGroup(index.difficulty, problem.difficulty, idx);
+    addToGroup(index.pattern, problem.pattern, idx);
+    if (problem.solved) bitsetSet(index.solved, idx);
+  });
+  return index;
+}
+
+// AND together the bitsets selected by the difficulty, pattern and status criteria
+export function computeFilterMask(index, criteria) {
+  const mask = index.all.slice();
+  const intersect = bits => {
+    if (!bits) {
+      mask.fill(0);
+      return;
+    }
+    for (let i = 0; i < mask.length; i++) mask[i] &= bits[i];
+  };
+
+  if (criteria.difficulty) intersect(index.difficulty[criteria.difficulty]);
+  if (criteria.pattern) intersect(index.pattern[criteria.pattern]);
+  if (criteria.solved === 'solved') {
+    intersect(index.solved);
+  } else if (criteria.solved === 'unsolved') {
+    for (let i = 0; i < mask.length; i++) mask[i] &= ~index.solved[i];
+  }
+  return mask;
+}
+
+// Whether a row's name, pattern or comments contain the (lowercase) search text
+export function rowMatchesSearch(index, idx, search) {
+  if (index.names[idx].includes(search) || index.patterns[idx].includes(search)) return true;
+  const comments = index.problems[idx].comments;
+  return !!comments && comments.toLowerCase().includes(search);
+}
+
+/**
+ * Filter a tab's row order down to the rows matching the criteria.
+ * criteria: { search (lowercase), candidates, difficulty, pattern, solved, color };
+ * empty values match everything. candidates is the Set of problem IDs
+ * that may match the search (see searchSubstringCandidates), or null to
+ * check every row. getColorClass(idx) returns a row's
+ * awareness class and is only called for rows passing the other filters.
+ */
+export function filterProblemIndexes(index, order, criteria, getColorClass) {
+  const mask = computeFilterMask(index, criteria);
+  const visible = [];
+  for (let i = 0; i < order.length; i++) {
+    const idx = order[i];
+    if (!bitsetHas(mask, idx)) continue;
+    if (criteria.candidates && !criteria.candidates.has(index.problems[idx].id)) continue;
+    if (criteria.search && !rowMatchesSearch(index, idx, criteria.search)) continue;
+    if (criteria.color && getColorClass(idx) !== criteria.color) continue;
+    visible.push(idx);
+  }
+  return visible;
+}
+
+/**
+ * Refresh the solved bit of one row (mirrors updateFilterIndexRow without
+ * the PROBLEM_DATA lookup).
+ */
+export function updateFilterIndexSolved(index, idx, solved) {
+  if (idx >= index.size) return;
+  if (solved) {
+    bitsetSet(index.solved, idx);
+  } else {
+    bitsetClear(index.solved, idx);
+  }
+}
@@ -0,0 +1,171 @@
+/**
+ * Unit Tests for the Filter Engine
+ */
+
+import {
+  createBitset,
+  bitsetSet,
+  bitsetClear,
+  bitsetHas,
+  buildFilterIndex,
+  computeFilterMask,
+  filterProblemIndexes,
+  rowMatchesSearch,
+  updateFilterIndexSolved
+} from './filter-engine.js';
+
+const problems = [
+  { id: 'two-sum', name: 'Two Sum', difficulty: 'Easy', pattern: 'Arrays', solved: true },
+  { id: 'add-two-numbers', name: 'Add Two Numbers', difficulty: 'Medium', pattern: 'Linked List', solved: false },
+  { id: 'longest-substring', name: 'Longest Substring', difficulty: 'Medium', pattern: 'Sliding Window', solved: true },
+  { id: 'median-of-two-sorted-arrays', name: 'Median of Two Sorted Arrays', difficulty: 'Hard', pattern: 'Binary Search', solved: false },
+  { id: 'valid-parentheses', name: 'Valid Parentheses', difficulty: 'Easy', pattern: 'Stack', solved: false }
+];
+const order = [0, 1, 2, 3, 4];
+const none = { search: '', difficulty: '', pattern: '', solved: '', color: '' };
+const noColor = () => '';
+
+describe('bitsets', () => {
+  test('sets, clears and reads bits across word boundaries', () => {
+    const bits = createBitset(70);
+    expect(bits.length).toBe(3);
+    [0, 31, 32, 69].forEach(i => bitsetSet(bits, i));
+    expect(bitsetHas(bits, 0)).toBe(true);
+    expect(bitsetHas(bits, 31)).toBe(true);
+    expect(bitsetHas(bits, 32)).toBe(true);
+    expect(bitsetHas(bits, 69)).toBe(true);
+    expect(bitsetHas(bits, 30)).toBe(false);
+    bitsetClear(bits, 31);
+    expect(bitsetHas(bits, 31)).toBe(false);
+    expect(bitsetHas(bits, 32)).toBe(true);
+  });
+});
+
+describe('buildFilterIndex', () => {
+  test('precomputes lowercase names, patterns and group bitsets', () => {
+    const index = buildFilterIndex(problems);
+    expect(index.size).toBe(5);
+    expect(index.names[0]).toBe('two sum');
+    expect(index.patterns[2]).toBe('sliding window');
+    expect(bitsetHas(index.difficulty.Medium, 1)).toBe(true);
+    expect(bitsetHas(index.difficulty.Medium, 0)).toBe(false);
+    expect(bitsetHas(index.pattern.Stack, 4)).toBe(true);
+    expect(bitsetHas(index.solved, 2)).toBe(true);
+    expect(bitsetHas(index.solved, 3)).toBe(false);
+  });
+});
+
+describe('computeFilterMask', () => {
+  test('matches every row without criteria', () => {
+    const index = buildFilterIndex(problems);
+    const mask = computeFilterMask(index, none);
+    order.forEach(idx => expect(bitsetHas(mask, idx)).toBe(true));
+  });
+
+  test('matches nothing for an unknown group value', () => {
+    const index = buildFilterIndex(problems);
+    const mask = computeFilterMask(index, { ...none, pattern: 'Graphs' });
+    order.forEach(idx => expect(bitsetHas(mask, idx)).toBe(false));
+  });
+
+  test('does not modify the index', () => {
+    const index = buildFilterIndex(problems);
+    computeFilterMask(index, { ...none, difficulty: 'Hard' });
+    expect(bitsetHas(index.all, 0)).toBe(true);
+  });
+});
+
+describe('rowMatchesSearch', () => {
+  test('reads comments from the live problem', () => {
+    const list = [{ id: 'x', name: 'X', pattern: '', comments: '' }];
+    const index = buildFilterIndex(list);
+    expect(rowMatchesSearch(index, 0, 'note')).toBe(false);
+    list[0].comments = 'A NOTE';
+    expect(rowMatchesSearch(index, 0, 'note')).toBe(true);
+  });
+});
+
+describe('filterProblemIndexes', () => {
+  test('returns the full order without criteria', () => {
+    const index = buildFilterIndex(problems);
+    expect(filterProblemIndexes(index, order, none, noColor)).toEqual(order);
+  });
+
+  test('filters by substring of the name', () => {
+    const index = buildFilterIndex(problems);
+    expect(filterProblemIndexes(index, order, { ...none, search: 'two' }, noColor)).toEqual([0, 1, 3]);
+    expect(filterProblemIndexes(index, order, { ...none, search: 'ng' }, noColor)).toEqual([2]);
+  });
+
+  test('filters by pattern and comments', () => {
+    const withComments = problems.map((problem, idx) => (idx === 4 ? { ...problem, comments: 'Used a Deque' } : problem));
+    const index = buildFilterIndex(withComments);
+    expect(filterProblemIndexes(index, order, { ...none, search: 'binary' }, noColor)).toEqual([3]);
+    expect(filterProblemIndexes(index, order, { ...none, search: 'deque' }, noColor)).toEqual([4]);
+  });
+
+  test('checks the search text only for candidate rows', () => {
+    const index = buildFilterIndex(problems);
+    const candidates = new Set(['two-sum', 'median-of-two-sorted-arrays', 'valid-parentheses']);
+    expect(filterProblemIndexes(index, order, { ...none, search: 'two', candidates }, noColor)).toEqual([0, 3]);
+    expect(filterProblemIndexes(index, order, { ...none, search: 'two', candidates: null }, noColor)).toEqual([0, 1, 3]);
+  });
+
+  test('does not match near-misses', () => {
+    const index = buildFilterIndex([{ id: 'three', name: 'Three Sum', pattern: '' }]);
+    expect(filterProblemIndexes(index, [0], { ...none, search: 'tree' }, noColor)).toEqual([]);
+  });
+
+  test('matches symbols and non-ASCII text', () => {
+    const index = buildFilterIndex([
+      { id: 'a', name: 'Pow(x, n)', pattern: '' },
+      { id: 'b', name: 'Árvore Binária', pattern: '' }
+    ]);
+    expect(filterProblemIndexes(index, [0, 1], { ...none, search: '(x,' }, noColor)).toEqual([0]);
+    expect(filterProblemIndexes(index, [0, 1], { ...none, search: 'ária' }, noColor)).toEqual([1]);
+  });
+
+  test('filters by difficulty and pattern together', () => {
+    const index = buildFilterIndex(problems);
+    const criteria = { ...none, difficulty: 'Medium', pattern: 'Sliding Window' };
+    expect(filterProblemIndexes(index, order, criteria, noColor)).toEqual([2]);
+  });
+
+  test('filters by solved and unsolved status', () => {
+    const index = buildFilterIndex(problems);
+    expect(filterProblemIndexes(index, order, { ...none, solved: 'solved' }, noColor)).toEqual([0, 2]);
+    expect(filterProblemIndexes(index, order, { ...none, solved: 'unsolved' }, noColor)).toEqual([1, 3, 4]);
+  });
+
+  test('keeps the given row order', () => {
+    const index = buildFilterIndex(problems);
+    expect(filterProblemIndexes(index, [4, 2, 0, 3, 1], { ...none, difficulty: 'Easy' }, noColor)).toEqual([4, 0]);
+  });
+
+  test('checks color only for rows passing the other filters', () => {
+    const index = buildFilterIndex(problems);
+    const checked = [];
+    const getColorClass = idx => {
+      checked.push(idx);
+      return idx === 2 ? 'awareness-red' : 'awareness-green';
+    };
+    const criteria = { ...none, solved: 'solved', color: 'awareness-red' };
+    expect(filterProblemIndexes(index, order, criteria, getColorClass)).toEqual([2]);
+    expect(checked).toEqual([0, 2]);
+  });
+});
+
+describe('updateFilterIndexSolved', () => {
+  test('moves a row between solved and unsolved', () => {
+    const index = buildFilterIndex(problems);
+    updateFilterIndexSolved(index, 1, true);
+    updateFilterIndexSolved(index, 0, false);
+    expect(filterProblemIndexes(index, order, { ...none, solved: 'solved' }, noColor)).toEqual([1, 2]);
+  });
+
+  test('ignores rows outside the index', () => {
+    const index = buildFilterIndex(problems);
+    updateFilterIndexSolved(index, 9, true);
+    expect(filterProblemIndexes(index, order, { ...none, solved: 'solved' }, noColor)).toEqual([0, 2]);
+  });
+});
@@ -23,6 +23,14 @@ export function setMockProblemData(data) {
   PROBLEM_DATA = data;
 }
 
+/**
+ * Mock of the tracker's name -> location lookup (findProblemIndex), which
+ * reads a maintained index instead of scanning the list
+ */
+function findProblemIndex(fileKey, name) {
+  return (PROBLEM_DATA.data[fileKey] || []).findIndex(p => p.name === name);
+}
+
 /**
  * Get current mock problem data
  */
@@ -565,7 +573,7 @@ export function detectConflicts(fileKey, importedData, mode) {
   const conflicts = [];
 
   importedData.forEach((imported, importIdx) => {
-    const existingIdx = existingData.findIndex(e => e.name === imported.name);
+    const existingIdx = findProblemIndex(fileKey, imported.name);
 
     if (existingIdx !== -1) {
       const existing = existingData[existingIdx];
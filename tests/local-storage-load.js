@@ -1,6 +1,8 @@
 /**
  * Name-based localStorage loading functions (Extracted for Testing)
  * These functions mirror the fixed loadFromLocalStorage() in js_core_generator.py.
+ * The per-list tracker_<fileKey> format is now only read when migrating to the
+ * shared problem registry (see migrateLegacyProgress in problem-data.js).
  *
  * SYNCHRONIZATION REQUIREMENT:
  * When modifying loadFromLocalStorage() in js_core_generator.py, update this file too.
@@ -0,0 +1,230 @@
+/**
+ * Problem Data Payload Decoder and Problem Registry (Extracted for Testing)
+ *
+ * SYNCHRONIZATION REQUIREMENT:
+ * These functions mirror the JavaScript code generated by js_data_generator.py.
+ * The payload format is produced by encode_problem_data() in data_payload.py.
+ * When modifying the decoder there, update this file to keep them in sync.
+ * After changes, verify with: npm test
+ */
+
+export const PROBLEM_STATE_VERSION = 1;
+export const PROBLEM_STATE_FIELDS = ['solved', 'time_to_solve', 'comments', 'solved_date'];
+const PROBLEM_SHARED_FIELDS = PROBLEM_STATE_FIELDS.concat(['importedAt']);
+export const PROBLEM_STATE = {};
+export const PROBLEM_NAMES = {};
+export const DIRTY_PROBLEM_IDS = new Set();
+export const UNSAVED_PROBLEM_IDS = new Set();
+let PROBLEM_ID_BY_NAME = {};
+
+/**
+ * Clears the registry and installs a name -> id map (test helper; the
+ * generated code assigns PROBLEM_ID_BY_NAME once from the decoded payload).
+ */
+export function resetProblemRegistry(idsByName = {}) {
+  Object.keys(PROBLEM_STATE).forEach(id => delete PROBLEM_STATE[id]);
+  Object.keys(PROBLEM_NAMES).forEach(id => delete PROBLEM_NAMES[id]);
+  DIRTY_PROBLEM_IDS.clear();
+  UNSAVED_PROBLEM_IDS.clear();
+  PROBLEM_ID_BY_NAME = idsByName;
+}
+
+export function defaultProblemState() {
+  return { solved: false, time_to_solve: '', comments: '', solved_date: '' };
+}
+
+export function hasProblemProgress(state) {
+  return !!(state.solved || state.time_to_solve || state.comments || state.solved_date);
+}
+
+export function getProblemState(id) {
+  if (!PROBLEM_STATE[id]) PROBLEM_STATE[id] = defaultProblemState();
+  return PROBLEM_STATE[id];
+}
+
+export function problemIdForName(name) {
+  return PROBLEM_ID_BY_NAME[name] || `name:${name}`;
+}
+
+export function setProblemField(id, field, value) {
+  const state = getProblemState(id);
+  if (state[field] === value) return;
+  state[field] = value;
+  if (PROBLEM_STATE_FIELDS.includes(field)) {
+    DIRTY_PROBLEM_IDS.add(id);
+    UNSAVED_PROBLEM_IDS.add(id);
+  }
+}
+
+/**
+ * Turns a problem's user fields into accessors onto its registry record.
+ * Values already on the object fill the record's empty fields, or replace
+ * the record's values when overwrite is set (used for imports).
+ */
+export function bindProblemState(problem, id, overwrite) {
+  const state = getProblemState(id);
+  PROBLEM_SHARED_FIELDS.forEach(field => {
+    if (!Object.prototype.hasOwnProperty.call(problem, field)) return;
+    if (overwrite || (problem[field] && !state[field])) {
+      setProblemField(id, field, problem[field]);
+    }
+  });
+  PROBLEM_NAMES[id] = problem.name;
+  Object.defineProperty(problem, 'id', { value: id, writable: true, enumerable: true, configurable: true });
+  PROBLEM_SHARED_FIELDS.forEach(field => {
+    Object.defineProperty(problem, field, {
+      enumerable: true,
+      configurable: true,
+      get() { return state[field]; },
+      set(value) { setProblemField(id, field, value); }
+    });
+  });
+  return problem;
+}
+
+export function serializeProblemState() {
+  const problems = {};
+  Object.keys(PROBLEM_STATE).forEach(id => {
+    const state = PROBLEM_STATE[id];
+    if (hasProblemProgress(state)) {
+      problems[id] = {
+        solved: state.solved,
+        time_to_solve: state.time_to_solve,
+        comments: state.comments,
+        solved_date: state.solved_date
+      };
+    }
+  });
+  return { version: PROBLEM_STATE_VERSION, problems };
+}
+
+export function restoreProblemState(saved) {
+  if (!saved || typeof saved.problems !== 'object' || saved.problems === null) return false;
+  Object.keys(saved.problems).forEach(id => {
+    const item = saved.problems[id];
+    if (!item) return;
+    const state = getProblemState(id);
+    state.solved = item.solved || false;
+    state.time_to_solve = item.time_to_solve || '';
+    state.comments = item.comments || '';
+    state.solved_date = item.solved_date || '';
+  });
+  return true;
+}
+
+/**
+ * Merges the old per-list saves (tracker_<fileKey>, arrays keyed by name)
+ * into the registry. A field is taken from the first list that has a value.
+ */
+export function migrateLegacyProgress(fileList, readList) {
+  let migrated = false;
+  fileList.forEach(fileKey => {
+    const savedData = readList(fileKey);
+    if (!Array.isArray(savedData)) return;
+    savedData.forEach(item => {
+      if (!item || !item.name) return;
+      const state = getProblemState(problemIdForName(item.name));
+      PROBLEM_STATE_FIELDS.forEach(field => {
+        if (!state[field] && item[field]) state[field] = item[field];
+      });
+      migrated = true;
+    });
+  });
+  return migrated;
+}
+
+const PAYLOAD_INTERNED_FIELDS = ['difficulty', 'intermediate_time', 'advanced_time', 'top_time', 'pattern'];
+const PAYLOAD_STATIC_FIELDS = ['name', 'difficulty', 'intermediate_time', 'advanced_time', 'top_time', 'pattern', 'link'];
+
+/**
+ * Builds one problem object from a canonical record index and binds its
+ * user fields to the registry record for its problem ID.
+ *
+ * @param {Object} payload
+ * @param {number} ref - Index into payload.problems columns
+ * @param {Object|undefined} overrides - Non-default user fields for this row
+ * @returns {Object}
+ */
+export function expandPayloadProblem(payload, ref, overrides) {
+  const problem = {};
+  PAYLOAD_STATIC_FIELDS.forEach(field => {
+    const value = payload.problems[field][ref];
+    problem[field] = PAYLOAD_INTERNED_FIELDS.includes(field) ? payload.strings[value] : value;
+  });
+  if (overrides) Object.assign(problem, overrides);
+  return bindProblemState(problem, payload.problems.id[ref] || problemIdForName(problem.name));
+}
+
+/**
+ * Defines data[fileKey] as a getter that builds the list on first read and
+ * then replaces itself with a plain writable property.
+ */
+export function defineLazyList(data, fileKey, build) {
+  const define = value => Object.defineProperty(data, fileKey, {
+    value, writable: true, enumerable: true, configurable: true
+  });
+  Object.defineProperty(data, fileKey, {
+    enumerable: true,
+    configurable: true,
+    get() {
+      const problems = build();
+      define(problems);
+      return problems;
+    },
+    set(value) {
+      define(value);
+    }
+  });
+}
+
+// Record that list fileKey holds a problem at row idx and return the
+// problem's locations. A name repeated within one list keeps its first row.
+export function addNameLocation(locations, name, fileKey, idx) {
+  if (!locations.has(name)) locations.set(name, []);
+  const entries = locations.get(name);
+  if (!entries.some(entry => entry.fileKey === fileKey)) entries.push({ fileKey, idx });
+  return entries;
+}
+
+export function findLocationIndex(locations, fileKey, name) {
+  const entry = (locations.get(name) || []).find(item => item.fileKey === fileKey);
+  return entry ? entry.idx : -1;
+}
+
+/**
+ * Expands a payload into { data, duplicate_map, file_list, ids_by_name,
+ * problem_locations }.
+ *
+ * @param {Object} payload
+ * @returns {Object}
+ */
+export function decodeProblemData(payload) {
+  const data = {};
+  const duplicateMap = {};
+  const idsByName = {};
+  const locations = new Map();
+
+  payload.file_list.forEach(fileKey => {
+    const refs = payload.lists[fileKey];
+    const overrides = payload.state[fileKey] || {};
+    defineLazyList(data, fileKey, () => refs.map((ref, row) => expandPayloadProblem(payload, ref, overrides[row])));
+
+    refs.forEach((ref, row) => {
+      const name = payload.problems.name[ref];
+      addNameLocation(locations, name, fileKey, row);
+      if (payload.problems.id[ref] && !idsByName[name]) idsByName[name] = payload.problems.id[ref];
+    });
+  });
+
+  locations.forEach((entries, name) => {
+    if (entries.length > 1) duplicateMap[name] = entries.map(entry => entry.fileKey);
+  });
+
+  return {
+    data,
+    duplicate_map: duplicateMap,
+    file_list: payload.file_list.slice(),
+    ids_by_name: idsByName,
+    problem_locations: locations
+  };
+}
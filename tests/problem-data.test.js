@@ -0,0 +1,268 @@
+/**
+ * Unit Tests for the Problem Data Payload Decoder
+ */
+
+import {
+  PROBLEM_STATE,
+  DIRTY_PROBLEM_IDS,
+  UNSAVED_PROBLEM_IDS,
+  resetProblemRegistry,
+  problemIdForName,
+  bindProblemState,
+  serializeProblemState,
+  restoreProblemState,
+  migrateLegacyProgress,
+  expandPayloadProblem,
+  defineLazyList,
+  addNameLocation,
+  findLocationIndex,
+  decodeProblemData
+} from './problem-data.js';
+
+beforeEach(() => {
+  resetProblemRegistry({ 'Two Sum': 'two-sum', '3Sum': '3sum' });
+});
+
+// Payload as produced by encode_problem_data() for two lists sharing "Two Sum"
+function makePayload() {
+  return {
+    version: 1,
+    file_list: ['blind75', 'neetcode150'],
+    strings: ['Easy', '25', '15', '8', 'Hash Table', 'Medium', '55', '40', '28', 'Two Pointers'],
+    problems: {
+      name: ['Two Sum', '3Sum'],
+      difficulty: [0, 5],
+      intermediate_time: [1, 6],
+      advanced_time: [2, 7],
+      top_time: [3, 8],
+      pattern: [4, 9],
+      link: ['https://leetcode.com/problems/two-sum/', ''],
+      id: ['two-sum', '3sum']
+    },
+    lists: {
+      blind75: [0],
+      neetcode150: [0, 1]
+    },
+    state: {}
+  };
+}
+
+describe('expandPayloadProblem', () => {
+  test('resolves interned columns through the string table', () => {
+    const problem = expandPayloadProblem(makePayload(), 1);
+
+    expect(problem.name).toBe('3Sum');
+    expect(problem.difficulty).toBe('Medium');
+    expect(problem.intermediate_time).toBe('55');
+    expect(problem.pattern).toBe('Two Pointers');
+    expect(problem.link).toBe('');
+  });
+
+  test('fills default user fields', () => {
+    const problem = expandPayloadProblem(makePayload(), 0);
+
+    expect(problem.solved).toBe(false);
+    expect(problem.time_to_solve).toBe('');
+    expect(problem.comments).toBe('');
+    expect(problem.solved_date).toBe('');
+  });
+
+  test('applies row overrides', () => {
+    const problem = expandPayloadProblem(makePayload(), 0, { solved: true, comments: 'hash it' });
+
+    expect(problem.solved).toBe(true);
+    expect(problem.comments).toBe('hash it');
+  });
+
+  test('returns a new object for each call', () => {
+    const payload = makePayload();
+
+    expect(expandPayloadProblem(payload, 0)).not.toBe(expandPayloadProblem(payload, 0));
+  });
+});
+
+describe('defineLazyList', () => {
+  test('builds the list only on first read', () => {
+    const data = {};
+    const build = jest.fn(() => [{ name: 'Two Sum' }]);
+    defineLazyList(data, 'blind75', build);
+
+    expect(build).toHaveBeenCalledTimes(0);
+    const first = data.blind75;
+    const second = data.blind75;
+
+    expect(build).toHaveBeenCalledTimes(1);
+    expect(first).toBe(second);
+  });
+
+  test('is enumerable before expansion', () => {
+    const data = {};
+    defineLazyList(data, 'blind75', () => []);
+
+    expect(Object.keys(data)).toEqual(['blind75']);
+  });
+
+  test('assignment replaces the lazy list without building it', () => {
+    const data = {};
+    const build = jest.fn(() => []);
+    defineLazyList(data, 'blind75', build);
+
+    data.blind75 = [{ name: 'Replaced' }];
+
+    expect(build).toHaveBeenCalledTimes(0);
+    expect(data.blind75[0].name).toBe('Replaced');
+  });
+});
+
+describe('decodeProblemData', () => {
+  test('expands every list in order', () => {
+    const decoded = decodeProblemData(makePayload());
+
+    expect(decoded.file_list).toEqual(['blind75', 'neetcode150']);
+    expect(decoded.data.blind75.map(p => p.name)).toEqual(['Two Sum']);
+    expect(decoded.data.neetcode150.map(p => p.name)).toEqual(['Two Sum', '3Sum']);
+  });
+
+  test('shares user state between lists containing the same problem', () => {
+    const decoded = decodeProblemData(makePayload());
+
+    decoded.data.blind75[0].solved = true;
+
+    expect(decoded.data.neetcode150[0]).not.toBe(decoded.data.blind75[0]);
+    expect(decoded.data.neetcode150[0].solved).toBe(true);
+    expect(decoded.data.neetcode150[1].solved).toBe(false);
+  });
+
+  test('maps problem names to canonical IDs', () => {
+    const decoded = decodeProblemData(makePayload());
+
+    expect(decoded.ids_by_name).toEqual({ 'Two Sum': 'two-sum', '3Sum': '3sum' });
+    expect(decoded.data.neetcode150[1].id).toBe('3sum');
+  });
+
+  test('derives the duplicate map from the lists', () => {
+    const decoded = decodeProblemData(makePayload());
+
+    expect(decoded.duplicate_map).toEqual({ 'Two Sum': ['blind75', 'neetcode150'] });
+  });
+
+  test('indexes every problem name by list and row', () => {
+    const decoded = decodeProblemData(makePayload());
+    const locations = decoded.problem_locations;
+
+    expect(locations.get('Two Sum')).toEqual([
+      { fileKey: 'blind75', idx: 0 },
+      { fileKey: 'neetcode150', idx: 0 }
+    ]);
+    expect(findLocationIndex(locations, 'neetcode150', '3Sum')).toBe(1);
+    expect(findLocationIndex(locations, 'blind75', '3Sum')).toBe(-1);
+    expect(findLocationIndex(locations, 'blind75', 'Unknown')).toBe(-1);
+  });
+
+  test('applies per-list state overrides by row', () => {
+    const payload = makePayload();
+    payload.state = { neetcode150: { 1: { solved: true } } };
+
+    const decoded = decodeProblemData(payload);
+
+    expect(decoded.data.neetcode150[1].solved).toBe(true);
+    expect(decoded.data.neetcode150[0].solved).toBe(false);
+  });
+
+  test('does not share the file list with the payload', () => {
+    const payload = makePayload();
+    const decoded = decodeProblemData(payload);
+
+    decoded.file_list.push('custom');
+
+    expect(payload.file_list).toHaveLength(2);
+  });
+});
+
+describe('problem registry', () => {
+  test('bindProblemState fills empty state from the object', () => {
+    const problem = bindProblemState({ name: 'Two Sum', solved: true, comments: '' }, 'two-sum');
+
+    expect(PROBLEM_STATE['two-sum'].solved).toBe(true);
+    expect(problem.id).toBe('two-sum');
+    expect(Object.keys(problem)).toContain('id');
+    expect(Object.keys(problem)).toContain('solved');
+  });
+
+  test('bindProblemState keeps existing state unless overwriting', () => {
+    restoreProblemState({ problems: { 'two-sum': { solved: true, comments: 'saved' } } });
+
+    const kept = bindProblemState({ name: 'Two Sum', comments: 'payload' }, 'two-sum');
+    expect(kept.comments).toBe('saved');
+
+    const imported = bindProblemState({ name: 'Two Sum', comments: 'imported' }, 'two-sum', true);
+    expect(imported.comments).toBe('imported');
+    expect(kept.comments).toBe('imported');
+  });
+
+  test('marks only persisted fields as dirty', () => {
+    const problem = bindProblemState({ name: 'Two Sum' }, 'two-sum');
+
+    problem.importedAt = 123;
+    expect(DIRTY_PROBLEM_IDS.size).toBe(0);
+    expect(UNSAVED_PROBLEM_IDS.size).toBe(0);
+
+    problem.solved = true;
+    problem.solved = true;
+    expect([...DIRTY_PROBLEM_IDS]).toEqual(['two-sum']);
+    expect([...UNSAVED_PROBLEM_IDS]).toEqual(['two-sum']);
+  });
+
+  test('serializes only problems with progress', () => {
+    bindProblemState({ name: 'Two Sum' }, 'two-sum').time_to_solve = '12';
+    bindProblemState({ name: '3Sum' }, '3sum');
+
+    expect(serializeProblemState()).toEqual({
+      version: 1,
+      problems: { 'two-sum': { solved: false, time_to_solve: '12', comments: '', solved_date: '' } }
+    });
+  });
+
+  test('restoreProblemState rejects the legacy array format', () => {
+    expect(restoreProblemState([{ name: 'Two Sum', solved: true }])).toBe(false);
+    expect(restoreProblemState(null)).toBe(false);
+    expect(PROBLEM_STATE).toEqual({});
+  });
+
+  test('migrateLegacyProgress merges per-list saves by name', () => {
+    const saves = {
+      blind75: [{ name: 'Two Sum', solved: true, comments: '' }],
+      neetcode150: [{ name: 'Two Sum', comments: 'from neetcode' }, { name: 'Custom', solved: true }],
+      corrupt: 'nope'
+    };
+
+    const migrated = migrateLegacyProgress(Object.keys(saves), fileKey => saves[fileKey]);
+
+    expect(migrated).toBe(true);
+    expect(PROBLEM_STATE['two-sum']).toEqual({
+      solved: true, time_to_solve: '', comments: 'from neetcode', solved_date: ''
+    });
+    expect(PROBLEM_STATE[problemIdForName('Custom')].solved).toBe(true);
+  });
+
+  test('problemIdForName falls back to a name key for unknown problems', () => {
+    expect(problemIdForName('Two Sum')).toBe('two-sum');
+    expect(problemIdForName('Custom')).toBe('name:Custom');
+  });
+});
+
+describe('addNameLocation', () => {
+  test('adds rows for new lists and keeps the first row within a list', () => {
+    const locations = new Map();
+
+    addNameLocation(locations, 'Two Sum', 'blind75', 3);
+    const entries = addNameLocation(locations, 'Two Sum', 'custom', 0);
+    addNameLocation(locations, 'Two Sum', 'custom', 7);
+
+    expect(entries).toEqual([
+      { fileKey: 'blind75', idx: 3 },
+      { fileKey: 'custom', idx: 0 }
+    ]);
+    expect(findLocationIndex(locations, 'custom', 'Two Sum')).toBe(0);
+  });
+});
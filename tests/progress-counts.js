@@ -0,0 +1,51 @@
+/**
+ * Progress Counters (Extracted for Testing)
+ *
+ * SYNCHRONIZATION REQUIREMENT:
+ * These functions mirror the JavaScript code generated by js_progress_generator.py
+ * (createProgressCounts, addProgressCount, countListProgress, formatProgressBreakdown).
+ * When modifying those functions, update this file to keep them in sync.
+ * After changes, verify with: npm test
+ */
+
+export const PROGRESS_DIFFICULTY_ORDER = ['Easy', 'Medium', 'Hard'];
+
+// counts: { solved, total, difficulty: { name: { solved, total } }, pattern: { ... } }
+export function createProgressCounts() {
+  return { solved: 0, total: 0, difficulty: {}, pattern: {} };
+}
+
+function addProgressBucket(buckets, key, solved, total) {
+  if (!key) return;
+  const bucket = buckets[key] || (buckets[key] = { solved: 0, total: 0 });
+  bucket.solved += solved;
+  bucket.total += total;
+}
+
+// Add (or with negative amounts, remove) one problem's contribution
+export function addProgressCount(counts, difficulty, patterns, solved, total) {
+  counts.solved += solved;
+  counts.total += total;
+  addProgressBucket(counts.difficulty, difficulty, solved, total);
+  patterns.forEach(pattern => addProgressBucket(counts.pattern, pattern, solved, total));
+}
+
+export function countListProgress(problems) {
+  const counts = createProgressCounts();
+  const rowsById = new Map();
+  problems.forEach((problem, idx) => {
+    addProgressCount(counts, problem.difficulty, [problem.pattern], problem.solved ? 1 : 0, 1);
+    if (!rowsById.has(problem.id)) rowsById.set(problem.id, []);
+    rowsById.get(problem.id).push(idx);
+  });
+  return { problems, length: problems.length, counts, rowsById };
+}
+
+// One line per difficulty, e.g. "Easy: 3 / 10"
+export function formatProgressBreakdown(counts) {
+  const known = PROGRESS_DIFFICULTY_ORDER.filter(difficulty => counts.difficulty[difficulty]);
+  const others = Object.keys(counts.difficulty).filter(difficulty => !PROGRESS_DIFFICULTY_ORDER.includes(difficulty)).sort();
+  return known.concat(others)
+    .map(difficulty => `${difficulty}: ${counts.difficulty[difficulty].solved} / ${counts.difficulty[difficulty].total}`)
+    .join('\n');
+}
@@ -0,0 +1,79 @@
+/**
+ * Unit Tests for the Progress Counters
+ */
+
+import {
+  createProgressCounts,
+  addProgressCount,
+  countListProgress,
+  formatProgressBreakdown
+} from './progress-counts.js';
+
+const problems = [
+  { id: 'two-sum', difficulty: 'Easy', pattern: 'Arrays', solved: true },
+  { id: '3sum', difficulty: 'Medium', pattern: 'Two Pointers', solved: false },
+  { id: 'trap', difficulty: 'Hard', pattern: 'Two Pointers', solved: true },
+  { id: 'two-sum', difficulty: 'Easy', pattern: 'Arrays', solved: true },
+  { id: 'misc', difficulty: 'Medium', pattern: '', solved: false }
+];
+
+describe('countListProgress', () => {
+  test('counts every row with difficulty and pattern breakdowns', () => {
+    const { counts } = countListProgress(problems);
+    expect(counts.solved).toBe(3);
+    expect(counts.total).toBe(5);
+    expect(counts.difficulty).toEqual({
+      Easy: { solved: 2, total: 2 },
+      Medium: { solved: 0, total: 2 },
+      Hard: { solved: 1, total: 1 }
+    });
+    expect(counts.pattern).toEqual({
+      Arrays: { solved: 2, total: 2 },
+      'Two Pointers': { solved: 1, total: 2 }
+    });
+  });
+
+  test('maps each problem to all of its rows', () => {
+    const { rowsById, length } = countListProgress(problems);
+    expect(rowsById.get('two-sum')).toEqual([0, 3]);
+    expect(rowsById.get('trap')).toEqual([2]);
+    expect(length).toBe(5);
+  });
+});
+
+describe('addProgressCount', () => {
+  test('applies solved changes without touching totals', () => {
+    const { counts } = countListProgress(problems);
+    addProgressCount(counts, 'Medium', ['Two Pointers'], 1, 0);
+    expect(counts.solved).toBe(4);
+    expect(counts.total).toBe(5);
+    expect(counts.difficulty.Medium).toEqual({ solved: 1, total: 2 });
+    expect(counts.pattern['Two Pointers']).toEqual({ solved: 2, total: 2 });
+
+    addProgressCount(counts, 'Medium', ['Two Pointers'], -1, 0);
+    expect(counts).toEqual(countListProgress(problems).counts);
+  });
+
+  test('counts a problem under each of its patterns', () => {
+    const counts = createProgressCounts();
+    addProgressCount(counts, 'Easy', ['Arrays', 'Hash Map'], 1, 1);
+    expect(counts.pattern).toEqual({
+      Arrays: { solved: 1, total: 1 },
+      'Hash Map': { solved: 1, total: 1 }
+    });
+  });
+});
+
+describe('formatProgressBreakdown', () => {
+  test('lists difficulties in order, unknown ones last', () => {
+    const counts = createProgressCounts();
+    addProgressCount(counts, 'Hard', [], 0, 2);
+    addProgressCount(counts, 'Expert', [], 1, 1);
+    addProgressCount(counts, 'Easy', [], 1, 3);
+    expect(formatProgressBreakdown(counts)).toBe('Easy: 1 / 3\nHard: 0 / 2\nExpert: 1 / 1');
+  });
+
+  test('is empty without problems', () => {
+    expect(formatProgressBreakdown(createProgressCounts())).toBe('');
+  });
+});
@@ -0,0 +1,73 @@
+/**
+ * IndexedDB Progress Records (Extracted for Testing)
+ *
+ * SYNCHRONIZATION REQUIREMENT:
+ * These functions mirror the JavaScript code generated by js_storage_generator.py
+ * (toProblemRecord, recordsToSavedState, getUncommittedProblemIds,
+ * discardUncommittedProgress, mergeProgressJournal).
+ * When modifying those functions, update this file to keep them in sync.
+ * After changes, verify with: npm test
+ */
+
+import { PROBLEM_STATE_VERSION, UNSAVED_PROBLEM_IDS, hasProblemProgress } from './problem-data.js';
+
+// Problem IDs of IndexedDB writes not yet committed, one array per write
+export const PROGRESS_WRITES_IN_FLIGHT = new Set();
+
+// Stored form of a problem's progress, or null when there is nothing to keep
+export function toProblemRecord(id, state) {
+  if (!state || !hasProblemProgress(state)) return null;
+  return {
+    id,
+    solved: state.solved,
+    time_to_solve: state.time_to_solve,
+    comments: state.comments,
+    solved_date: state.solved_date
+  };
+}
+
+// Stored records in the shape accepted by restoreProblemState()
+export function recordsToSavedState(records) {
+  const problems = {};
+  records.forEach(record => {
+    if (record && record.id) problems[record.id] = record;
+  });
+  return { version: PROBLEM_STATE_VERSION, problems };
+}
+
+// Problems changed but not yet committed to the database
+export function getUncommittedProblemIds() {
+  const ids = new Set(UNSAVED_PROBLEM_IDS);
+  PROGRESS_WRITES_IN_FLIGHT.forEach(write => write.forEach(id => ids.add(id)));
+  return Array.from(ids);
+}
+
+// Forget the uncommitted problems when the stored copy is replaced
+// wholesale, so hiding the page does not journal them over it
+export function discardUncommittedProgress() {
+  UNSAVED_PROBLEM_IDS.clear();
+  PROGRESS_WRITES_IN_FLIGHT.clear();
+}
+
+// Stored records with the newer journal entries applied, and the IDs
+// taken from the journal
+export function mergeProgressJournal(records, journal) {
+  const merged = new Map();
+  records.forEach(record => {
+    if (record && record.id) merged.set(record.id, record);
+  });
+  const applied = [];
+  Object.keys(journal).forEach(id => {
+    const entry = journal[id];
+    if (!entry || typeof entry.savedAt !== 'number') return;
+    const stored = merged.get(id);
+    if (stored && (stored.savedAt || 0) >= entry.savedAt) return;
+    if (entry.record) {
+      merged.set(id, entry.record);
+    } else {
+      merged.delete(id);
+    }
+    applied.push(id);
+  });
+  return { records: Array.from(merged.values()), applied };
+}
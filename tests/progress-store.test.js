@@ -0,0 +1,108 @@
+/**
+ * Unit Tests for IndexedDB Progress Records
+ */
+
+import {
+  toProblemRecord,
+  recordsToSavedState,
+  mergeProgressJournal,
+  getUncommittedProblemIds,
+  discardUncommittedProgress,
+  PROGRESS_WRITES_IN_FLIGHT
+} from './progress-store.js';
+import { resetProblemRegistry, restoreProblemState, serializeProblemState, setProblemField } from './problem-data.js';
+
+const solvedState = { solved: true, time_to_solve: '12', comments: 'hash map', solved_date: '2024-03-01T00:00:00.000Z' };
+
+describe('toProblemRecord', () => {
+  test('stores the progress fields under the problem ID', () => {
+    expect(toProblemRecord('two-sum', solvedState)).toEqual({ id: 'two-sum', ...solvedState });
+  });
+
+  test('keeps a record with only a comment', () => {
+    const state = { solved: false, time_to_solve: '', comments: 'revisit', solved_date: '' };
+    expect(toProblemRecord('3sum', state)).toEqual({ id: '3sum', ...state });
+  });
+
+  test('returns null for missing or empty progress', () => {
+    expect(toProblemRecord('two-sum', undefined)).toBeNull();
+    expect(toProblemRecord('two-sum', { solved: false, time_to_solve: '', comments: '', solved_date: '' })).toBeNull();
+  });
+});
+
+describe('recordsToSavedState', () => {
+  test('keys records by problem ID', () => {
+    const saved = recordsToSavedState([toProblemRecord('two-sum', solvedState)]);
+    expect(saved.version).toBe(1);
+    expect(saved.problems['two-sum'].comments).toBe('hash map');
+  });
+
+  test('skips records without an ID', () => {
+    const saved = recordsToSavedState([null, { solved: true }, { id: 'a', solved: true }]);
+    expect(Object.keys(saved.problems)).toEqual(['a']);
+  });
+
+  test('round-trips through restoreProblemState', () => {
+    resetProblemRegistry();
+    restoreProblemState(recordsToSavedState([toProblemRecord('two-sum', solvedState)]));
+    expect(serializeProblemState().problems['two-sum']).toEqual(solvedState);
+  });
+});
+
+describe('mergeProgressJournal', () => {
+  const stored = [
+    { id: 'a', solved: true, time_to_solve: '10', comments: '', solved_date: '2025-01-01', savedAt: 100 },
+    { id: 'b', solved: true, time_to_solve: '', comments: 'old', solved_date: '2025-01-02', savedAt: 300 },
+    { id: 'c', solved: true, time_to_solve: '', comments: '', solved_date: '2025-01-03' }
+  ];
+
+  test('applies entries newer than the stored record', () => {
+    const journal = { a: { savedAt: 200, record: { id: 'a', solved: false, time_to_solve: '12', comments: '', solved_date: '' } } };
+    const { records, applied } = mergeProgressJournal(stored, journal);
+    expect(applied).toEqual(['a']);
+    expect(records.find(record => record.id === 'a').time_to_solve).toBe('12');
+  });
+
+  test('keeps stored records that are newer', () => {
+    const journal = { b: { savedAt: 200, record: { id: 'b', solved: true, time_to_solve: '', comments: 'new', solved_date: '' } } };
+    const { records, applied } = mergeProgressJournal(stored, journal);
+    expect(applied).toEqual([]);
+    expect(records.find(record => record.id === 'b').comments).toBe('old');
+  });
+
+  test('treats records without a write time as oldest and adds new problems', () => {
+    const journal = {
+      c: { savedAt: 1, record: null },
+      d: { savedAt: 1, record: { id: 'd', solved: true, time_to_solve: '', comments: '', solved_date: '' } }
+    };
+    const { records, applied } = mergeProgressJournal(stored, journal);
+    expect(applied).toEqual(['c', 'd']);
+    expect(records.map(record => record.id).sort()).toEqual(['a', 'b', 'd']);
+  });
+
+  test('ignores malformed entries', () => {
+    const { records, applied } = mergeProgressJournal(stored, { a: null, b: { record: null } });
+    expect(applied).toEqual([]);
+    expect(records).toHaveLength(3);
+  });
+});
+
+describe('getUncommittedProblemIds', () => {
+  beforeEach(() => {
+    resetProblemRegistry({ 'Two Sum': 'two-sum', '3Sum': '3sum' });
+    PROGRESS_WRITES_IN_FLIGHT.clear();
+  });
+
+  test('covers unsaved edits and writes still in flight', () => {
+    setProblemField('two-sum', 'solved', true);
+    PROGRESS_WRITES_IN_FLIGHT.add(['3sum']);
+    expect(getUncommittedProblemIds().sort()).toEqual(['3sum', 'two-sum']);
+  });
+
+  test('is empty after restoring a backup, so the page hide that follows journals nothing', () => {
+    setProblemField('two-sum', 'comments', 'after import');
+    PROGRESS_WRITES_IN_FLIGHT.add(['3sum']);
+    discardUncommittedProgress();
+    expect(getUncommittedProblemIds()).toEqual([]);
+  });
+});
@@ -130,14 +130,23 @@ def mock_generators(monkeypatch):
     monkeypatch.setattr(build_tracker, "generate_html_structure", mock_html)
     monkeypatch.setattr(build_tracker, "generate_css", mock_css)
     monkeypatch.setattr(build_tracker, "generate_js_awareness", mock_js)
+    monkeypatch.setattr(build_tracker, "generate_js_scoring", mock_js)
+    monkeypatch.setattr(build_tracker, "generate_js_review", mock_js)
+    monkeypatch.setattr(build_tracker, "generate_js_render", mock_js)
     monkeypatch.setattr(build_tracker, "generate_js_settings", mock_js)
     monkeypatch.setattr(build_tracker, "generate_js_config_sync", mock_js)
     monkeypatch.setattr(build_tracker, "generate_js_import_export", mock_js)
     monkeypatch.setattr(build_tracker, "generate_js_conflict_dialog", mock_js)
     monkeypatch.setattr(build_tracker, "generate_js_shared", mock_js)
+    monkeypatch.setattr(build_tracker, "generate_js_timers", mock_js)
+    monkeypatch.setattr(build_tracker, "generate_js_storage", mock_js)
+    monkeypatch.setattr(build_tracker, "generate_js_progress", mock_js)
     monkeypatch.setattr(build_tracker, "generate_js_firebase", mock_js)
     monkeypatch.setattr(build_tracker, "generate_js_core", mock_js)
     monkeypatch.setattr(build_tracker, "generate_js_sync", mock_js)
+    monkeypatch.setattr(build_tracker, "generate_js_virtual_table", mock_js)
+    monkeypatch.setattr(build_tracker, "generate_js_search", mock_js)
+    monkeypatch.setattr(build_tracker, "generate_js_filter", mock_js)
 
     return {
         "html": mock_html,
@@ -0,0 +1,229 @@
+"""Tests for build_cache.py and cached builds in build_tracker.py."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from build_cache import MANIFEST_NAME, BuildCache, file_digest, source_digest
+
+
+def sample_generator(value):
+    return f"// {value}"
+
+
+class TestDigests:
+    """Tests for file_digest and source_digest helpers."""
+
+    def test_file_digest_changes_with_content(self, temp_dir):
+        """Should produce different digests for different content."""
+        path = temp_dir / "a.txt"
+        path.write_text("one")
+        first = file_digest(path)
+        path.write_text("two")
+
+        assert first != file_digest(path)
+
+    def test_file_digest_missing_file_returns_none(self, temp_dir):
+        """Should return None when the file does not exist."""
+        assert file_digest(temp_dir / "missing.txt") is None
+
+    def test_source_digest_for_function(self):
+        """Should hash the source of a regular function's module."""
+        assert source_digest(sample_generator) == file_digest(__file__)
+
+    def test_source_digest_for_mock_returns_none(self):
+        """Should treat mocks as uncacheable."""
+        assert source_digest(MagicMock()) is None
+
+    def test_source_digest_for_builtin_returns_none(self):
+        """Should treat builtins as uncacheable."""
+        assert source_digest(len) is None
+
+
+class TestBuildCache:
+    """Tests for BuildCache storage and keys."""
+
+    def test_key_is_stable(self, temp_dir):
+        """Should return the same key for the same inputs."""
+        cache = BuildCache(temp_dir)
+
+        assert cache.component_key("gen", sample_generator, ["a"]) == cache.component_key(
+            "gen", sample_generator, ["a"]
+        )
+
+    def test_key_changes_with_args(self, temp_dir):
+        """Should return a different key when arguments change."""
+        cache = BuildCache(temp_dir)
+
+        assert cache.component_key("gen", sample_generator, ["a"]) != cache.component_key(
+            "gen", sample_generator, ["b"]
+        )
+
+    def test_key_changes_with_name(self, temp_dir):
+        """Should namespace keys by component name."""
+        cache = BuildCache(temp_dir)
+
+        assert cache.component_key("one", sample_generator) != cache.component_key(
+            "two", sample_generator
+        )
+
+    def test_key_is_none_when_disabled(self, temp_dir):
+        """Should not produce keys when caching is disabled."""
+        cache = BuildCache(temp_dir, enabled=False)
+
+        assert cache.component_key("gen", sample_generator) is None
+
+    def test_key_is_none_for_unserializable_args(self, temp_dir):
+        """Should treat non-JSON arguments as uncacheable."""
+        cache = BuildCache(temp_dir)
+
+        assert cache.component_key("gen", sample_generator, object()) is None
+
+    def test_put_then_get_round_trip(self, temp_dir):
+        """Should return stored content and count hits and misses."""
+        cache = BuildCache(temp_dir / "cache")
+
+        assert cache.get("abc") is None
+        cache.put("abc", "content")
+
+        assert cache.get("abc") == "content"
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_none_key_is_never_stored(self, temp_dir):
+        """Should ignore put/get for uncacheable components."""
+        cache = BuildCache(temp_dir / "cache")
+        cache.put(None, "content")
+
+        assert cache.get(None) is None
+        assert not (temp_dir / "cache").exists()
+
+    def test_put_failure_warns_instead_of_raising(self, temp_dir, capsys):
+        """Should print a warning when the cache cannot be written."""
+        cache = BuildCache(temp_dir / "cache")
+
+        with patch("pathlib.Path.write_text", side_effect=OSError("disk full")):
+            cache.put("abc", "content")
+
+        assert "warning" in capsys.readouterr().out.lower()
+
+    def test_manifest_round_trip(self, temp_dir):
+        """Should persist and reload the manifest."""
+        cache = BuildCache(temp_dir / "cache")
+        cache.save_manifest({"build_key": "k", "output_digest": "d"})
+
+        assert cache.load_manifest() == {"build_key": "k", "output_digest": "d"}
+
+    def test_corrupt_manifest_is_ignored(self, temp_dir):
+        """Should return an empty manifest for invalid JSON."""
+        (temp_dir / MANIFEST_NAME).write_text("{not json")
+
+        assert BuildCache(temp_dir).load_manifest() == {}
+
+    def test_prune_keeps_only_referenced_entries(self, temp_dir):
+        """Should delete entries that are not in the keep set."""
+        cache = BuildCache(temp_dir)
+        cache.put("keep", "1")
+        cache.put("drop", "2")
+        cache.save_manifest({})
+
+        cache.prune({"keep"})
+
+        assert (temp_dir / "keep.txt").exists()
+        assert not (temp_dir / "drop.txt").exists()
+        assert (temp_dir / MANIFEST_NAME).exists()
+
+
+class TestCachedBuild:
+    """Tests for build_tracker() with the build cache enabled."""
+
+    @pytest.fixture
+    def build_dir(self, temp_dir, valid_parsed_data, monkeypatch):
+        """Point build_tracker at a temp directory containing parsed_data.json."""
+        import build_tracker
+
+        (temp_dir / "parsed_data.json").write_text(json.dumps(valid_parsed_data))
+        monkeypatch.setattr(build_tracker, "__file__", str(temp_dir / "build_tracker.py"))
+        return temp_dir
+
+    def test_unchanged_rebuild_skips_generators_and_write(self, build_dir, capsys):
+        """Should not regenerate or rewrite tracker.html when nothing changed."""
+        import build_tracker
+
+        build_tracker.build_tracker()
+        first = (build_dir / "tracker.html").read_text(encoding="utf-8")
+
+        with (
+            patch.object(build_tracker, "run_generator") as mock_run,
+            patch.object(build_tracker, "write_output") as mock_write,
+        ):
+            build_tracker.build_tracker()
+
+        mock_run.assert_not_called()
+        mock_write.assert_not_called()
+        assert (build_dir / "tracker.html").read_text(encoding="utf-8") == first
+        assert "up to date" in capsys.readouterr().out
+
+    def test_assembly_change_skips_up_to_date_shortcut(self, build_dir, capsys):
+        """Should reassemble tracker.html when build_tracker.py itself changed."""
+        import build_tracker
+
+        build_tracker.build_tracker()
+        capsys.readouterr()
+        real_digest = build_tracker.source_digest
+
+        def edited_digest(func):
+            return "edited" if func is build_tracker.build_tracker else real_digest(func)
+
+        with patch.object(build_tracker, "source_digest", side_effect=edited_digest):
+            build_tracker.build_tracker()
+
+        assert "Generating components" in capsys.readouterr().out
+
+    def test_data_change_regenerates_only_data(self, build_dir, valid_parsed_data):
+        """Should reuse cached generator output when only the data changes."""
+        import build_tracker
+
+        build_tracker.build_tracker()
+        valid_parsed_data["data"]["blind75"][0]["name"] = "Three Sum"
+        (build_dir / "parsed_data.json").write_text(json.dumps(valid_parsed_data))
+
+        with patch.object(
+            build_tracker, "run_generator", wraps=build_tracker.run_generator
+        ) as mock_run:
+            build_tracker.build_tracker()
+
+        assert [c.args[0] for c in mock_run.call_args_list] == ["js_data_generator"]
+        assert "Three Sum" in (build_dir / "tracker.html").read_text(encoding="utf-8")
+
+    def test_deleted_output_is_rebuilt_from_cache(self, build_dir):
+        """Should rewrite tracker.html from cached components if it was removed."""
+        import build_tracker
+
+        build_tracker.build_tracker()
+        first = (build_dir / "tracker.html").read_text(encoding="utf-8")
+        (build_dir / "tracker.html").unlink()
+
+        with patch.object(build_tracker, "run_generator") as mock_run:
+            build_tracker.build_tracker()
+
+        mock_run.assert_not_called()
+        assert (build_dir / "tracker.html").read_text(encoding="utf-8") == first
+
+    def test_no_cache_always_writes(self, build_dir):
+        """Should regenerate everything and write output with use_cache=False."""
+        import build_tracker
+
+        build_tracker.build_tracker()
+        with patch.object(build_tracker, "write_output") as mock_write:
+            build_tracker.build_tracker(use_cache=False)
+
+        mock_write.assert_called_once()
+
+    def test_main_accepts_no_cache_flag(self, build_dir):
+        """Should accept --no-cache on the command line."""
+        import build_tracker
+
+        assert build_tracker.main(["--no-cache"]) == 0
+        assert (build_dir / "tracker.html").exists()
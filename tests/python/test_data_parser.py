@@ -1,12 +1,26 @@
 """Tests for data_parser.py error handling."""
 
+import json
 import sys
 from io import StringIO
 from unittest.mock import patch
 
 import pytest
 
-from data_parser import main, parse_tsv_files
+from data_parser import (
+    assign_problem_ids,
+    find_tsv_files,
+    iter_tsv_problems,
+    load_previous_output,
+    main,
+    manifest_path_for,
+    merge_parsed_files,
+    parse_tsv_files,
+    parse_tsv_files_incremental,
+    problem_slug,
+    resolve_worker_count,
+    write_parsed_output,
+)
 from exceptions import (
     DataFileEmptyError,
     DataFileNotFoundError,
@@ -280,9 +294,331 @@ class TestValidationErrors:
         assert "no problems parsed" in str(exc_info.value).lower()
 
 
+class TestStreamingParser:
+    """Tests for row-by-row streaming via iter_tsv_problems."""
+
+    HEADER = "Problem Name\tDifficulty\tIntermediate Max time\tAdvanced Max time\tTop of the crop max time\tProblem Pattern\n"
+
+    def test_yields_rows_before_later_errors(self, create_tsv_file):
+        """Should emit valid rows before reaching a malformed one."""
+        path = create_tsv_file(
+            "test.tsv", self.HEADER + "Two Sum\tEasy\t25\t15\t8\tHash Table\nBroken\tEasy\n"
+        )
+        problems = iter_tsv_problems(path)
+
+        assert next(problems)["name"] == "Two Sum"
+        with pytest.raises(TSVParseError) as exc_info:
+            next(problems)
+        assert exc_info.value.line_number == 3
+
+    def test_line_number_accounts_for_multiline_fields(self, create_tsv_file):
+        """Should report the physical line of a record after a quoted multi-line field."""
+        path = create_tsv_file(
+            "test.tsv",
+            self.HEADER + 'Two Sum\tEasy\t25\t15\t8\t"Hash\nTable"\n\tEasy\t1\t1\t1\tX\n',
+        )
+
+        with pytest.raises(TSVParseError) as exc_info:
+            list(iter_tsv_problems(path))
+
+        assert exc_info.value.line_number == 4
+        assert "name is empty" in str(exc_info.value).lower()
+
+    def test_line_number_counts_skipped_blank_rows(self, create_tsv_file):
+        """Should keep counting lines across skipped blank rows."""
+        path = create_tsv_file("test.tsv", self.HEADER + "\n\t\t\n" + "Only\tEasy\n")
+
+        with pytest.raises(TSVParseError) as exc_info:
+            list(iter_tsv_problems(path))
+
+        assert exc_info.value.line_number == 4
+
+    def test_crlf_line_endings(self, create_tsv_file):
+        """Should parse Windows line endings without stray carriage returns."""
+        path = create_tsv_file(
+            "test.tsv", self.HEADER.replace("\n", "\r\n") + "Two Sum\tEasy\t25\t15\t8\tHash\r\n"
+        )
+
+        problems = list(iter_tsv_problems(path))
+
+        assert problems[0]["pattern"] == "Hash"
+
+    def test_invalid_utf8_raises_parse_error(self, temp_dir):
+        """Should wrap decoding errors raised mid-stream in TSVParseError."""
+        raw_dir = temp_dir / "raw"
+        raw_dir.mkdir()
+        path = raw_dir / "test.tsv"
+        path.write_bytes(self.HEADER.encode("utf-8") + b"Two Sum\tEasy\t\xff\xfe\t1\t1\tX\n")
+
+        with pytest.raises(TSVParseError) as exc_info:
+            list(iter_tsv_problems(path))
+
+        assert "encoding" in str(exc_info.value).lower()
+
+
+class TestParallelParsing:
+    """Tests for parallel ingestion (workers > 1)."""
+
+    def test_parallel_output_is_byte_identical(self, temp_dir, create_tsv_file):
+        """Should produce exactly the same JSON as the serial path."""
+        header = "Problem Name\tDifficulty\tIntermediate Max time\tAdvanced Max time\tTop of the crop max time\tProblem Pattern\n"
+        for i in range(6):
+            rows = "".join(
+                f"Problem {(i + j) % 9}\tEasy\t{j}\t2\t1\tPattern {j % 3}\n" for j in range(20)
+            )
+            create_tsv_file(f"list{i}.tsv", header + rows)
+
+        serial = parse_tsv_files(temp_dir / "raw")
+        parallel = parse_tsv_files(temp_dir / "raw", workers=3)
+
+        assert json.dumps(parallel, indent=2) == json.dumps(serial, indent=2)
+        assert parallel["duplicate_map"]
+
+    def test_parallel_propagates_first_error_in_file_order(
+        self, temp_dir, create_tsv_file, valid_tsv_content, malformed_tsv_content
+    ):
+        """Should raise the same error the serial path raises."""
+        create_tsv_file("a.tsv", valid_tsv_content)
+        create_tsv_file("b.tsv", malformed_tsv_content)
+        create_tsv_file("c.tsv", valid_tsv_content)
+
+        with pytest.raises(TSVParseError) as serial_exc:
+            parse_tsv_files(temp_dir / "raw")
+        with pytest.raises(TSVParseError) as parallel_exc:
+            parse_tsv_files(temp_dir / "raw", workers=2)
+
+        assert str(parallel_exc.value) == str(serial_exc.value)
+        assert parallel_exc.value.line_number == serial_exc.value.line_number
+
+    def test_auto_worker_count(self):
+        """Should use at least one worker when workers=0."""
+        assert resolve_worker_count(0) >= 1
+        assert resolve_worker_count(4) == 4
+
+    def test_negative_worker_count_raises(self, temp_dir, create_tsv_file, valid_tsv_content):
+        """Should reject a negative worker count."""
+        create_tsv_file("a.tsv", valid_tsv_content)
+
+        with pytest.raises(ValueError):
+            parse_tsv_files(temp_dir / "raw", workers=-1)
+
+    def test_merge_keeps_file_order(self):
+        """Should keep file_list and duplicate_map ordering from the input order."""
+        problem = {"name": "Two Sum"}
+        result = merge_parsed_files([("b", [problem]), ("a", [dict(problem)])])
+
+        assert result["file_list"] == ["b", "a"]
+        assert result["duplicate_map"] == {"Two Sum": ["b", "a"]}
+
+
+class TestIncrementalParsing:
+    """Tests for manifest-based incremental re-parsing."""
+
+    HEADER = "Problem Name\tDifficulty\tIntermediate Max time\tAdvanced Max time\tTop of the crop max time\tProblem Pattern\n"
+
+    @pytest.fixture
+    def three_lists(self, create_tsv_file):
+        create_tsv_file("a.tsv", self.HEADER + "Two Sum\tEasy\t25\t15\t8\tHash Table\n")
+        create_tsv_file("b.tsv", self.HEADER + "Two Sum\tEasy\t25\t15\t8\tHash Table\n")
+        return create_tsv_file("c.tsv", self.HEADER + "3Sum\tMedium\t55\t40\t28\tTwo Pointers\n")
+
+    def test_first_run_parses_everything(self, temp_dir, three_lists):
+        """Should parse every file when there is no previous state."""
+        result, manifest, changes = parse_tsv_files_incremental(temp_dir / "raw")
+
+        assert sorted(changes["parsed"]) == ["a", "b", "c"]
+        assert set(manifest["files"]) == {"a", "b", "c"}
+        assert result == parse_tsv_files(temp_dir / "raw")
+
+    def test_unchanged_files_are_not_reparsed(self, temp_dir, three_lists):
+        """Should reuse every file whose size and mtime are unchanged."""
+        previous, manifest, _ = parse_tsv_files_incremental(temp_dir / "raw")
+
+        with patch("data_parser.parse_tsv_file") as mock_parse:
+            result, _, changes = parse_tsv_files_incremental(temp_dir / "raw", previous, manifest)
+
+        mock_parse.assert_not_called()
+        assert changes["parsed"] == []
+        assert result == previous
+
+    def test_only_changed_file_is_reparsed(self, temp_dir, three_lists):
+        """Should re-parse only the edited file and update duplicates."""
+        previous, manifest, _ = parse_tsv_files_incremental(temp_dir / "raw")
+        three_lists.write_text(self.HEADER + "Two Sum\tEasy\t25\t15\t8\tHash Table\n")
+
+        result, _, changes = parse_tsv_files_incremental(temp_dir / "raw", previous, manifest)
+
+        assert changes["parsed"] == ["c"]
+        assert result["duplicate_map"]["Two Sum"] == [
+            f for f in result["file_list"] if f in ("a", "b", "c")
+        ]
+        assert json.dumps(result) == json.dumps(parse_tsv_files(temp_dir / "raw"))
+
+    def test_touched_but_identical_file_is_reused(self, temp_dir, three_lists):
+        """Should fall back to the content hash when only the mtime changed."""
+        previous, manifest, _ = parse_tsv_files_incremental(temp_dir / "raw")
+        manifest["files"]["c"]["mtime_ns"] -= 1
+
+        _, new_manifest, changes = parse_tsv_files_incremental(temp_dir / "raw", previous, manifest)
+
+        assert changes["parsed"] == []
+        assert new_manifest["files"]["c"]["mtime_ns"] == three_lists.stat().st_mtime_ns
+
+    def test_added_and_removed_files(self, temp_dir, three_lists, create_tsv_file):
+        """Should parse added files and drop removed ones."""
+        previous, manifest, _ = parse_tsv_files_incremental(temp_dir / "raw")
+        (temp_dir / "raw" / "a.tsv").unlink()
+        create_tsv_file("d.tsv", self.HEADER + "Valid Anagram\tEasy\t15\t10\t5\tHashing\n")
+
+        result, _, changes = parse_tsv_files_incremental(temp_dir / "raw", previous, manifest)
+
+        assert changes["parsed"] == ["d"]
+        assert changes["removed"] == ["a"]
+        assert "a" not in result["data"]
+        assert "Two Sum" not in result["duplicate_map"]
+
+    def test_parser_change_forces_full_parse(self, temp_dir, three_lists):
+        """Should ignore a manifest written by a different parser version."""
+        previous, manifest, _ = parse_tsv_files_incremental(temp_dir / "raw")
+        manifest["parser_sha256"] = "stale"
+
+        _, _, changes = parse_tsv_files_incremental(temp_dir / "raw", previous, manifest)
+
+        assert sorted(changes["parsed"]) == ["a", "b", "c"]
+
+    def test_output_round_trip(self, temp_dir, three_lists):
+        """Should write output and manifest and load them back."""
+        output = temp_dir / "parsed_data.json"
+        result, manifest, _ = parse_tsv_files_incremental(temp_dir / "raw")
+
+        write_parsed_output(result, manifest, output)
+        previous, loaded_manifest = load_previous_output(output)
+
+        assert manifest_path_for(output).exists()
+        assert previous == result
+        assert loaded_manifest["files"] == manifest["files"]
+
+    def test_hand_edited_output_invalidates_manifest(self, temp_dir, three_lists):
+        """Should ignore the manifest when parsed data was changed outside the parser."""
+        output = temp_dir / "parsed_data.json"
+        result, manifest, _ = parse_tsv_files_incremental(temp_dir / "raw")
+        write_parsed_output(result, manifest, output)
+        output.write_text("{}")
+
+        assert load_previous_output(output) == (None, None)
+
+    def test_missing_output_yields_full_parse(self, temp_dir):
+        """Should return no previous state when nothing was written yet."""
+        assert load_previous_output(temp_dir / "parsed_data.json") == (None, None)
+
+
+class TestProblemIds:
+    """Tests for canonical problem IDs."""
+
+    def test_slug_is_url_style(self):
+        """Should lowercase and hyphenate problem names."""
+        assert problem_slug("Two Sum") == "two-sum"
+        assert problem_slug("Pow(x, n)") == "pow-x-n"
+        assert problem_slug("???") == "problem"
+
+    def test_same_name_shares_id_across_lists(self):
+        """Should give a problem the same ID in every list."""
+        first = [{"name": "Two Sum"}, {"name": "3Sum"}]
+        second = [{"name": "3Sum"}]
+
+        assign_problem_ids([("blind75", first), ("neetcode150", second)])
+
+        assert [p["id"] for p in first] == ["two-sum", "3sum"]
+        assert second[0]["id"] == "3sum"
+
+    def test_colliding_slugs_get_suffixes(self):
+        """Should keep IDs unique when different names share a slug."""
+        problems = [
+            {"name": "Two Sum"},
+            {"name": "Two-Sum"},
+            {"name": "two sum"},
+            {"name": "Two Sum"},
+        ]
+
+        assign_problem_ids([("list", problems)])
+
+        assert [p["id"] for p in problems] == ["two-sum", "two-sum-2", "two-sum-3", "two-sum"]
+
+    def test_ids_do_not_depend_on_list_order(self):
+        """Should assign the same suffixes whichever list is read first."""
+
+        def ids(*lists):
+            file_results = [(key, [{"name": name} for name in names]) for key, names in lists]
+            assign_problem_ids(file_results)
+            return {p["name"]: p["id"] for _, problems in file_results for p in problems}
+
+        first = ("blind75", ["Two-Sum", "Two Sum 2"])
+        second = ("uber", ["Two Sum", "two sum"])
+
+        assert ids(first, second) == ids(second, first)
+        assert ids(first, second) == {
+            "Two Sum": "two-sum",
+            "Two Sum 2": "two-sum-2",
+            "Two-Sum": "two-sum-3",
+            "two sum": "two-sum-4",
+        }
+
+    def test_tsv_files_are_sorted(self, temp_dir, create_tsv_file, valid_tsv_content):
+        """Should list TSV files by name so file_list and IDs are reproducible."""
+        for name in ("uber.tsv", "blind75.tsv", "neetcode150.tsv"):
+            create_tsv_file(name, valid_tsv_content)
+
+        assert [p.name for p in find_tsv_files(temp_dir / "raw")] == [
+            "blind75.tsv",
+            "neetcode150.tsv",
+            "uber.tsv",
+        ]
+
+    def test_parsed_output_includes_ids(self, temp_dir, create_tsv_file, valid_tsv_content):
+        """Should add an id to every parsed problem."""
+        create_tsv_file("blind75.tsv", valid_tsv_content)
+
+        result = parse_tsv_files(temp_dir / "raw")
+
+        assert all(p["id"] == problem_slug(p["name"]) for p in result["data"]["blind75"])
+
+
 class TestMainFunction:
     """Tests for main() entry point."""
 
+    def test_output_option_writes_file_incrementally(self, temp_dir, monkeypatch, capsys):
+        """Should write parsed data to --output and reuse it on the next run."""
+        import data_parser
+
+        raw_dir = temp_dir / "raw"
+        raw_dir.mkdir()
+        (raw_dir / "a.tsv").write_text(
+            TestIncrementalParsing.HEADER + "Two Sum\tEasy\t1\t1\t1\tX\n"
+        )
+        monkeypatch.setattr(data_parser, "__file__", str(temp_dir / "data_parser.py"))
+        output = temp_dir / "parsed_data.json"
+
+        assert main(["--output", str(output)]) == 0
+        assert main(["--output", str(output)]) == 0
+
+        assert json.loads(output.read_text())["file_list"] == ["a"]
+        assert "reused 1" in capsys.readouterr().out
+
+    def test_passes_workers_option(self, valid_parsed_data):
+        """Should forward --workers to parse_tsv_files."""
+        with patch("data_parser.parse_tsv_files") as mock_parse:
+            mock_parse.return_value = valid_parsed_data
+            with patch.object(sys, "stdout", StringIO()):
+                result = main(["--workers", "4"])
+
+        assert result == 0
+        assert mock_parse.call_args.kwargs["workers"] == 4
+
+    def test_rejects_negative_workers_option(self):
+        """Should exit with a usage error for negative --workers."""
+        with pytest.raises(SystemExit), patch.object(sys, "stderr", StringIO()):
+            main(["--workers", "-2"])
+
     def test_returns_zero_on_success(self, valid_parsed_data):
         """Should return 0 on successful parsing."""
         with patch("data_parser.parse_tsv_files") as mock_parse:
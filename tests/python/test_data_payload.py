@@ -0,0 +1,125 @@
+"""Tests for data_payload.py."""
+
+import json
+
+import pytest
+
+from data_parser import parse_tsv_files
+from data_payload import (
+    PAYLOAD_VERSION,
+    decode_problem_data,
+    encode_problem_data,
+    payload_to_js_literal,
+)
+
+HEADER = "Problem Name\tDifficulty\tIntermediate Max time\tAdvanced Max time\tTop of the crop max time\tProblem Pattern\tLink\n"
+
+
+@pytest.fixture
+def parsed_lists(create_tsv_file, temp_dir):
+    """Parse two lists that share one problem."""
+    create_tsv_file(
+        "blind75.tsv",
+        HEADER
+        + "Two Sum\tEasy\t25\t15\t8\tHash Table\thttps://leetcode.com/problems/two-sum/\n"
+        + "3Sum\tMedium\t55\t40\t28\tTwo Pointers\t\n",
+    )
+    create_tsv_file(
+        "neetcode150.tsv",
+        HEADER
+        + "Two Sum\tEasy\t25\t15\t8\tHash Table\thttps://leetcode.com/problems/two-sum/\n"
+        + "Valid Anagram\tEasy\t25\t15\t8\tHash Table\t\n",
+    )
+    return parse_tsv_files(temp_dir / "raw")
+
+
+class TestEncodeProblemData:
+    """Tests for encode_problem_data."""
+
+    def test_round_trip_is_lossless(self, parsed_lists):
+        """Should decode back to exactly the parsed data."""
+        decoded = decode_problem_data(encode_problem_data(parsed_lists))
+
+        assert json.dumps(decoded) == json.dumps(parsed_lists)
+
+    def test_shared_problems_are_stored_once(self, parsed_lists):
+        """Should reference identical problems by the same canonical index."""
+        payload = encode_problem_data(parsed_lists)
+        blind75, neetcode150 = (payload["lists"][f] for f in parsed_lists["file_list"])
+
+        assert payload["problems"]["name"].count("Two Sum") == 1
+        assert blind75[0] == neetcode150[0]
+        assert len(payload["problems"]["name"]) == 3
+
+    def test_categorical_columns_use_string_table(self, parsed_lists):
+        """Should store each distinct difficulty and pattern once."""
+        payload = encode_problem_data(parsed_lists)
+
+        assert payload["strings"].count("Easy") == 1
+        assert payload["strings"].count("Hash Table") == 1
+        assert all(isinstance(i, int) for i in payload["problems"]["difficulty"])
+
+    def test_default_user_fields_are_omitted(self, parsed_lists):
+        """Should not encode unsolved placeholder fields."""
+        payload = encode_problem_data(parsed_lists)
+
+        assert payload["version"] == PAYLOAD_VERSION
+        assert payload["state"] == {}
+        assert "solved" not in payload["problems"]
+
+    def test_non_default_user_fields_survive(self, parsed_lists):
+        """Should keep tracking values that differ from the defaults."""
+        parsed_lists["data"]["neetcode150"][1]["solved"] = True
+        parsed_lists["data"]["neetcode150"][1]["comments"] = "sort both"
+
+        payload = encode_problem_data(parsed_lists)
+
+        assert payload["state"] == {"neetcode150": {"1": {"solved": True, "comments": "sort both"}}}
+        assert decode_problem_data(payload) == parsed_lists
+
+    def test_same_name_with_different_fields_stays_distinct(self, parsed_lists):
+        """Should only share records whose static fields all match."""
+        parsed_lists["data"]["neetcode150"][0]["difficulty"] = "Medium"
+
+        payload = encode_problem_data(parsed_lists)
+
+        assert payload["problems"]["name"].count("Two Sum") == 2
+        assert decode_problem_data(payload) == parsed_lists
+
+    def test_problem_ids_are_stored_per_record(self, parsed_lists):
+        """Should keep the canonical ID column alongside the static fields."""
+        payload = encode_problem_data(parsed_lists)
+
+        assert payload["problems"]["id"] == ["two-sum", "3sum", "valid-anagram"]
+        assert decode_problem_data(payload)["data"]["neetcode150"][0]["id"] == "two-sum"
+
+    def test_duplicate_map_is_derived(self, parsed_lists):
+        """Should rebuild the duplicate map from list membership."""
+        decoded = decode_problem_data(encode_problem_data(parsed_lists))
+
+        assert decoded["duplicate_map"] == {"Two Sum": ["blind75", "neetcode150"]}
+
+    def test_payload_is_smaller_than_parsed_json(self, parsed_lists):
+        """Should produce a smaller serialization than the indented JSON."""
+        compact = payload_to_js_literal(encode_problem_data(parsed_lists))
+
+        assert len(compact) < len(json.dumps(parsed_lists, indent=2))
+
+
+class TestPayloadToJsLiteral:
+    """Tests for payload_to_js_literal."""
+
+    def test_literal_decodes_to_payload(self, parsed_lists):
+        """Should be a JSON string literal containing the payload JSON."""
+        payload = encode_problem_data(parsed_lists)
+
+        assert json.loads(json.loads(payload_to_js_literal(payload))) == payload
+
+    def test_script_close_tag_is_escaped(self, valid_parsed_data):
+        """Should never emit a literal </script> sequence."""
+        valid_parsed_data["data"]["blind75"][0]["name"] = "</script><script>alert(1)</script>"
+
+        literal = payload_to_js_literal(encode_problem_data(valid_parsed_data))
+
+        assert "</" not in literal
+        assert "</script>" in json.loads(json.loads(literal))["problems"]["name"][0]
@@ -1,5 +1,7 @@
 """Tests for the custom exception hierarchy."""
 
+import pickle
+
 from exceptions import (
     DataFileEmptyError,
     DataFileNotFoundError,
@@ -294,3 +296,36 @@ class TestExceptionHierarchy:
                 raise err
             except GrindPulseError:
                 pass  # Should catch all
+
+
+class TestPickling:
+    """Tests that errors survive pickling (raised in parser worker processes)."""
+
+    def test_base_error_round_trip(self):
+        """Should preserve message, file path and suggestion."""
+        err = DataFileEmptyError("Empty", file_path="/a.tsv", suggestion="Add rows")
+        restored = pickle.loads(pickle.dumps(err))
+
+        assert type(restored) is DataFileEmptyError
+        assert str(restored) == str(err)
+        assert restored.file_path == "/a.tsv"
+        assert restored.suggestion == "Add rows"
+
+    def test_tsv_parse_error_round_trip(self):
+        """Should preserve line number without duplicating it in the message."""
+        err = TSVParseError("Bad row", file_path="/a.tsv", line_number=7, suggestion="Fix it")
+        restored = pickle.loads(pickle.dumps(err))
+
+        assert type(restored) is TSVParseError
+        assert str(restored) == str(err)
+        assert restored.line_number == 7
+        assert str(restored).count("line 7") == 1
+
+    def test_generator_error_round_trip(self):
+        """Should preserve generator name and original error."""
+        err = GeneratorError("css_generator", ValueError("boom"))
+        restored = pickle.loads(pickle.dumps(err))
+
+        assert str(restored) == str(err)
+        assert restored.generator_name == "css_generator"
+        assert isinstance(restored.original_error, ValueError)
@@ -0,0 +1,212 @@
+"""Tests for watcher.py (build_tracker.py --watch)."""
+
+import importlib
+import sys
+from unittest.mock import patch
+
+import pytest
+
+import build_tracker
+import watcher
+from watcher import TrackerWatcher, changed_paths, reload_order, snapshot
+
+HEADER = "Problem Name\tDifficulty\tIntermediate Max time\tAdvanced Max time\tTop of the crop max time\tProblem Pattern\n"
+
+
+@pytest.fixture
+def watch_dir(temp_dir, create_tsv_file, monkeypatch):
+    """Point build_tracker at a temp directory with two TSV lists."""
+    create_tsv_file("a.tsv", HEADER + "Two Sum\tEasy\t25\t15\t8\tHash Table\n")
+    create_tsv_file("b.tsv", HEADER + "3Sum\tMedium\t55\t40\t28\tTwo Pointers\n")
+    monkeypatch.setattr(build_tracker, "__file__", str(temp_dir / "build_tracker.py"))
+    return temp_dir
+
+
+@pytest.fixture
+def fake_generator(watch_dir, monkeypatch):
+    """Create an importable generator module inside the watched directory."""
+    path = watch_dir / "watchtest_generator.py"
+    path.write_text("def generate_watchtest():\n    return 'one'\n")
+    monkeypatch.syspath_prepend(str(watch_dir))
+    monkeypatch.setattr(sys, "dont_write_bytecode", True)
+    module = importlib.import_module("watchtest_generator")
+    monkeypatch.setattr(
+        build_tracker, "generate_watchtest", module.generate_watchtest, raising=False
+    )
+    yield path
+    sys.modules.pop("watchtest_generator", None)
+
+
+@pytest.fixture
+def fake_helper(fake_generator, watch_dir, monkeypatch):
+    """Create a helper module imported by fake_generator and by build_tracker."""
+    path = watch_dir / "watchtest_helper.py"
+    path.write_text("def encode_watchtest():\n    return 'one'\n")
+    module = importlib.import_module("watchtest_helper")
+    fake_generator.write_text(
+        "from watchtest_helper import encode_watchtest\n\ndef generate_watchtest():\n    return encode_watchtest()\n"
+    )
+    generator = importlib.reload(sys.modules["watchtest_generator"])
+    monkeypatch.setattr(
+        build_tracker, "generate_watchtest", generator.generate_watchtest, raising=False
+    )
+    monkeypatch.setattr(build_tracker, "encode_watchtest", module.encode_watchtest, raising=False)
+    monkeypatch.setitem(watcher.HELPER_DEPENDENTS, "watchtest_helper", ("watchtest_generator",))
+    yield path
+    sys.modules.pop("watchtest_helper", None)
+
+
+class TestSnapshot:
+    """Tests for snapshot and changed_paths."""
+
+    def test_snapshot_skips_missing_files(self, temp_dir):
+        """Should only include files that exist."""
+        present = temp_dir / "present.txt"
+        present.write_text("x")
+
+        assert list(snapshot([present, temp_dir / "missing.txt"])) == [str(present)]
+
+    def test_changed_paths_reports_added_removed_and_modified(self):
+        """Should list every path whose state differs."""
+        old = {"a": (1, 1), "b": (1, 1), "c": (1, 1)}
+        new = {"a": (1, 1), "b": (2, 2), "d": (1, 1)}
+
+        assert changed_paths(old, new) == ["b", "c", "d"]
+
+    def test_reload_order_puts_helpers_before_dependents(self):
+        """Should reload a changed helper first and then every module importing it."""
+        assert reload_order(["js_core_generator", "data_payload"]) == [
+            "data_payload",
+            "js_data_generator",
+            "js_core_generator",
+        ]
+        assert reload_order(["js_data_generator", "data_payload"]) == [
+            "data_payload",
+            "js_data_generator",
+        ]
+
+
+class TestTrackerWatcher:
+    """Tests for TrackerWatcher stage selection."""
+
+    def test_start_parses_and_builds(self, watch_dir):
+        """Should write parsed data, its manifest and tracker.html on start."""
+        watcher = TrackerWatcher(watch_dir)
+
+        assert watcher.start() == ["parse", "build"]
+        assert (watch_dir / "parsed_data.json").exists()
+        assert (watch_dir / "parsed_data.manifest.json").exists()
+        assert "Two Sum" in (watch_dir / "tracker.html").read_text(encoding="utf-8")
+
+    def test_no_changes_does_nothing(self, watch_dir):
+        """Should not parse or build when nothing changed."""
+        watcher = TrackerWatcher(watch_dir)
+        watcher.start()
+
+        with patch.object(build_tracker, "build_tracker") as mock_build:
+            assert watcher.check() == []
+
+        mock_build.assert_not_called()
+
+    def test_tsv_change_reparses_only_that_file(self, watch_dir, capsys):
+        """Should re-parse the edited list and rebuild from in-memory data."""
+        watcher = TrackerWatcher(watch_dir)
+        watcher.start()
+        capsys.readouterr()
+        (watch_dir / "raw" / "b.tsv").write_text(
+            HEADER + "Four Sum\tMedium\t55\t40\t28\tTwo Pointers\n"
+        )
+
+        with patch.object(build_tracker, "load_parsed_data") as mock_load:
+            assert watcher.check() == ["parse", "build"]
+
+        mock_load.assert_not_called()
+        assert "Parsed 1, reused 1" in capsys.readouterr().out
+        assert "Four Sum" in (watch_dir / "tracker.html").read_text(encoding="utf-8")
+
+    def test_parse_error_keeps_watching(self, watch_dir, capsys):
+        """Should report a broken TSV, skip the build and recover once it is fixed."""
+        watcher = TrackerWatcher(watch_dir)
+        watcher.start()
+        before = (watch_dir / "tracker.html").read_text(encoding="utf-8")
+        (watch_dir / "raw" / "b.tsv").write_text(HEADER + "Broken\tEasy\n")
+
+        assert watcher.check() == []
+        assert "Error" in capsys.readouterr().err
+        assert (watch_dir / "tracker.html").read_text(encoding="utf-8") == before
+
+        (watch_dir / "raw" / "b.tsv").write_text(HEADER + "Fixed\tEasy\t25\t15\t8\tHash Table\n")
+        assert watcher.check() == ["parse", "build"]
+        assert "Fixed" in (watch_dir / "tracker.html").read_text(encoding="utf-8")
+
+    def test_generator_change_reloads_module(self, watch_dir, fake_generator):
+        """Should reload an edited generator and rebind it in build_tracker."""
+        watcher = TrackerWatcher(watch_dir)
+        watcher.start()
+        fake_generator.write_text("def generate_watchtest():\n    return 'two!'\n")
+
+        with patch.object(build_tracker, "build_tracker") as mock_build:
+            assert watcher.check() == ["reload:watchtest_generator", "build"]
+
+        mock_build.assert_called_once()
+        assert build_tracker.generate_watchtest() == "two!"
+
+    def test_broken_generator_blocks_builds_until_fixed(self, watch_dir, fake_generator, capsys):
+        """Should not build while an edited generator fails to import."""
+        watcher = TrackerWatcher(watch_dir)
+        watcher.start()
+        fake_generator.write_text("def generate_watchtest(:\n")
+
+        with patch.object(build_tracker, "build_tracker") as mock_build:
+            assert watcher.check() == []
+            mock_build.assert_not_called()
+            assert "watchtest_generator" in capsys.readouterr().err
+
+            fake_generator.write_text("def generate_watchtest():\n    return 'fixed'\n")
+            assert watcher.check() == ["reload:watchtest_generator", "build"]
+
+        assert build_tracker.generate_watchtest() == "fixed"
+
+    def test_helper_change_reloads_helper_then_dependents(self, watch_dir, fake_helper):
+        """Should reload an edited helper, its importers and rebind both in build_tracker."""
+        watcher = TrackerWatcher(watch_dir)
+        watcher.start()
+        fake_helper.write_text("def encode_watchtest():\n    return 'two!'\n")
+
+        with patch.object(build_tracker, "build_tracker") as mock_build:
+            assert watcher.check() == [
+                "reload:watchtest_helper",
+                "reload:watchtest_generator",
+                "build",
+            ]
+
+        mock_build.assert_called_once()
+        assert build_tracker.encode_watchtest() == "two!"
+        assert build_tracker.generate_watchtest() == "two!"
+
+    def test_reload_keeps_names_bound_elsewhere(self, watch_dir, fake_helper):
+        """Should only rebind build_tracker names that came from the reloaded module."""
+        (watch_dir / "watchtest_helper.py").write_text(
+            "def encode_watchtest():\n    return 'x'\n\ndef main():\n    return 1\n"
+        )
+        original_main = build_tracker.main
+        watcher = TrackerWatcher(watch_dir)
+
+        assert watcher._reload("watchtest_helper")
+        assert build_tracker.main is original_main
+
+
+class TestWatchFlag:
+    """Tests for the --watch command-line flag."""
+
+    def test_main_runs_watch_mode(self, watch_dir):
+        """Should hand off to watch() with the requested interval."""
+        with patch("watcher.watch") as mock_watch:
+            assert build_tracker.main(["--watch", "--interval", "0.5"]) == 0
+
+        mock_watch.assert_called_once_with(watch_dir, interval=0.5, use_cache=True)
+
+    def test_non_positive_interval_is_rejected(self):
+        """Should exit with a usage error for --interval 0."""
+        with pytest.raises(SystemExit):
+            build_tracker.parse_args(["--watch", "--interval", "0"])
@@ -0,0 +1,56 @@
+/**
+ * Relative Solved Dates (Extracted for Testing)
+ *
+ * SYNCHRONIZATION REQUIREMENT:
+ * These functions mirror the JavaScript code generated by js_core_generator.py
+ * (formatRelativeTime) and js_timers_generator.py (getRelativeTimeChangeAt).
+ * When modifying those functions, update this file to keep them in sync.
+ * formatRelativeTime takes `now` here so tests can pin the clock.
+ * After changes, verify with: npm test
+ */
+
+export function formatRelativeTime(isoDate, now = new Date()) {
+  if (!isoDate) return '';
+
+  const date = new Date(isoDate);
+  const diffMs = now - date;
+  const diffSec = Math.floor(diffMs / 1000);
+  const diffMin = Math.floor(diffSec / 60);
+  const diffHour = Math.floor(diffMin / 60);
+  const diffDay = Math.floor(diffHour / 24);
+  const diffWeek = Math.floor(diffDay / 7);
+  const diffMonth = Math.floor(diffDay / 30);
+  const diffYear = Math.floor(diffDay / 365);
+
+  if (diffSec < 60) return 'just now';
+  if (diffMin < 60) return `${diffMin} min ago`;
+  if (diffHour < 24) return `${diffHour} hour${diffHour > 1 ? 's' : ''} ago`;
+  if (diffDay < 7) return `${diffDay} day${diffDay > 1 ? 's' : ''} ago`;
+  if (diffWeek < 4) return `${diffWeek} week${diffWeek > 1 ? 's' : ''} ago`;
+  if (diffMonth < 12) return `${diffMonth} month${diffMonth > 1 ? 's' : ''} ago`;
+  return `${diffYear} year${diffYear > 1 ? 's' : ''} ago`;
+}
+
+export const RELATIVE_TIME_MINUTE_MS = 60 * 1000;
+export const RELATIVE_TIME_DAY_MS = 24 * 60 * RELATIVE_TIME_MINUTE_MS;
+// [age limit, unit] for each wording after "just now" (see formatRelativeTime)
+const RELATIVE_TIME_STEPS = [
+  [60 * RELATIVE_TIME_MINUTE_MS, RELATIVE_TIME_MINUTE_MS],
+  [RELATIVE_TIME_DAY_MS, 60 * RELATIVE_TIME_MINUTE_MS],
+  [7 * RELATIVE_TIME_DAY_MS, RELATIVE_TIME_DAY_MS],
+  [28 * RELATIVE_TIME_DAY_MS, 7 * RELATIVE_TIME_DAY_MS],
+  [360 * RELATIVE_TIME_DAY_MS, 30 * RELATIVE_TIME_DAY_MS],
+  [Infinity, 365 * RELATIVE_TIME_DAY_MS]
+];
+
+// Time (ms) after `now` at which formatRelativeTime(isoDate) next changes,
+// or Infinity if it never will (no date, invalid date)
+export function getRelativeTimeChangeAt(isoDate, now) {
+  if (!isoDate) return Infinity;
+  const date = new Date(isoDate).getTime();
+  if (isNaN(date)) return Infinity;
+  const diffMs = now - date;
+  if (diffMs < RELATIVE_TIME_MINUTE_MS) return date + RELATIVE_TIME_MINUTE_MS;
+  const [, unit] = RELATIVE_TIME_STEPS.find(([limit]) => diffMs < limit);
+  return date + (Math.floor(diffMs / unit) + 1) * unit;
+}
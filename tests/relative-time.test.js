@@ -0,0 +1,52 @@
+/**
+ * Unit Tests for Relative Solved Date Refresh Times
+ */
+
+import {
+  formatRelativeTime,
+  getRelativeTimeChangeAt,
+  RELATIVE_TIME_MINUTE_MS,
+  RELATIVE_TIME_DAY_MS
+} from './relative-time.js';
+
+const solvedAt = Date.parse('2025-01-01T12:00:00.000Z');
+const solvedDate = new Date(solvedAt).toISOString();
+
+describe('getRelativeTimeChangeAt', () => {
+  test('returns Infinity without a valid date', () => {
+    expect(getRelativeTimeChangeAt('', solvedAt)).toBe(Infinity);
+    expect(getRelativeTimeChangeAt(null, solvedAt)).toBe(Infinity);
+    expect(getRelativeTimeChangeAt('not a date', solvedAt)).toBe(Infinity);
+  });
+
+  test('"just now" lasts one minute, even for future dates', () => {
+    expect(getRelativeTimeChangeAt(solvedDate, solvedAt + 5000)).toBe(solvedAt + RELATIVE_TIME_MINUTE_MS);
+    expect(getRelativeTimeChangeAt(solvedDate, solvedAt - RELATIVE_TIME_DAY_MS)).toBe(solvedAt + RELATIVE_TIME_MINUTE_MS);
+  });
+
+  test('steps by the unit being shown', () => {
+    const hour = 60 * RELATIVE_TIME_MINUTE_MS;
+    expect(getRelativeTimeChangeAt(solvedDate, solvedAt + 90 * 1000)).toBe(solvedAt + 2 * RELATIVE_TIME_MINUTE_MS);
+    expect(getRelativeTimeChangeAt(solvedDate, solvedAt + 3.5 * hour)).toBe(solvedAt + 4 * hour);
+    expect(getRelativeTimeChangeAt(solvedDate, solvedAt + 2.5 * RELATIVE_TIME_DAY_MS)).toBe(solvedAt + 3 * RELATIVE_TIME_DAY_MS);
+    expect(getRelativeTimeChangeAt(solvedDate, solvedAt + 10 * RELATIVE_TIME_DAY_MS)).toBe(solvedAt + 14 * RELATIVE_TIME_DAY_MS);
+    expect(getRelativeTimeChangeAt(solvedDate, solvedAt + 100 * RELATIVE_TIME_DAY_MS)).toBe(solvedAt + 120 * RELATIVE_TIME_DAY_MS);
+    expect(getRelativeTimeChangeAt(solvedDate, solvedAt + 800 * RELATIVE_TIME_DAY_MS)).toBe(solvedAt + 1095 * RELATIVE_TIME_DAY_MS);
+  });
+
+  test('text is unchanged until the returned time and changes at it', () => {
+    // Sample ages across every wording, including the week/month/year edges
+    const ages = [];
+    for (let age = 0; age < 800 * RELATIVE_TIME_DAY_MS; age = Math.floor(age * 1.37) + 7919) ages.push(age);
+    ages.push(27 * RELATIVE_TIME_DAY_MS, 359 * RELATIVE_TIME_DAY_MS);
+
+    ages.forEach(age => {
+      const now = solvedAt + age;
+      const at = getRelativeTimeChangeAt(solvedDate, now);
+      const text = formatRelativeTime(solvedDate, new Date(now));
+      expect(at).toBeGreaterThan(now);
+      expect(formatRelativeTime(solvedDate, new Date(at - 1))).toBe(text);
+      expect(formatRelativeTime(solvedDate, new Date(at))).not.toBe(text);
+    });
+  });
+});
@@ -0,0 +1,124 @@
+/**
+ * Review Queue (Extracted for Testing)
+ *
+ * SYNCHRONIZATION REQUIREMENT:
+ * These functions mirror the JavaScript code generated by js_review_generator.py
+ * (createReviewQueue, reviewQueueSet, reviewQueueRemove, reviewQueueWalk,
+ * getReviewDueDays, reviewForecast, getReviewFlashTime).
+ * When modifying those functions, update this file to keep them in sync.
+ * After changes, verify with: npm test
+ */
+
+import { getAwarenessDailyRate, getConfig } from './awareness.js';
+import { AWARENESS_DAY_MS, pushAwarenessDue, popAwarenessDue } from './awareness-schedule.js';
+
+// heap: [{ id, at }] ordered by at; positions: id -> heap index
+export function createReviewQueue() {
+  return { heap: [], positions: new Map() };
+}
+
+function reviewQueueMove(queue, entry, i) {
+  queue.heap[i] = entry;
+  queue.positions.set(entry.id, i);
+}
+
+function reviewQueueSiftUp(queue, i) {
+  const heap = queue.heap;
+  const entry = heap[i];
+  while (i > 0) {
+    const parent = (i - 1) >> 1;
+    if (heap[parent].at <= entry.at) break;
+    reviewQueueMove(queue, heap[parent], i);
+    i = parent;
+  }
+  reviewQueueMove(queue, entry, i);
+}
+
+function reviewQueueSiftDown(queue, i) {
+  const heap = queue.heap;
+  const entry = heap[i];
+  for (;;) {
+    const left = 2 * i + 1;
+    if (left >= heap.length) break;
+    const child = left + 1 < heap.length && heap[left + 1].at < heap[left].at ? left + 1 : left;
+    if (heap[child].at >= entry.at) break;
+    reviewQueueMove(queue, heap[child], i);
+    i = child;
+  }
+  reviewQueueMove(queue, entry, i);
+}
+
+// Insert a problem or move it to a new time; Infinity (never due) removes it
+export function reviewQueueSet(queue, id, at) {
+  if (!(at < Infinity)) {
+    reviewQueueRemove(queue, id);
+    return;
+  }
+  const i = queue.positions.get(id);
+  if (i === undefined) {
+    queue.heap.push({ id, at });
+    reviewQueueSiftUp(queue, queue.heap.length - 1);
+    return;
+  }
+  const previous = queue.heap[i].at;
+  queue.heap[i].at = at;
+  if (at < previous) {
+    reviewQueueSiftUp(queue, i);
+  } else {
+    reviewQueueSiftDown(queue, i);
+  }
+}
+
+export function reviewQueueRemove(queue, id) {
+  const i = queue.positions.get(id);
+  if (i === undefined) return false;
+  queue.positions.delete(id);
+  const last = queue.heap.pop();
+  if (i < queue.heap.length) {
+    reviewQueueMove(queue, last, i);
+    reviewQueueSiftUp(queue, i);
+    reviewQueueSiftDown(queue, queue.positions.get(last.id));
+  }
+  return true;
+}
+
+// Entries due by `until`, earliest first, at most `limit` of them. Walks
+// the heap through a frontier of candidates, so only the entries returned
+// (and their children) are visited and the queue is left untouched.
+export function reviewQueueWalk(queue, limit, until = Infinity) {
+  const heap = queue.heap;
+  const entries = [];
+  const frontier = [];
+  if (heap.length > 0 && heap[0].at <= until) pushAwarenessDue(frontier, { at: heap[0].at, i: 0 });
+  while (frontier.length > 0 && entries.length < limit) {
+    const { i } = popAwarenessDue(frontier);
+    entries.push(heap[i]);
+    for (let child = 2 * i + 1; child <= 2 * i + 2 && child < heap.length; child++) {
+      if (heap[child].at <= until) pushAwarenessDue(frontier, { at: heap[child].at, i: child });
+    }
+  }
+  return entries;
+}
+
+// Whole days until a queued time (0 once it is flashing)
+export function getReviewDueDays(at, now) {
+  return Math.max(0, Math.ceil((at - now) / AWARENESS_DAY_MS));
+}
+
+// Problems due now (index 0) and on each of the next `days` days
+export function reviewForecast(queue, now, days) {
+  const counts = new Array(days + 1).fill(0);
+  reviewQueueWalk(queue, Infinity, now + days * AWARENESS_DAY_MS)
+    .forEach(entry => counts[getReviewDueDays(entry.at, now)]++);
+  return counts;
+}
+
+// Time (ms) at which a problem starts flashing, or Infinity if it never will
+export function getReviewFlashTime(problem) {
+  if (!problem || !problem.solved) return Infinity;
+  const solvedAt = new Date(problem.solved_date).getTime();
+  if (isNaN(solvedAt)) return Infinity;
+  const dailyRate = getAwarenessDailyRate(problem);
+  if (!(dailyRate > 0)) return Infinity;
+  return solvedAt + getConfig().thresholds.darkRed / dailyRate * AWARENESS_DAY_MS;
+}
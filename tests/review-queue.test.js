@@ -0,0 +1,113 @@
+/**
+ * Unit Tests for the Review Queue
+ */
+
+import {
+  createReviewQueue,
+  reviewQueueSet,
+  reviewQueueRemove,
+  reviewQueueWalk,
+  getReviewDueDays,
+  reviewForecast,
+  getReviewFlashTime
+} from './review-queue.js';
+import { AWARENESS_DAY_MS } from './awareness-schedule.js';
+import {
+  calculateAwarenessScore,
+  setMockProblemData,
+  resetConfig
+} from './awareness.js';
+import { calculateDaysUntilFlashing } from './urgent-review.js';
+
+beforeEach(() => {
+  resetConfig();
+  setMockProblemData({ file_list: ['list1'], data: { list1: [] } });
+});
+
+const order = queue => reviewQueueWalk(queue, Infinity).map(entry => entry.id);
+
+function checkHeap(queue) {
+  queue.heap.forEach((entry, i) => {
+    if (i > 0) expect(queue.heap[(i - 1) >> 1].at).toBeLessThanOrEqual(entry.at);
+    expect(queue.positions.get(entry.id)).toBe(i);
+  });
+  expect(queue.positions.size).toBe(queue.heap.length);
+}
+
+describe('review queue heap', () => {
+  test('walks entries in time order', () => {
+    const queue = createReviewQueue();
+    [['e', 50], ['a', 10], ['d', 40], ['c', 30], ['b', 20], ['f', 60]].forEach(([id, at]) => reviewQueueSet(queue, id, at));
+    checkHeap(queue);
+    expect(order(queue)).toEqual(['a', 'b', 'c', 'd', 'e', 'f']);
+  });
+
+  test('moves an entry when its time changes', () => {
+    const queue = createReviewQueue();
+    ['a', 'b', 'c', 'd'].forEach((id, i) => reviewQueueSet(queue, id, (i + 1) * 10));
+    reviewQueueSet(queue, 'd', 5);
+    reviewQueueSet(queue, 'a', 35);
+    checkHeap(queue);
+    expect(order(queue)).toEqual(['d', 'b', 'c', 'a']);
+    expect(queue.heap.length).toBe(4);
+  });
+
+  test('removes entries, including by setting an infinite time', () => {
+    const queue = createReviewQueue();
+    ['a', 'b', 'c', 'd', 'e'].forEach((id, i) => reviewQueueSet(queue, id, i));
+    expect(reviewQueueRemove(queue, 'b')).toBe(true);
+    expect(reviewQueueRemove(queue, 'b')).toBe(false);
+    reviewQueueSet(queue, 'a', Infinity);
+    reviewQueueSet(queue, 'z', Infinity);
+    checkHeap(queue);
+    expect(order(queue)).toEqual(['c', 'd', 'e']);
+  });
+
+  test('walks only up to a limit and time without changing the queue', () => {
+    const queue = createReviewQueue();
+    for (let i = 20; i > 0; i--) reviewQueueSet(queue, `p${i}`, i);
+    expect(reviewQueueWalk(queue, 3).map(entry => entry.at)).toEqual([1, 2, 3]);
+    expect(reviewQueueWalk(queue, Infinity, 5).map(entry => entry.at)).toEqual([1, 2, 3, 4, 5]);
+    expect(queue.heap.length).toBe(20);
+    checkHeap(queue);
+  });
+});
+
+describe('reviewForecast', () => {
+  test('counts problems due now and on each following day', () => {
+    const now = Date.UTC(2025, 0, 1);
+    const queue = createReviewQueue();
+    reviewQueueSet(queue, 'overdue', now - 3 * AWARENESS_DAY_MS);
+    reviewQueueSet(queue, 'now', now);
+    reviewQueueSet(queue, 'soon', now + 1000);
+    reviewQueueSet(queue, 'day2', now + 1.5 * AWARENESS_DAY_MS);
+    reviewQueueSet(queue, 'day3', now + 3 * AWARENESS_DAY_MS);
+    reviewQueueSet(queue, 'later', now + 10 * AWARENESS_DAY_MS);
+    expect(reviewForecast(queue, now, 3)).toEqual([2, 1, 1, 1]);
+  });
+
+  test('rounds partial days up', () => {
+    expect(getReviewDueDays(100, 200)).toBe(0);
+    expect(getReviewDueDays(AWARENESS_DAY_MS, 0)).toBe(1);
+    expect(getReviewDueDays(AWARENESS_DAY_MS + 1, 0)).toBe(2);
+  });
+});
+
+describe('getReviewFlashTime', () => {
+  const solvedAgo = days => new Date(Date.now() - days * AWARENESS_DAY_MS).toISOString();
+
+  test('agrees with calculateDaysUntilFlashing', () => {
+    [1, 5, 12, 30].forEach(days => {
+      const problem = { solved: true, time_to_solve: '', difficulty: 'Medium', solved_date: solvedAgo(days) };
+      const expected = calculateDaysUntilFlashing(problem, calculateAwarenessScore(problem));
+      expect(getReviewDueDays(getReviewFlashTime(problem), Date.now())).toBe(expected);
+    });
+  });
+
+  test('never queues unsolved, undated or mastered problems', () => {
+    expect(getReviewFlashTime({ solved: false })).toBe(Infinity);
+    expect(getReviewFlashTime({ solved: true, solved_date: '' })).toBe(Infinity);
+    const mastered = { solved: true, time_to_solve: '5', top_time: '10', difficulty: 'Easy', solved_date: solvedAgo(3) };
+    expect(getReviewFlashTime(mastered)).toBe(Infinity);
+  });
+});
@@ -0,0 +1,63 @@
+/**
+ * Awareness Scoring Worker Tasks (Extracted for Testing)
+ *
+ * SYNCHRONIZATION REQUIREMENT:
+ * These functions mirror the JavaScript code generated by js_scoring_generator.py
+ * (compactScoringProblem, scoringSnapshotMatches, awarenessCode, scoreAwarenessBatch).
+ * When modifying those functions, update this file to keep them in sync.
+ * After changes, verify with: npm test
+ */
+
+import { calculateAwarenessScore, getAwarenessClass } from './awareness.js';
+import { getNextAwarenessTransition } from './awareness-schedule.js';
+
+// Mirrors AWARENESS_CLASSES in js_awareness_generator.py
+export const AWARENESS_CLASSES = [
+  'awareness-white',
+  'awareness-green',
+  'awareness-yellow',
+  'awareness-red',
+  'awareness-dark-red',
+  'awareness-flashing',
+  'unsolved-problem'
+];
+
+// The fields scoring reads, copied off a problem (also used as a snapshot
+// to spot rows edited while their batch was being scored)
+export function compactScoringProblem(problem) {
+  return {
+    solved: problem.solved,
+    solved_date: problem.solved_date,
+    time_to_solve: problem.time_to_solve,
+    top_time: problem.top_time,
+    advanced_time: problem.advanced_time,
+    intermediate_time: problem.intermediate_time,
+    difficulty: problem.difficulty
+  };
+}
+
+export function scoringSnapshotMatches(snapshot, problem) {
+  return !!problem &&
+    snapshot.solved === problem.solved &&
+    snapshot.solved_date === problem.solved_date &&
+    snapshot.time_to_solve === problem.time_to_solve;
+}
+
+// Awareness class and invalid-date flag as one number (-1 = not scored)
+export function awarenessCode(className, invalidDate) {
+  return AWARENESS_CLASSES.indexOf(className) * 2 + (invalidDate ? 1 : 0);
+}
+
+// Score a batch: rows whose class differs from current, and every row's
+// next transition time
+export function scoreAwarenessBatch(problems, current) {
+  const changes = [];
+  const due = [];
+  problems.forEach((problem, i) => {
+    const result = calculateAwarenessScore(problem);
+    const code = awarenessCode(getAwarenessClass(result.score), result.invalidDate);
+    if (code !== current[i]) changes.push([i, code]);
+    due.push(getNextAwarenessTransition(problem, result.score));
+  });
+  return { changes, due };
+}
@@ -0,0 +1,98 @@
+/**
+ * Unit Tests for Awareness Scoring Worker Tasks
+ */
+
+import {
+  AWARENESS_CLASSES,
+  compactScoringProblem,
+  scoringSnapshotMatches,
+  awarenessCode,
+  scoreAwarenessBatch
+} from './scoring.js';
+import { setMockProblemData, resetConfig } from './awareness.js';
+import { rankUrgentProblems } from './urgent-review.js';
+
+const DAY_MS = 86400000;
+const solvedAgo = days => new Date(Date.now() - days * DAY_MS).toISOString();
+const problem = (days, overrides = {}) => ({
+  name: 'P', solved: true, difficulty: 'Medium', time_to_solve: '', solved_date: solvedAgo(days), ...overrides
+});
+
+beforeEach(() => {
+  resetConfig();
+  setMockProblemData({ file_list: ['list1'], data: { list1: [] } });
+});
+
+describe('compactScoringProblem', () => {
+  test('keeps only the fields scoring reads', () => {
+    const compact = compactScoringProblem({ ...problem(1), name: 'Two Sum', comments: 'x', link: 'y', top_time: '10' });
+    expect(Object.keys(compact).sort()).toEqual([
+      'advanced_time', 'difficulty', 'intermediate_time', 'solved', 'solved_date', 'time_to_solve', 'top_time'
+    ]);
+    expect(compact.top_time).toBe('10');
+  });
+});
+
+describe('scoringSnapshotMatches', () => {
+  test('detects edits to scored user fields', () => {
+    const p = problem(1, { time_to_solve: '20' });
+    const snapshot = compactScoringProblem(p);
+    expect(scoringSnapshotMatches(snapshot, p)).toBe(true);
+    expect(scoringSnapshotMatches(snapshot, { ...p, time_to_solve: '25' })).toBe(false);
+    expect(scoringSnapshotMatches(snapshot, { ...p, solved: false })).toBe(false);
+    expect(scoringSnapshotMatches(snapshot, undefined)).toBe(false);
+  });
+});
+
+describe('awarenessCode', () => {
+  test('packs the class and invalid-date flag', () => {
+    expect(awarenessCode('awareness-white', false)).toBe(0);
+    expect(awarenessCode('awareness-green', true)).toBe(3);
+    const code = awarenessCode('unsolved-problem', true);
+    expect(AWARENESS_CLASSES[code >> 1]).toBe('unsolved-problem');
+    expect(code & 1).toBe(1);
+  });
+});
+
+describe('scoreAwarenessBatch', () => {
+  test('returns only rows whose class changed', () => {
+    const problems = [problem(1), problem(60), { name: 'U', solved: false }];
+    const first = scoreAwarenessBatch(problems, [-1, -1, -1]);
+    expect(first.changes.map(change => change[0])).toEqual([0, 1, 2]);
+
+    const current = [-1, -1, -1];
+    first.changes.forEach(([i, code]) => { current[i] = code; });
+    expect(scoreAwarenessBatch(problems, current).changes).toEqual([]);
+
+    current[1] = awarenessCode('awareness-white', false);
+    expect(scoreAwarenessBatch(problems, current).changes.map(change => change[0])).toEqual([1]);
+  });
+
+  test('returns each row\'s next transition time', () => {
+    const { due } = scoreAwarenessBatch([problem(1), { name: 'U', solved: false }], [-1, -1]);
+    expect(due[0]).toBeGreaterThan(Date.now());
+    expect(due[1]).toBe(Infinity);
+  });
+
+  test('flags invalid dates', () => {
+    const { changes } = scoreAwarenessBatch([problem(0, { solved_date: 'not-a-date' })], [-1]);
+    expect(changes).toEqual([[0, awarenessCode('unsolved-problem', true)]]);
+  });
+});
+
+describe('rankUrgentProblems', () => {
+  test('returns null without solved problems', () => {
+    expect(rankUrgentProblems([{ solved: false }])).toBeNull();
+  });
+
+  test('ranks the most urgent class and the soonest to flash', () => {
+    const ranking = rankUrgentProblems([problem(2), problem(25), { solved: false }, problem(3)]);
+    expect(ranking.indices).toEqual([1]);
+    expect(ranking.globalMinDays).toBeGreaterThan(0);
+  });
+
+  test('handles large lists without spreading into Math.max', () => {
+    const problems = Array.from({ length: 200000 }, (_, i) => problem(1 + (i % 30)));
+    expect(rankUrgentProblems(problems).indices.length).toBeGreaterThan(0);
+  });
+});
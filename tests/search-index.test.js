@@ -0,0 +1,221 @@
+/**
+ * Unit Tests for the Search Index
+ */
+
+import {
+  SEARCH_MATCH_SCORES,
+  createSearchIndex,
+  tokenizeSearchText,
+  searchTrigrams,
+  setSearchField,
+  indexSearchProblem,
+  boundedEditDistance,
+  searchFieldWeight,
+  tokensWithPrefix,
+  matchSearchTerm,
+  searchSubstringCandidates,
+  searchProblemIndex
+} from './search-index.js';
+
+const problems = [
+  { id: 'two-sum', name: 'Two Sum', pattern: 'Arrays', comments: '' },
+  { id: '3sum', name: '3Sum', pattern: 'Two Pointers', comments: 'sort first' },
+  { id: 'valid-parentheses', name: 'Valid Parentheses', pattern: 'Stack', comments: '' },
+  { id: 'binary-search', name: 'Binary Search', pattern: 'Binary Search', comments: '' },
+  { id: 'course-schedule', name: 'Course Schedule', pattern: 'Graphs', comments: 'topological sort with kahn' }
+];
+
+function buildIndex(list = problems) {
+  const index = createSearchIndex();
+  list.forEach(problem => indexSearchProblem(index, problem));
+  return index;
+}
+
+const ids = hits => hits.map(hit => hit.id);
+
+describe('tokenizeSearchText', () => {
+  test('lowercases words and splits letter and digit runs', () => {
+    expect(tokenizeSearchText('3Sum Closest')).toEqual(['3sum', '3', 'sum', 'closest']);
+  });
+
+  test('drops punctuation and duplicates', () => {
+    expect(tokenizeSearchText("Two-Sum, two sum!")).toEqual(['two', 'sum']);
+  });
+
+  test('handles empty and missing text', () => {
+    expect(tokenizeSearchText('')).toEqual([]);
+    expect(tokenizeSearchText(undefined)).toEqual([]);
+  });
+});
+
+describe('searchTrigrams', () => {
+  test('lists overlapping trigrams', () => {
+    expect(searchTrigrams('graph')).toEqual(['gra', 'rap', 'aph']);
+    expect(searchTrigrams('ab')).toEqual([]);
+  });
+});
+
+describe('boundedEditDistance', () => {
+  test('computes small distances', () => {
+    expect(boundedEditDistance('graph', 'graph', 1)).toBe(0);
+    expect(boundedEditDistance('grpah', 'graph', 2)).toBe(2);
+    expect(boundedEditDistance('stak', 'stack', 1)).toBe(1);
+  });
+
+  test('stops once the limit is exceeded', () => {
+    expect(boundedEditDistance('stack', 'queue', 1)).toBe(2);
+    expect(boundedEditDistance('a', 'abcd', 1)).toBe(2);
+  });
+});
+
+describe('searchFieldWeight', () => {
+  test('uses the most important field', () => {
+    expect(searchFieldWeight(1 | 4)).toBe(3);
+    expect(searchFieldWeight(2 | 4)).toBe(2);
+    expect(searchFieldWeight(4)).toBe(1);
+  });
+});
+
+describe('indexSearchProblem', () => {
+  test('keeps one document per problem and collects list patterns', () => {
+    const index = buildIndex([
+      { id: 'two-sum', name: 'Two Sum', pattern: 'Arrays', comments: '' },
+      { id: 'two-sum', name: 'Two Sum', pattern: 'Hash Map', comments: '' },
+      { id: 'two-sum', name: 'Two Sum', pattern: 'Arrays', comments: '' }
+    ]);
+    expect(index.docs.size).toBe(1);
+    expect(index.docs.get('two-sum').patterns).toEqual(['Arrays', 'Hash Map']);
+    expect(ids(searchProblemIndex(index, 'hash'))).toEqual(['two-sum']);
+  });
+
+  test('collects the lists containing each problem once', () => {
+    const index = createSearchIndex();
+    indexSearchProblem(index, problems[0], 'blind75');
+    indexSearchProblem(index, problems[0], 'neetcode150');
+    indexSearchProblem(index, problems[0], 'blind75');
+    indexSearchProblem(index, problems[1], 'neetcode150');
+    expect(index.docs.get('two-sum').lists).toEqual(['blind75', 'neetcode150']);
+    expect(index.docs.get('3sum').lists).toEqual(['neetcode150']);
+    expect(index.docs.get('two-sum').difficulty).toBeUndefined();
+  });
+});
+
+describe('tokensWithPrefix', () => {
+  test('finds tokens in sorted order', () => {
+    const index = buildIndex();
+    expect(tokensWithPrefix(index, 'so')).toEqual(['sort']);
+    expect(tokensWithPrefix(index, 'sc')).toEqual(['schedule']);
+    expect(tokensWithPrefix(index, 'zz')).toEqual([]);
+  });
+});
+
+describe('matchSearchTerm', () => {
+  test('scores exact, prefix, substring and fuzzy matches', () => {
+    const index = buildIndex();
+    expect(matchSearchTerm(index, 'stack').get('stack')).toBe(SEARCH_MATCH_SCORES.exact);
+    expect(matchSearchTerm(index, 'pare').get('parentheses')).toBe(SEARCH_MATCH_SCORES.prefix);
+    expect(matchSearchTerm(index, 'theses').get('parentheses')).toBe(SEARCH_MATCH_SCORES.substring);
+    expect(matchSearchTerm(index, 'grphs').get('graphs')).toBe(SEARCH_MATCH_SCORES.fuzzy);
+  });
+
+  test('does not fuzzy match short terms', () => {
+    const index = buildIndex();
+    expect(matchSearchTerm(index, 'twx').size).toBe(0);
+  });
+});
+
+describe('searchSubstringCandidates', () => {
+  test('includes every problem whose text contains the search', () => {
+    const index = buildIndex();
+    problems.forEach(problem => {
+      [problem.name, problem.pattern, problem.comments].forEach(text => {
+        const lower = text.toLowerCase();
+        for (let start = 0; start + 3 <= lower.length; start++) {
+          const search = lower.slice(start, start + 5);
+          const candidates = searchSubstringCandidates(index, search);
+          if (candidates) expect(candidates.has(problem.id)).toBe(true);
+        }
+      });
+    });
+  });
+
+  test('narrows by the longest letter or digit run', () => {
+    const index = buildIndex();
+    expect(Array.from(searchSubstringCandidates(index, 'nar')).sort()).toEqual(['binary-search']);
+    expect(Array.from(searchSubstringCandidates(index, 'o sort')).sort()).toEqual(['3sum', 'course-schedule']);
+    expect(searchSubstringCandidates(index, 'xyz').size).toBe(0);
+  });
+
+  test('returns null when no run is long enough', () => {
+    const index = buildIndex();
+    expect(searchSubstringCandidates(index, 'su')).toBeNull();
+    expect(searchSubstringCandidates(index, '(x, n)')).toBeNull();
+  });
+});
+
+describe('searchProblemIndex', () => {
+  test('returns nothing for an empty query', () => {
+    expect(searchProblemIndex(buildIndex(), '  ')).toEqual([]);
+  });
+
+  test('matches names, patterns and comments', () => {
+    const index = buildIndex();
+    expect(ids(searchProblemIndex(index, 'kahn'))).toEqual(['course-schedule']);
+    expect(ids(searchProblemIndex(index, 'graphs'))).toEqual(['course-schedule']);
+    expect(ids(searchProblemIndex(index, 'sum'))).toEqual(['3sum', 'two-sum']);
+  });
+
+  test('requires every term to match', () => {
+    const index = buildIndex();
+    expect(ids(searchProblemIndex(index, 'two sum'))).toEqual(['two-sum', '3sum']);
+    expect(ids(searchProblemIndex(index, 'two stack'))).toEqual([]);
+  });
+
+  test('ranks name matches above pattern and comment matches', () => {
+    const index = buildIndex();
+    const search = searchProblemIndex(index, 'search');
+    expect(search[0].id).toBe('binary-search');
+    expect(search[0].score).toBe(3);
+  });
+
+  test('ranks exact matches above fuzzy ones', () => {
+    const index = buildIndex([
+      { id: 'a', name: 'Graph Valid Tree', pattern: 'Graphs', comments: '' },
+      { id: 'b', name: 'Grape Picking', pattern: 'Greedy', comments: '' }
+    ]);
+    expect(ids(searchProblemIndex(index, 'graph'))).toEqual(['a', 'b']);
+  });
+
+  test('sorts equal scores by name length, then name', () => {
+    const index = buildIndex([
+      { id: 'b', name: 'Beta Tree', pattern: '', comments: '' },
+      { id: 'a', name: 'Alfa Tree', pattern: '', comments: '' },
+      { id: 'c', name: 'Tree', pattern: '', comments: '' }
+    ]);
+    expect(ids(searchProblemIndex(index, 'tree'))).toEqual(['c', 'a', 'b']);
+  });
+});
+
+describe('setSearchField', () => {
+  test('re-indexes changed comments', () => {
+    const index = buildIndex();
+    const doc = index.docs.get('two-sum');
+    setSearchField(index, doc, 'comments', 'hashmap trick');
+    expect(ids(searchProblemIndex(index, 'hashmap'))).toEqual(['two-sum']);
+
+    setSearchField(index, doc, 'comments', 'complement lookup');
+    expect(ids(searchProblemIndex(index, 'hashmap'))).toEqual([]);
+    expect(index.postings.has('hashmap')).toBe(false);
+    expect(tokensWithPrefix(index, 'hash')).toEqual([]);
+    expect(ids(searchProblemIndex(index, 'complement'))).toEqual(['two-sum']);
+  });
+
+  test('keeps a token that is still used by another field or problem', () => {
+    const index = buildIndex();
+    const doc = index.docs.get('3sum');
+    setSearchField(index, doc, 'comments', 'sum twice');
+    setSearchField(index, doc, 'comments', '');
+    expect(ids(searchProblemIndex(index, 'sum'))).toEqual(['3sum', 'two-sum']);
+    expect(ids(searchProblemIndex(index, 'sort'))).toEqual(['course-schedule']);
+  });
+});
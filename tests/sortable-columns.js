@@ -3,7 +3,7 @@
  *
  * SYNCHRONIZATION REQUIREMENT:
  * These functions mirror the JavaScript code generated by js_core_generator.py
- * (the sortable columns feature). When modifying the sort functions there,
+ * (the sortable columns feature, including the sort key and order cache). When modifying the sort functions there,
  * update this file to keep them in sync.
  * After changes, verify with: npm test
  */
@@ -16,6 +16,7 @@ let _localStorage = null;
 
 export function setMockProblemData(data) {
   _problemData = data;
+  _sortCache = {};
 }
 
 export function setMockLocalStorage(ls) {
@@ -33,6 +34,7 @@ export function getSortStateSnapshot() {
 export function resetState() {
   _problemData = { file_list: [], data: {} };
   _sortState = {};
+  _sortCache = {};
   _localStorage = null;
 }
 
@@ -74,40 +76,100 @@ export function getSortValue(problem, column) {
   }
 }
 
-// ── getSortedProblems ─────────────────────────────────────────────────────────
+// ── Sort keys and cached orders ───────────────────────────────────────────────
+
+// Columns whose values the user edits
+export const SORT_USER_COLUMNS = ['time_to_solve', 'solved_date'];
+
+// fileKey -> { problems, length, keys: { column: [key] }, orders: { 'column:direction': [idx] } }
+let _sortCache = {};
+
+export function computeSortKeys(problems, column) {
+  return problems.map(problem => getSortValue(problem, column));
+}
 
 /**
- * Returns a sorted copy of the problems for a given fileKey.
- * Sort order is determined by the current sortState for that fileKey.
- * If no sort is active (direction 'none' or no state), returns original order.
+ * Problem indexes ordered by precomputed keys.
+ * Null keys always sort last; ties keep list order.
  *
- * Null/empty values always sort last regardless of direction.
+ * @param {Array<number|string|null>} keys
+ * @param {'asc'|'desc'} direction
+ * @returns {number[]}
+ */
+export function sortIndexesByKeys(keys, direction) {
+  const asc = direction === 'asc' ? 1 : -1;
+  const indexes = keys.map((key, idx) => idx);
+  return indexes.sort((a, b) => {
+    const va = keys[a];
+    const vb = keys[b];
+    if (va === null || vb === null) {
+      if (va !== vb) return va === null ? 1 : -1;
+      return a - b;
+    }
+    if (va < vb) return -asc;
+    if (va > vb) return asc;
+    return a - b;
+  });
+}
+
+function getSortCache(fileKey) {
+  const problems = _problemData.data[fileKey];
+  const cache = _sortCache[fileKey];
+  if (cache && cache.problems === problems && cache.length === problems.length) return cache;
+  _sortCache[fileKey] = { problems, length: problems.length, keys: {}, orders: {} };
+  return _sortCache[fileKey];
+}
+
+export function resetSortCache(fileKey) {
+  delete _sortCache[fileKey];
+}
+
+/**
+ * Drops the keys and orders of an edited column.
+ * @param {string} field
+ */
+export function invalidateSortColumn(field) {
+  if (!SORT_USER_COLUMNS.includes(field)) return;
+  Object.keys(_sortCache).forEach(fileKey => {
+    const cache = _sortCache[fileKey];
+    delete cache.keys[field];
+    delete cache.orders[`${field}:asc`];
+    delete cache.orders[`${field}:desc`];
+  });
+}
+
+/**
+ * Problem indexes of a fileKey in its current sort order.
+ * If no sort is active (direction 'none' or no state), returns list order.
  *
  * @param {string} fileKey
- * @returns {Object[]}
+ * @returns {number[]}
  */
-export function getSortedProblems(fileKey) {
-  const problems = (_problemData.data[fileKey] || []).slice();
+export function getSortedOrder(fileKey) {
+  const problems = _problemData.data[fileKey] || [];
   const state = _sortState[fileKey];
-  if (!state || !state.column || state.direction === 'none') {
-    return problems;
-  }
+  if (!state || !state.column || state.direction === 'none') return problems.map((problem, idx) => idx);
 
   const { column, direction } = state;
-  const asc = direction === 'asc' ? 1 : -1;
-
-  return problems.sort((a, b) => {
-    const va = getSortValue(a, column);
-    const vb = getSortValue(b, column);
-
-    if (va === null && vb === null) return 0;
-    if (va === null) return 1;
-    if (vb === null) return -1;
+  const cache = getSortCache(fileKey);
+  const orderKey = `${column}:${direction}`;
+  if (!cache.orders[orderKey]) {
+    if (!cache.keys[column]) cache.keys[column] = computeSortKeys(problems, column);
+    cache.orders[orderKey] = sortIndexesByKeys(cache.keys[column], direction);
+  }
+  return cache.orders[orderKey];
+}
 
-    if (va < vb) return -1 * asc;
-    if (va > vb) return 1 * asc;
-    return 0;
-  });
+/**
+ * Returns the problems of a fileKey in sorted order (test helper over
+ * getSortedOrder). Null/empty values always sort last regardless of direction.
+ *
+ * @param {string} fileKey
+ * @returns {Object[]}
+ */
+export function getSortedProblems(fileKey) {
+  const problems = _problemData.data[fileKey] || [];
+  return getSortedOrder(fileKey).map(idx => problems[idx]);
 }
 
 // ── Sort state cycling ────────────────────────────────────────────────────────
@@ -5,6 +5,10 @@
 import {
   getSortValue,
   getSortedProblems,
+  getSortedOrder,
+  sortIndexesByKeys,
+  invalidateSortColumn,
+  resetSortCache,
   cycleSortState,
   saveSortState,
   restoreSortState,
@@ -580,3 +584,70 @@ describe('initSortHeaders', () => {
     expect(getSortStateSnapshot().test.direction).toBe('none');
   });
 });
+
+// ── Sort keys and cached orders ───────────────────────────────────────────────
+
+describe('sortIndexesByKeys', () => {
+  it('puts null keys last in both directions', () => {
+    const keys = [3, null, 1, null, 2];
+    expect(sortIndexesByKeys(keys, 'asc')).toEqual([2, 4, 0, 1, 3]);
+    expect(sortIndexesByKeys(keys, 'desc')).toEqual([0, 4, 2, 1, 3]);
+  });
+
+  it('keeps list order for equal keys in both directions', () => {
+    const keys = ['b', 'a', 'b', 'a'];
+    expect(sortIndexesByKeys(keys, 'asc')).toEqual([1, 3, 0, 2]);
+    expect(sortIndexesByKeys(keys, 'desc')).toEqual([0, 2, 1, 3]);
+  });
+});
+
+describe('getSortedOrder', () => {
+  let problems;
+
+  beforeEach(() => {
+    problems = [
+      { name: 'B', time_to_solve: '20' },
+      { name: 'A', time_to_solve: '' },
+      { name: 'C', time_to_solve: '5' }
+    ];
+    setMockProblemData({ file_list: ['test'], data: { test: problems } });
+  });
+
+  it('returns list order without an active sort', () => {
+    expect(getSortedOrder('test')).toEqual([0, 1, 2]);
+  });
+
+  it('reuses the cached order for the same column and direction', () => {
+    setSortState({ test: { column: 'time_to_solve', direction: 'asc' } });
+    const first = getSortedOrder('test');
+    expect(first).toEqual([2, 0, 1]);
+    problems[1].time_to_solve = '1';
+    expect(getSortedOrder('test')).toBe(first);
+  });
+
+  it('recomputes an edited column once invalidated', () => {
+    setSortState({ test: { column: 'time_to_solve', direction: 'asc' } });
+    getSortedOrder('test');
+    problems[1].time_to_solve = '1';
+    invalidateSortColumn('time_to_solve');
+    expect(getSortedOrder('test')).toEqual([1, 2, 0]);
+  });
+
+  it('keeps other columns when a user column is invalidated', () => {
+    setSortState({ test: { column: 'name', direction: 'asc' } });
+    const byName = getSortedOrder('test');
+    invalidateSortColumn('time_to_solve');
+    invalidateSortColumn('comments');
+    expect(getSortedOrder('test')).toBe(byName);
+    resetSortCache('test');
+    expect(getSortedOrder('test')).not.toBe(byName);
+    expect(getSortedOrder('test')).toEqual([1, 0, 2]);
+  });
+
+  it('recomputes when the list grows', () => {
+    setSortState({ test: { column: 'name', direction: 'desc' } });
+    expect(getSortedOrder('test')).toEqual([2, 0, 1]);
+    problems.push({ name: 'D' });
+    expect(getSortedOrder('test')).toEqual([3, 2, 0, 1]);
+  });
+});
@@ -3,7 +3,8 @@
  *
  * SYNCHRONIZATION REQUIREMENT:
  * These functions mirror the JavaScript code generated by js_core_generator.py
- * (calculateDaysUntilFlashing, applyUrgentReviewFilter, updateUrgentBtnState).
+ * (calculateDaysUntilFlashing, applyUrgentReviewFilter, updateUrgentBtnState)
+ * and js_scoring_generator.py (rankUrgentProblems, URGENT_TIER_RANK).
  * When modifying those functions, update this file to keep them in sync.
  * After changes, verify with: npm test
  */
@@ -11,16 +12,16 @@
 import {
   calculateAwarenessScore,
   getAwarenessClass,
-  getCommitmentFactor,
-  getTierDifficultyMultiplier,
-  getSolvedFactor,
+  getAwarenessDailyRate,
   getConfig,
   setMockProblemData as setAwarenessMockData,
   resetConfig,
   setConfig
 } from './awareness.js';
 
-export const TIER_RANK = { 'awareness-flashing': 5, 'awareness-dark-red': 4, 'awareness-red': 3, 'awareness-yellow': 2, 'awareness-green': 1, 'awareness-white': 0, 'unsolved-problem': -1 };
+export const URGENT_TIER_RANK = { 'awareness-flashing': 5, 'awareness-dark-red': 4, 'awareness-red': 3, 'awareness-yellow': 2, 'awareness-green': 1, 'awareness-white': 0, 'unsolved-problem': -1 };
+// Name this module exported before the ranking moved to js_scoring_generator.py
+export const TIER_RANK = URGENT_TIER_RANK;
 
 // ── Injectable state for testing ─────────────────────────────────────────────
 
@@ -45,23 +46,53 @@ export { setConfig, getConfig };
  * Compute how many days (ceiling) until this problem reaches the darkRed threshold.
  *
  * @param {Object} problem
+ * @param {Object} [result] - The problem's awareness result, if already computed
  * @returns {number} Infinity | 0 | positive integer (Math.ceil)
  */
-export function calculateDaysUntilFlashing(problem) {
+export function calculateDaysUntilFlashing(problem, result = calculateAwarenessScore(problem)) {
   if (!problem.solved) return Infinity;
-  const result = calculateAwarenessScore(problem);
   if (result.score < 0) return Infinity;
   const config = getConfig();
   if (result.score >= config.thresholds.darkRed) return 0;
-  const commitmentFactor = getCommitmentFactor();
-  const tierDiffMultiplier = getTierDifficultyMultiplier(problem);
-  const solvedFactor = getSolvedFactor(problem);
-  const dailyRate = config.baseRate * commitmentFactor * tierDiffMultiplier / solvedFactor;
+  const dailyRate = getAwarenessDailyRate(problem);
   if (dailyRate <= 0) return Infinity;
   const daysNeeded = (config.thresholds.darkRed - result.score) / dailyRate;
   return Math.ceil(daysNeeded);
 }
 
+// ── rankUrgentProblems ────────────────────────────────────────────────────────
+
+/**
+ * Urgent-review ranking (mirrors rankUrgentProblems() in js_scoring_generator.py):
+ * solved problems in the most urgent class, plus those that start flashing soonest.
+ *
+ * @param {Array} problems
+ * @param {Function} [calculateAwarenessScoreFn] - Injectable calculateAwarenessScore for testing
+ * @param {Function} [getAwarenessClassFn] - Injectable getAwarenessClass for testing
+ * @returns {{ indices: number[], globalMinDays: number }|null} null if no solved problems
+ */
+export function rankUrgentProblems(problems, calculateAwarenessScoreFn = calculateAwarenessScore, getAwarenessClassFn = getAwarenessClass) {
+  let maxTier = -Infinity;
+  let globalMinDays = Infinity;
+  const solvedProblems = [];
+  problems.forEach((problem, idx) => {
+    const scoreResult = calculateAwarenessScoreFn(problem);
+    const days = calculateDaysUntilFlashing(problem, scoreResult);
+    if (days === Infinity) return;
+    const tier = URGENT_TIER_RANK[getAwarenessClassFn(scoreResult.score)] || 0;
+    solvedProblems.push({ idx, days, tier });
+    maxTier = Math.max(maxTier, tier);
+    globalMinDays = Math.min(globalMinDays, days);
+  });
+
+  if (solvedProblems.length === 0) return null;
+
+  const indices = solvedProblems
+    .filter(item => item.tier === maxTier || item.days === globalMinDays)
+    .map(item => item.idx);
+  return { indices, globalMinDays };
+}
+
 // ── applyUrgentReviewFilter ───────────────────────────────────────────────────
 
 /**
@@ -79,26 +110,15 @@ export function calculateDaysUntilFlashing(problem) {
  * @returns {{ globalMinDays: number, urgentIndices: Set<number> }|null} null if no solved problems
  */
 export function applyUrgentReviewFilter(fileKey, { problems, rows, statusEl, getAwarenessClassFn, calculateAwarenessScoreFn }) {
-  const _getAwarenessClass = getAwarenessClassFn || getAwarenessClass;
-  const _calculateAwarenessScore = calculateAwarenessScoreFn || calculateAwarenessScore;
-
-  const solvedProblems = problems
-    .map((problem, idx) => {
-      const days = calculateDaysUntilFlashing(problem);
-      if (days === Infinity) return null;
-      const scoreResult = _calculateAwarenessScore(problem);
-      const tier = TIER_RANK[_getAwarenessClass(scoreResult.score)] || 0;
-      return { idx, days, tier };
-    })
-    .filter(item => item !== null);
-
-  if (solvedProblems.length === 0) return null;
-
-  const maxTier = Math.max(...solvedProblems.map(item => item.tier));
-  const globalMinDays = Math.min(...solvedProblems.map(item => item.days));
-  const urgentIndices = new Set(
-    solvedProblems.filter(item => item.tier === maxTier || item.days === globalMinDays).map(item => item.idx)
+  const ranking = rankUrgentProblems(
+    problems,
+    calculateAwarenessScoreFn || calculateAwarenessScore,
+    getAwarenessClassFn || getAwarenessClass
   );
+  if (!ranking) return null;
+
+  const globalMinDays = ranking.globalMinDays;
+  const urgentIndices = new Set(ranking.indices);
 
   rows.forEach(row => {
     const idx = parseInt(row.dataset.index, 10);
@@ -0,0 +1,37 @@
+/**
+ * Virtualized Table Window Calculation (Extracted for Testing)
+ *
+ * SYNCHRONIZATION REQUIREMENT:
+ * These functions mirror the JavaScript code generated by js_virtual_table_generator.py
+ * (VIRTUAL_TABLE_CONFIG and computeVirtualRange).
+ * When modifying those, update this file to keep them in sync.
+ * After changes, verify with: npm test
+ */
+
+export const VIRTUAL_TABLE_CONFIG = {
+  minRows: 100,          // Lists with at most this many visible rows render every row
+  overscan: 10,          // Extra rows rendered above and below the viewport
+  defaultRowHeight: 56   // Row height estimate (px) until a rendered row is measured
+};
+
+/**
+ * Range [start, end) of visible positions to render for a scroll offset
+ * measured from the top of the table body.
+ *
+ * @param {number} count - Number of visible (filtered) rows
+ * @param {number} scrollOffset - Pixels of the table body above the viewport top
+ * @param {number} viewportHeight
+ * @param {number} rowHeight
+ * @param {{minRows: number, overscan: number}} config
+ * @returns {{start: number, end: number}}
+ */
+export function computeVirtualRange(count, scrollOffset, viewportHeight, rowHeight, config) {
+  if (count <= config.minRows) return { start: 0, end: count };
+  const offset = Math.max(0, scrollOffset);
+  const first = Math.min(count, Math.floor(offset / rowHeight));
+  const last = Math.min(count, Math.ceil((offset + viewportHeight) / rowHeight));
+  return {
+    start: Math.max(0, first - config.overscan),
+    end: Math.min(count, last + config.overscan)
+  };
+}
@@ -0,0 +1,50 @@
+/**
+ * Unit Tests for Virtualized Table Window Calculation
+ */
+
+import { VIRTUAL_TABLE_CONFIG, computeVirtualRange } from './virtual-table.js';
+
+const config = { minRows: 100, overscan: 10 };
+
+describe('computeVirtualRange', () => {
+  test('renders every row of small lists', () => {
+    expect(computeVirtualRange(75, 5000, 800, 50, config)).toEqual({ start: 0, end: 75 });
+    expect(computeVirtualRange(100, 0, 800, 50, config)).toEqual({ start: 0, end: 100 });
+  });
+
+  test('renders the viewport plus overscan at the top of the table', () => {
+    expect(computeVirtualRange(1000, 0, 800, 50, config)).toEqual({ start: 0, end: 26 });
+  });
+
+  test('treats a table below the viewport top like an unscrolled one', () => {
+    expect(computeVirtualRange(1000, -300, 800, 50, config)).toEqual({ start: 0, end: 26 });
+  });
+
+  test('follows the scroll offset in the middle of the list', () => {
+    expect(computeVirtualRange(1000, 25000, 800, 50, config)).toEqual({ start: 490, end: 526 });
+  });
+
+  test('clamps the window at the end of the list', () => {
+    expect(computeVirtualRange(1000, 49800, 800, 50, config)).toEqual({ start: 986, end: 1000 });
+  });
+
+  test('keeps a window when scrolled past the table', () => {
+    expect(computeVirtualRange(1000, 90000, 800, 50, config)).toEqual({ start: 990, end: 1000 });
+  });
+
+  test('window size does not grow with list size', () => {
+    const small = computeVirtualRange(1000, 20000, 800, 50, config);
+    const large = computeVirtualRange(100000, 20000, 800, 50, config);
+
+    expect(large).toEqual(small);
+  });
+
+  test('default config virtualizes lists above the threshold', () => {
+    const { start, end } = computeVirtualRange(
+      909, 0, 800, VIRTUAL_TABLE_CONFIG.defaultRowHeight, VIRTUAL_TABLE_CONFIG
+    );
+
+    expect(start).toBe(0);
+    expect(end).toBeLessThan(909);
+  });
+});
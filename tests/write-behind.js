@@ -0,0 +1,47 @@
+/**
+ * Write-Behind Persistence (Extracted for Testing)
+ *
+ * SYNCHRONIZATION REQUIREMENT:
+ * This function mirrors createWriteBehind() generated by js_core_generator.py.
+ * When modifying it, update this file to keep them in sync.
+ * After changes, verify with: npm test
+ */
+
+// Coalesce writes: markDirty() schedules a single write, flush() performs
+// a pending write now and discard() drops it
+export function createWriteBehind(write, schedule, cancel) {
+  let dirty = false;
+  let handle = null;
+
+  function cancelScheduled() {
+    if (handle === null) return;
+    cancel(handle);
+    handle = null;
+  }
+
+  function flush() {
+    cancelScheduled();
+    if (!dirty) return false;
+    dirty = false;
+    write();
+    return true;
+  }
+
+  return {
+    markDirty() {
+      dirty = true;
+      if (handle === null) {
+        handle = schedule(() => {
+          handle = null;
+          flush();
+        });
+      }
+    },
+    flush,
+    discard() {
+      dirty = false;
+      cancelScheduled();
+    },
+    isDirty: () => dirty
+  };
+}
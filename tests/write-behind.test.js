@@ -0,0 +1,84 @@
+/**
+ * Unit Tests for Write-Behind Persistence
+ */
+
+import { createWriteBehind } from './write-behind.js';
+
+// Scheduler that runs callbacks only when the test says so
+function makeScheduler() {
+  const tasks = new Map();
+  let nextId = 1;
+  return {
+    schedule: callback => {
+      const id = nextId++;
+      tasks.set(id, callback);
+      return id;
+    },
+    cancel: id => { tasks.delete(id); },
+    runAll: () => {
+      const pending = Array.from(tasks.values());
+      tasks.clear();
+      pending.forEach(callback => callback());
+    },
+    get size() { return tasks.size; }
+  };
+}
+
+function setup() {
+  const scheduler = makeScheduler();
+  const writes = [];
+  const writer = createWriteBehind(() => writes.push(writes.length + 1), scheduler.schedule, scheduler.cancel);
+  return { scheduler, writes, writer };
+}
+
+describe('createWriteBehind', () => {
+  test('coalesces many changes into one scheduled write', () => {
+    const { scheduler, writes, writer } = setup();
+
+    for (let i = 0; i < 200; i++) writer.markDirty();
+    expect(scheduler.size).toBe(1);
+    expect(writes).toHaveLength(0);
+    expect(writer.isDirty()).toBe(true);
+
+    scheduler.runAll();
+    expect(writes).toHaveLength(1);
+    expect(writer.isDirty()).toBe(false);
+  });
+
+  test('schedules again after a write', () => {
+    const { scheduler, writes, writer } = setup();
+
+    writer.markDirty();
+    scheduler.runAll();
+    writer.markDirty();
+    expect(scheduler.size).toBe(1);
+    scheduler.runAll();
+    expect(writes).toHaveLength(2);
+  });
+
+  test('flush writes pending changes immediately and cancels the scheduled write', () => {
+    const { scheduler, writes, writer } = setup();
+
+    writer.markDirty();
+    expect(writer.flush()).toBe(true);
+    expect(writes).toHaveLength(1);
+    expect(scheduler.size).toBe(0);
+  });
+
+  test('flush does nothing without pending changes', () => {
+    const { writes, writer } = setup();
+
+    expect(writer.flush()).toBe(false);
+    expect(writes).toHaveLength(0);
+  });
+
+  test('discard drops pending changes', () => {
+    const { scheduler, writes, writer } = setup();
+
+    writer.markDirty();
+    writer.discard();
+    expect(scheduler.size).toBe(0);
+    expect(writer.flush()).toBe(false);
+    expect(writes).toHaveLength(0);
+  });
+});
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Watch Mode
+Polls raw/*.tsv, the generator modules and their helpers and rebuilds tracker.html on change
+"""
+
+import importlib
+import sys
+import time
+from pathlib import Path
+
+import build_tracker
+import data_parser
+from exceptions import GeneratorError, GrindPulseError
+
+POLL_INTERVAL = 0.25  # seconds between polls; keeps edit-to-rebuild well under 1s
+
+# Helper modules outside the generators -> modules that import from them, which
+# must be reloaded after the helper so they pick up its new functions
+HELPER_DEPENDENTS = {
+    "build_cache": ("data_parser",),
+    "data_payload": ("js_data_generator",),
+}
+
+
+def snapshot(paths) -> dict[str, tuple[int, int]]:
+    """Return {path: (size, mtime_ns)} for each path that exists."""
+    state = {}
+    for path in paths:
+        try:
+            stat = Path(path).stat()
+        except OSError:
+            continue
+        state[str(path)] = (stat.st_size, stat.st_mtime_ns)
+    return state
+
+
+def changed_paths(old: dict, new: dict) -> list[str]:
+    """Return paths added, removed or modified between two snapshots."""
+    return sorted(path for path in old.keys() | new.keys() if old.get(path) != new.get(path))
+
+
+class TrackerWatcher:
+    """Rebuild tracker.html from in-memory state as its inputs change.
+
+    Parsed data and its manifest stay in memory between rebuilds, so a TSV
+    edit re-parses only the changed files and a generator edit reloads only
+    that module. The build cache then regenerates only the affected
+    components. Errors are reported and the watcher keeps polling.
+    """
+
+    def __init__(self, base_dir: Path, workers: int = 1, use_cache: bool = True) -> None:
+        self.base_dir = Path(base_dir)
+        self.raw_dir = self.base_dir / "raw"
+        self.output_path = self.base_dir / "parsed_data.json"
+        self.workers = workers
+        self.use_cache = use_cache
+        self.parsed_data = None
+        self.manifest = None
+        self.broken_modules: set[str] = set()
+        self.tsv_state: dict = {}
+        self.generator_state: dict = {}
+        self.config_state: dict = {}
+
+    def _snapshots(self) -> tuple[dict, dict, dict]:
+        return (
+            snapshot(self.raw_dir.glob("*.tsv")),
+            snapshot(
+                [
+                    *self.base_dir.glob("*_generator.py"),
+                    *(self.base_dir / f"{name}.py" for name in HELPER_DEPENDENTS),
+                ]
+            ),
+            snapshot([self.base_dir / "firebase_config.json"]),
+        )
+
+    def start(self) -> list[str]:
+        """Record the current file state and run the initial parse and build.
+
+        Returns:
+            Stages that ran (see check)
+        """
+        self.tsv_state, self.generator_state, self.config_state = self._snapshots()
+        self.parsed_data, self.manifest = data_parser.load_previous_output(self.output_path)
+        return self._run(reparse=True, modules=[])
+
+    def check(self) -> list[str]:
+        """Poll once and run only the stages affected by what changed.
+
+        Returns:
+            Stages that ran: "parse", "reload:<module>" and "build"; empty if
+            nothing changed
+        """
+        tsv_state, generator_state, config_state = self._snapshots()
+        reparse = tsv_state != self.tsv_state
+        modules = reload_order(
+            Path(p).stem for p in changed_paths(self.generator_state, generator_state)
+        )
+        if not reparse and not modules and config_state == self.config_state:
+            return []
+        self.tsv_state, self.generator_state, self.config_state = (
+            tsv_state,
+            generator_state,
+            config_state,
+        )
+        return self._run(reparse=reparse, modules=modules)
+
+    def _run(self, reparse: bool, modules: list[str]) -> list[str]:
+        stages = []
+        try:
+            if reparse or self.parsed_data is None:
+                self._reparse()
+                stages.append("parse")
+            for module_name in modules:
+                if self._reload(module_name):
+                    stages.append(f"reload:{module_name}")
+            if self.broken_modules:
+                # Building now would cache old generator output under the new source hash
+                print(f"  Waiting for fixes in: {', '.join(sorted(self.broken_modules))}")
+                return stages
+            build_tracker.build_tracker(
+                use_cache=self.use_cache,
+                parsed_data=self.parsed_data,
+                data_digest=self.manifest["output_sha256"],
+            )
+            stages.append("build")
+        except GrindPulseError as e:
+            print(f"\nError: {e}", file=sys.stderr)
+        return stages
+
+    def _reparse(self) -> None:
+        result, manifest, changes = data_parser.parse_tsv_files_incremental(
+            self.raw_dir, self.parsed_data, self.manifest, workers=self.workers
+        )
+        self.manifest = data_parser.write_parsed_output(result, manifest, self.output_path)
+        self.parsed_data = result
+        print(
+            f"  Parsed {len(changes['parsed'])}, reused {len(changes['reused'])}, "
+            f"removed {len(changes['removed'])} file(s)"
+        )
+
+    def _reload(self, module_name: str) -> bool:
+        """Reload a generator or helper module and rebind its names in build_tracker.
+
+        build_tracker holds the functions it imported (generate_*,
+        encode_problem_data, BuildCache, ...), so every name still bound to
+        the module's previous object is pointed at the reloaded one. Modules
+        that were never imported are ignored.
+
+        Raises:
+            GeneratorError: If the edited module fails to import
+        """
+        module = sys.modules.get(module_name)
+        if module is None:
+            return False
+        previous = dict(vars(module))
+        try:
+            module = importlib.reload(module)
+        except Exception as e:
+            self.broken_modules.add(module_name)
+            raise GeneratorError(module_name, e) from e
+        self.broken_modules.discard(module_name)
+        for attr, value in vars(module).items():
+            if attr.startswith("__") or not hasattr(build_tracker, attr):
+                continue
+            bound = getattr(build_tracker, attr)
+            if attr.startswith("generate_") or (attr in previous and bound is previous[attr]):
+                setattr(build_tracker, attr, value)
+        return True
+
+
+def reload_order(modules) -> list[str]:
+    """Order changed modules so each helper reloads before the modules importing it.
+
+    Dependents of a changed helper are reloaded too, even if unchanged, since
+    they still hold the helper's previous functions.
+    """
+    modules = list(modules)
+    ordered = []
+    for name in sorted(modules, key=lambda name: name not in HELPER_DEPENDENTS):
+        for module_name in (name, *HELPER_DEPENDENTS.get(name, ())):
+            if module_name not in ordered:
+                ordered.append(module_name)
+    return ordered
+
+
+def watch(
+    base_dir: Path, interval: float = POLL_INTERVAL, workers: int = 1, use_cache: bool = True
+) -> None:
+    """Build once, then poll for changes until interrupted with Ctrl+C.
+
+    Args:
+        base_dir: Directory containing raw/ and the generator modules
+        interval: Seconds between polls
+        workers: Worker processes for re-parsing TSV files
+        use_cache: If False, every rebuild regenerates all components
+    """
+    watcher = TrackerWatcher(base_dir, workers=workers, use_cache=use_cache)
+    watcher.start()
+    print(
+        "\nWatching raw/*.tsv, *_generator.py, their helpers and firebase_config.json (Ctrl+C to stop)..."
+    )
+    try:
+        while True:
+            time.sleep(interval)
+            started = time.perf_counter()
+            if watcher.check():
+                print(f"  Rebuilt in {(time.perf_counter() - started) * 1000:.0f} ms")
+    except KeyboardInterrupt:
+        print("\nStopped watching")